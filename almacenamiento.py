@@ -0,0 +1,372 @@
+import math
+import os
+import threading
+from collections import OrderedDict
+# pandas se importa dentro de las funciones que lo usan: app.py dibuja la primera sección sin cargarlo
+from limpieza_texto import limpiar_texto
+from metricas import medido, medir
+
+# ----------------------------
+# Carpetas y archivos
+# ----------------------------
+DATA_FOLDER = "datos_guardados"
+
+DATA_FILE_PROF = os.path.join(DATA_FOLDER, "profesionales.csv")
+PACIENTES_FILE = os.path.join(DATA_FOLDER, "pacientes.csv")
+FEEDBACK_FILE = os.path.join(DATA_FOLDER, "feedback_app.csv")
+
+# ----------------------------
+# Esquemas de los CSV
+# ----------------------------
+PROFESIONALES_COLUMNAS = ["Nombre", "Profesión", "Cédula", "Fecha registro"]
+PACIENTES_COLUMNAS = ["Nombre", "Escolaridad", "Fecha", "Hora"]
+
+FEEDBACK_COLUMNAS = [
+    "nombre_profesional", "utilidad", "utilidad_opcion", "eficiencia",
+    "eficiencia_opcion", "intencion_uso", "satisfaccion_claridad",
+    "satisfaccion_claridad_opcion", "satisfaccion_diseño",
+    "satisfaccion_diseño_opcion", "modificar_secciones", "comentarios",
+    "fecha_envio", "cedula_profesional", "profesion_profesional"
+]
+
+FEEDBACK_OBLIGATORIOS = ['nombre_profesional', 'utilidad', 'eficiencia', 'intencion_uso',
+                         'satisfaccion_claridad', 'satisfaccion_diseño']
+FEEDBACK_NUMERICOS = ['utilidad', 'eficiencia', 'intencion_uso',
+                      'satisfaccion_claridad', 'satisfaccion_diseño']
+
+# Un solo lock por proceso: Streamlit atiende cada sesión en un hilo distinto
+# (reentrante: aplicar_cambios_csv verifica la versión y escribe bajo el mismo lock)
+_lock_escritura = threading.RLock()
+
+class ConflictoVersion(Exception):
+    """
+    La tabla cambió desde que se leyó: otro usuario guardó antes.
+    """
+
+# ----------------------------
+# Caché de lectura compartida entre sesiones
+# ----------------------------
+# Tope de memoria del caché (suma de memory_usage de los DataFrames guardados)
+CACHE_CSV_MAX_BYTES = int(os.environ.get("CACHE_CSV_MAX_MB", "128")) * 1024 * 1024
+
+_cache_csv = OrderedDict()  # ruta -> (version, DataFrame, bytes)
+_cache_bytes = 0
+_generaciones = {}  # ruta -> contador incrementado por nuestros propios escritores
+_lock_cache = threading.Lock()
+
+def marcar_modificado(archivo_path):
+    """
+    Incrementa la generación del archivo para invalidar el caché aunque mtime/tamaño no cambien
+    (resolución gruesa de mtime, edición de una celda con el mismo largo).
+    """
+    ruta = os.path.abspath(archivo_path)
+    with _lock_cache:
+        _generaciones[ruta] = _generaciones.get(ruta, 0) + 1
+
+def _version_archivo(ruta):
+    info = os.stat(ruta)
+    return (info.st_mtime_ns, info.st_size, _generaciones.get(ruta, 0))
+
+def version_archivo(archivo_path):
+    """
+    Sello de versión del archivo (None si no existe). Cambia con cada escritura.
+    """
+    ruta = os.path.abspath(archivo_path)
+    return _version_archivo(ruta) if os.path.exists(ruta) else None
+
+def _leer_csv_cacheado(archivo_path):
+    """
+    Devuelve el DataFrame del CSV, parseándolo solo si cambió (ruta + mtime + tamaño + generación).
+    El DataFrame guardado es compartido: se entrega una copia superficial que no debe modificarse in-place.
+    """
+    global _cache_bytes
+    import pandas as pd
+    ruta = os.path.abspath(archivo_path)
+    version = _version_archivo(ruta)
+    with _lock_cache:
+        entrada = _cache_csv.get(ruta)
+        if entrada is not None and entrada[0] == version:
+            _cache_csv.move_to_end(ruta)
+            return entrada[1].copy(deep=False)
+
+    with medir("parsear_csv", archivo=os.path.basename(ruta)) as tramo:
+        df = pd.read_csv(ruta, encoding='utf-8-sig')
+        tramo.anotar(filas=len(df), bytes=version[1])
+    tamaño = int(df.memory_usage(index=True, deep=True).sum())
+    with _lock_cache:
+        anterior = _cache_csv.pop(ruta, None)
+        if anterior is not None:
+            _cache_bytes -= anterior[2]
+        _cache_csv[ruta] = (version, df, tamaño)
+        _cache_bytes += tamaño
+        # Desalojo LRU; siempre se conserva al menos la entrada recién leída
+        while _cache_bytes > CACHE_CSV_MAX_BYTES and len(_cache_csv) > 1:
+            _, (_, _, liberados) = _cache_csv.popitem(last=False)
+            _cache_bytes -= liberados
+    return df.copy(deep=False)
+
+def limpiar_cache_csv():
+    """
+    Vacía el caché de lectura (útil en mediciones y tras restaurar archivos a mano).
+    """
+    global _cache_bytes
+    with _lock_cache:
+        _cache_csv.clear()
+        _cache_bytes = 0
+
+# ----------------------------
+# Funciones auxiliares para CSV
+# ----------------------------
+@medido("leer_csv")
+def leer_csv_seguro(archivo_path, columnas_default=None):
+    """
+    Lee un archivo CSV de forma segura, creándolo si no existe.
+    Las lecturas repetidas de un archivo sin cambios se sirven desde el caché del proceso.
+    """
+    import pandas as pd
+    try:
+        if os.path.exists(archivo_path):
+            df = _leer_csv_cacheado(archivo_path)
+            # Asegurar que tenga las columnas necesarias
+            if columnas_default:
+                for col in columnas_default:
+                    if col not in df.columns:
+                        df[col] = ""
+            return df
+        else:
+            # Si no existe, crear DataFrame vacío con columnas
+            if columnas_default:
+                df = pd.DataFrame(columns=columnas_default)
+                guardar_csv(df, archivo_path)
+                return df
+            else:
+                return pd.DataFrame()
+    except Exception as e:
+        # Import diferido: este módulo también lo usan scripts y server.py, fuera de Streamlit
+        import streamlit as st
+        st.error(f"Error al leer archivo {archivo_path}: {str(e)}")
+        if columnas_default:
+            return pd.DataFrame(columns=columnas_default)
+        else:
+            return pd.DataFrame()
+
+def guardar_csv(df, archivo_path):
+    """
+    Reescribe el CSV completo en UTF-8-BOM e invalida su entrada en el caché.
+    """
+    df.to_csv(archivo_path, index=False, encoding='utf-8-sig')
+    marcar_modificado(archivo_path)
+
+def crear_csv_vacio(archivo_path, columnas):
+    """
+    Crea el CSV con solo el encabezado (UTF-8-BOM) si no existe o está vacío. No usa pandas.
+    """
+    with _lock_escritura:
+        if not os.path.exists(archivo_path) or os.path.getsize(archivo_path) == 0:
+            _anexar_texto(archivo_path, list(columnas), "")
+
+# ----------------------------
+# Funciones de validación
+# ----------------------------
+def validar_y_limpiar_texto(texto, campo_nombre="campo"):
+    """
+    Valida y limpia texto eliminando TODOS los caracteres especiales que causan problemas
+    (ver limpieza_texto.py)
+    """
+    return limpiar_texto(texto)
+
+def normalizar_nombre(nombre):
+    """
+    Clave de búsqueda por nombre: sin espacios sobrantes y en minúsculas.
+    """
+    return " ".join(str(nombre).split()).lower()
+
+def validar_feedback(datos_feedback):
+    """
+    Valida obligatorios y rangos numéricos del feedback. Lanza ValueError con todos los errores.
+    """
+    errores = []
+    for campo in FEEDBACK_OBLIGATORIOS:
+        if campo not in datos_feedback or str(datos_feedback[campo]).strip() == "":
+            errores.append(f"Campo obligatorio vacío: {campo}")
+    for campo in FEEDBACK_NUMERICOS:
+        try:
+            v = float(datos_feedback.get(campo, 0))
+            if v < 0 or v > 10:
+                errores.append(f"{campo} debe estar entre 0 y 10")
+        except (TypeError, ValueError):
+            errores.append(f"{campo} debe ser número")
+    if errores:
+        raise ValueError("; ".join(errores))
+
+# ----------------------------
+# Escritura append-only
+# ----------------------------
+def _celda_csv(valor):
+    """
+    Convierte un valor en una celda segura para QUOTE_NONE (mismo criterio que la limpieza histórica).
+    """
+    if valor is None or (isinstance(valor, float) and math.isnan(valor)):
+        return ""
+    return validar_y_limpiar_texto(str(valor))
+
+def _leer_encabezado(archivo_path):
+    """
+    Devuelve las columnas de la primera línea del CSV (sin BOM) leyendo solo esa línea.
+    """
+    with open(archivo_path, 'rb') as f:
+        primera = f.readline()
+    return primera.decode('utf-8-sig').rstrip('\r\n').split(',')
+
+def _reescribir_con_columnas(archivo_path, fila, columnas):
+    """
+    Camino lento: el encabezado existente no contiene todas las columnas de la fila.
+    Reescribe el archivo completo (atómico) ampliando el encabezado.
+    """
+    import pandas as pd
+    df_existente = pd.read_csv(archivo_path, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+    df_final = pd.concat([df_existente, pd.DataFrame([fila], columns=columnas)], ignore_index=True)
+    df_final = df_final.fillna("")
+    tmp_path = f"{archivo_path}.tmp"
+    df_final.to_csv(tmp_path, index=False, encoding='utf-8-sig', quoting=3)
+    os.replace(tmp_path, archivo_path)
+    marcar_modificado(archivo_path)
+
+def anexar_fila_csv(archivo_path, fila, columnas):
+    """
+    Agrega una fila al final del CSV con una única escritura + fsync.
+    Si el archivo no existe o está vacío escribe primero el encabezado UTF-8-BOM.
+    Verifica el resultado por desplazamiento de bytes, sin releer el archivo.
+    """
+    with _lock_escritura:
+        encabezado = columnas
+        if os.path.exists(archivo_path) and os.path.getsize(archivo_path) > 0:
+            encabezado = _leer_encabezado(archivo_path)
+            if any(col not in encabezado for col in fila):
+                _reescribir_con_columnas(archivo_path, fila, encabezado + [c for c in fila if c not in encabezado])
+                return
+
+        linea = ",".join(_celda_csv(fila.get(col)) for col in encabezado) + "\n"
+        _anexar_texto(archivo_path, encabezado, linea)
+
+def _anexar_texto(archivo_path, encabezado, texto):
+    """
+    Agrega filas ya formateadas con una única escritura + fsync, verificada por tamaño.
+    Si el archivo no existe o está vacío escribe primero el encabezado UTF-8-BOM.
+    Se llama con _lock_escritura tomado.
+    """
+    termina_en_salto = True
+    if os.path.exists(archivo_path) and os.path.getsize(archivo_path) > 0:
+        with open(archivo_path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            termina_en_salto = f.read(1) == b"\n"
+    fd = os.open(archivo_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        tamaño_antes = os.fstat(fd).st_size
+        if tamaño_antes == 0:
+            datos = ("\ufeff" + ",".join(encabezado) + "\n" + texto).encode('utf-8')
+        else:
+            datos = texto.encode('utf-8')
+            # Si la última fila quedó sin salto de línea, no pegar la nueva a continuación
+            if not termina_en_salto:
+                datos = b"\n" + datos
+        with medir("anexar_csv", archivo=os.path.basename(archivo_path)) as tramo:
+            escritos = os.write(fd, datos)
+            os.fsync(fd)
+            tramo.anotar(filas=texto.count("\n"), bytes=escritos)
+        if escritos != len(datos) or os.fstat(fd).st_size < tamaño_antes + len(datos):
+            os.ftruncate(fd, tamaño_antes)
+            raise RuntimeError("Escritura incompleta; se revirtió el archivo")
+    finally:
+        os.close(fd)
+    marcar_modificado(archivo_path)
+
+# ----------------------------
+# Cambios por fila (tabla editable)
+# ----------------------------
+@medido("aplicar_cambios_csv")
+def aplicar_cambios_csv(archivo_path, columnas, version, agregados=(), editados=None, eliminados=()):
+    """
+    Aplica sobre el CSV solo las filas agregadas, editadas ({posición: {columna: valor}})
+    y eliminadas (posiciones), relativas a la versión `version` que se leyó.
+    Lanza ConflictoVersion si el archivo cambió desde entonces. Devuelve la nueva versión.
+
+    Si solo hay filas nuevas se anexan al final (una escritura, sin releer el archivo);
+    ediciones o bajas reescriben el archivo de forma atómica.
+    """
+    import pandas as pd
+    editados = editados or {}
+    with _lock_escritura:
+        if version_archivo(archivo_path) != version:
+            raise ConflictoVersion(f"{archivo_path} fue modificado por otro usuario")
+        if not agregados and not editados and not eliminados:
+            return version
+
+        existe = version is not None and os.path.getsize(archivo_path) > 0
+        encabezado = _leer_encabezado(archivo_path) if existe else list(columnas)
+        if not editados and not eliminados and all(col in encabezado for col in columnas):
+            texto = pd.DataFrame(list(agregados), columns=encabezado).to_csv(index=False, header=False)
+            _anexar_texto(archivo_path, encabezado, texto)
+            return version_archivo(archivo_path)
+
+        if existe:
+            df = pd.read_csv(archivo_path, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+        else:
+            df = pd.DataFrame(columns=list(columnas), dtype=str)
+        for col in columnas:
+            if col not in df.columns:
+                df[col] = ""
+        for posicion, cambios in editados.items():
+            for col, valor in cambios.items():
+                df.iat[posicion, df.columns.get_loc(col)] = "" if valor is None else str(valor)
+        df = df.drop(df.index[list(eliminados)])
+        if agregados:
+            df = pd.concat([df, pd.DataFrame(list(agregados), columns=df.columns)], ignore_index=True)
+        tmp_path = f"{archivo_path}.tmp"
+        df.fillna("").to_csv(tmp_path, index=False, encoding='utf-8-sig')
+        os.replace(tmp_path, archivo_path)
+        marcar_modificado(archivo_path)
+        return version_archivo(archivo_path)
+
+def preparar_feedback(datos_feedback):
+    """
+    Valida el feedback y limpia sus campos de texto libre (modifica el dict recibido).
+    """
+    validar_feedback(datos_feedback)
+
+    # Limpiar campos de texto
+    datos_feedback['modificar_secciones'] = validar_y_limpiar_texto(
+        datos_feedback['modificar_secciones'], 'modificar_secciones'
+    )
+    datos_feedback['comentarios'] = validar_y_limpiar_texto(
+        datos_feedback['comentarios'], 'comentarios'
+    )
+    datos_feedback['nombre_profesional'] = validar_y_limpiar_texto(
+        datos_feedback['nombre_profesional'], 'nombre_profesional'
+    )
+    return datos_feedback
+
+@medido("guardar_feedback")
+def guardar_feedback_seguro(datos_feedback, archivo_path):
+    """
+    Guarda feedback con validación robusta (limpieza mínima, escritura append-only, verificación)
+    """
+    preparar_feedback(datos_feedback)
+
+    # Solo se codifica y escribe la fila nueva: el costo no depende del tamaño del archivo
+    anexar_fila_csv(archivo_path, datos_feedback, FEEDBACK_COLUMNAS)
+    return True
+
+def registrar_estadisticas(datos_feedback, listar_feedback):
+    """
+    Suma la respuesta recién guardada a los agregados de la sección de análisis.
+    Lo llama el repositorio después de guardarla; listar_feedback() (DataFrame con todo lo
+    guardado) solo se usa si los agregados todavía no existen.
+    """
+    # Import diferido: estadisticas_feedback importa este módulo
+    from estadisticas_feedback import obtener_estadisticas
+    try:
+        obtener_estadisticas().registrar(datos_feedback, lambda: listar_feedback().to_dict("records"))
+    except OSError:
+        # El feedback ya quedó guardado; los agregados se pueden recalcular desde el panel
+        pass
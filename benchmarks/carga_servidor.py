@@ -0,0 +1,297 @@
+"""
+Prueba de carga de server.py: N clientes simulados (como tablets con la app Kivy) envían
+evaluaciones a POST /api/guardar_datos al mismo tiempo y cada tanto abren /resultados_web.
+
+Informa throughput, latencia p50/p95/p99 por endpoint, tasa de error y la integridad de
+los datos: cada evaluación lleva un nombre único de esta corrida y al terminar se exportan
+las guardadas (/api/evaluaciones/exportar) para detectar escrituras perdidas (confirmadas
+con 200 pero ausentes) y duplicadas. Con el servidor local también se lo reinicia y se
+vuelve a verificar, para detectar lo que se confirmó pero nunca llegó al disco.
+
+Por defecto levanta server.py (crear_app()) en 127.0.0.1 sobre una copia en una carpeta
+temporal (los datos reales no se tocan), con el backend de --almacenamiento. Con
+--trabajadores N arranca N procesos que comparten el puerto (SO_REUSEPORT, solo Linux),
+como los workers de gunicorn. Con --url se usa un servidor ya iniciado (sin reinicio).
+
+Termina con código 1 si se perdieron escrituras o la tasa de error supera --max-errores.
+
+Uso:
+    python benchmarks/carga_servidor.py [--clientes 20] [--envios 50] [--lecturas-cada 10]
+                                        [--almacenamiento json|diario|sqlite] [--trabajadores 4]
+    python benchmarks/carga_servidor.py --url http://127.0.0.1:5000
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+
+import requests
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# ----------------------------
+# Servidor local
+# ----------------------------
+def puerto_libre():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+# Un worker: socket propio con SO_REUSEPORT en el puerto compartido y servidor WSGI con hilos
+CODIGO_TRABAJADOR = """
+import socket, sys
+from werkzeug.serving import make_server
+import server
+puerto = int(sys.argv[1])
+s = socket.socket()
+s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+s.bind(("127.0.0.1", puerto))
+s.listen(128)
+make_server("127.0.0.1", puerto, server.crear_app(), threaded=True, fd=s.fileno()).serve_forever()
+"""
+
+
+class ServidorLocal:
+    """
+    server.py corriendo en uno o más subprocesos sobre una copia de la app en `carpeta`.
+    """
+
+    def __init__(self, carpeta, almacenamiento, trabajadores=1):
+        self.carpeta = carpeta
+        self.trabajadores = trabajadores
+        self.puerto = puerto_libre()
+        self.url = f"http://127.0.0.1:{self.puerto}"
+        self.entorno = dict(os.environ, ALMACENAMIENTO=almacenamiento, PYTHONUNBUFFERED="1")
+        self.procesos = []
+
+    def iniciar(self, espera=30):
+        if self.trabajadores == 1:
+            comando = ["-c", f"import server; server.crear_app().run(host='127.0.0.1', port={self.puerto}, threaded=True)"]
+        else:
+            comando = ["-c", CODIGO_TRABAJADOR, str(self.puerto)]
+        # El log de pedidos va a un archivo: un pipe sin leer terminaría bloqueando al servidor
+        self.log = os.path.join(self.carpeta, "server.log")
+        with open(self.log, "ab") as log:
+            self.procesos = [
+                subprocess.Popen([sys.executable, *comando], cwd=self.carpeta, env=self.entorno,
+                                 stdout=subprocess.DEVNULL, stderr=log)
+                for _ in range(self.trabajadores)
+            ]
+        limite = time.monotonic() + espera
+        while time.monotonic() < limite:
+            self._verificar_vivos()
+            try:
+                requests.get(f"{self.url}/api/evaluaciones?limite=1", timeout=1)
+                break
+            except (requests.ConnectionError, requests.Timeout):
+                time.sleep(0.1)
+        else:
+            self.detener()
+            raise RuntimeError("server.py no respondió a tiempo")
+        if self.trabajadores > 1:
+            # Margen para que terminen de arrancar los demás workers (o fallen, como 'diario')
+            time.sleep(1)
+            self._verificar_vivos()
+
+    def _verificar_vivos(self):
+        if any(proceso.poll() is not None for proceso in self.procesos):
+            self.detener()
+            with open(self.log, encoding="utf-8", errors="replace") as f:
+                raise RuntimeError(f"server.py terminó al iniciar:\n{f.read()}")
+
+    def detener(self):
+        # SIGTERM sin cierre ordenado: lo confirmado tiene que estar ya en disco
+        for proceso in self.procesos:
+            if proceso.poll() is None:
+                proceso.terminate()
+        for proceso in self.procesos:
+            proceso.wait(timeout=10)
+        self.procesos = []
+
+
+def copiar_servidor(destino):
+    for nombre in os.listdir(RAIZ):
+        if nombre.endswith(".py"):
+            shutil.copy(os.path.join(RAIZ, nombre), destino)
+
+
+# ----------------------------
+# Clientes simulados
+# ----------------------------
+class Resultados:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencias = defaultdict(list)   # endpoint -> segundos
+        self.estados = defaultdict(Counter)  # endpoint -> {código HTTP o excepción: cantidad}
+        self.confirmadas = []                # nombres con respuesta 200
+
+    def anotar(self, endpoint, segundos, estado, nombre=None):
+        with self._lock:
+            self.latencias[endpoint].append(segundos)
+            self.estados[endpoint][estado] += 1
+            if nombre is not None and estado == 200:
+                self.confirmadas.append(nombre)
+
+
+def evaluacion_simulada(etiqueta, cliente, numero, azar):
+    return {
+        "nombre": f"{etiqueta} tablet {cliente:03d} evaluación {numero:05d}",
+        "puntajes": {
+            "coordinacion": azar.randint(0, 10),
+            "equilibrio": azar.randint(0, 10),
+            "atencion": azar.randint(0, 10),
+        },
+    }
+
+
+def cliente(url, numero, args, etiqueta, resultados, largada):
+    azar = random.Random(numero)
+    # Una sesión por tablet (conexión keep-alive), como cola_envios.ColaEnvios
+    sesion = requests.Session()
+    largada.wait()
+    for i in range(args.envios):
+        evaluacion = evaluacion_simulada(etiqueta, numero, i, azar)
+        inicio = time.perf_counter()
+        try:
+            r = sesion.post(f"{url}/api/guardar_datos", json=evaluacion, timeout=args.timeout)
+            estado = r.status_code
+        except requests.RequestException as e:
+            estado = type(e).__name__
+        resultados.anotar("POST /api/guardar_datos", time.perf_counter() - inicio, estado, evaluacion["nombre"])
+
+        if args.lecturas_cada and (i + 1) % args.lecturas_cada == 0:
+            inicio = time.perf_counter()
+            try:
+                estado = sesion.get(f"{url}/resultados_web", timeout=args.timeout).status_code
+            except requests.RequestException as e:
+                estado = type(e).__name__
+            resultados.anotar("GET /resultados_web", time.perf_counter() - inicio, estado)
+
+        if args.pausa_ms:
+            time.sleep(azar.uniform(0, 2 * args.pausa_ms) / 1000)
+    sesion.close()
+
+
+def generar_carga(url, args, etiqueta):
+    resultados = Resultados()
+    largada = threading.Event()
+    hilos = [
+        threading.Thread(target=cliente, args=(url, n, args, etiqueta, resultados, largada), daemon=True)
+        for n in range(args.clientes)
+    ]
+    for hilo in hilos:
+        hilo.start()
+    inicio = time.perf_counter()
+    largada.set()
+    for hilo in hilos:
+        hilo.join()
+    return resultados, time.perf_counter() - inicio
+
+
+# ----------------------------
+# Integridad
+# ----------------------------
+def guardadas(url, etiqueta, timeout):
+    r = requests.get(f"{url}/api/evaluaciones/exportar", params={"nombre": etiqueta}, timeout=timeout)
+    r.raise_for_status()
+    return Counter(json.loads(linea)["nombre"] for linea in r.text.splitlines() if linea.strip())
+
+
+def verificar(confirmadas, en_servidor):
+    confirmadas = set(confirmadas)
+    return {
+        "confirmadas": len(confirmadas),
+        "en_servidor": sum(en_servidor.values()),
+        "perdidas": len(confirmadas - set(en_servidor)),
+        "duplicadas": sum(n - 1 for n in en_servidor.values() if n > 1),
+        # Guardadas sin 200 (por ejemplo, timeout del cliente después de escribir)
+        "sin_confirmar": len(set(en_servidor) - confirmadas),
+    }
+
+
+# ----------------------------
+# Informe
+# ----------------------------
+def percentil(ordenados, q):
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * q))]
+
+
+def informe(resultados, duracion, integridad):
+    total = sum(len(v) for v in resultados.latencias.values())
+    errores = sum(n for estados in resultados.estados.values() for estado, n in estados.items() if estado != 200)
+    print(f"Duración:    {duracion:8.2f} s")
+    print(f"Pedidos:     {total:8d}  ({total / duracion:.1f}/s)")
+    print(f"Guardadas:   {len(resultados.confirmadas):8d}  ({len(resultados.confirmadas) / duracion:.1f}/s)")
+    print(f"Errores:     {errores:8d}  ({errores / max(total, 1):.2%})")
+    print()
+    print(f"{'endpoint':26s} {'n':>6s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s} {'máx ms':>9s}  estados")
+    for endpoint, latencias in resultados.latencias.items():
+        ordenadas = sorted(t * 1000 for t in latencias)
+        estados = ", ".join(f"{k}: {v}" for k, v in sorted(resultados.estados[endpoint].items(), key=str))
+        print(f"{endpoint:26s} {len(ordenadas):6d} {statistics.median(ordenadas):9.1f} "
+              f"{percentil(ordenadas, 0.95):9.1f} {percentil(ordenadas, 0.99):9.1f} {ordenadas[-1]:9.1f}  {estados}")
+    print()
+    for momento, datos in integridad:
+        print(f"Integridad ({momento}): " + ", ".join(f"{k} {v}" for k, v in datos.items()))
+    return errores / max(total, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clientes", type=int, default=20, help="Tablets simuladas en paralelo")
+    parser.add_argument("--envios", type=int, default=50, help="Evaluaciones que envía cada tablet")
+    parser.add_argument("--lecturas-cada", type=int, default=10,
+                        help="Cada cuántos envíos una tablet abre /resultados_web (0 = nunca)")
+    parser.add_argument("--pausa-ms", type=float, default=0, help="Pausa media entre envíos de una tablet")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--almacenamiento", default="json", choices=["json", "diario", "sqlite"],
+                        help="Backend de server.py (variable ALMACENAMIENTO) para el servidor local")
+    parser.add_argument("--trabajadores", type=int, default=1,
+                        help="Procesos de server.py compartiendo el puerto (como gunicorn -w)")
+    parser.add_argument("--url", help="Servidor ya iniciado; si no se indica, se levanta uno local")
+    parser.add_argument("--max-errores", type=float, default=0.0, help="Tasa de error tolerada (0.01 = 1%%)")
+    args = parser.parse_args()
+
+    etiqueta = f"carga-{uuid.uuid4().hex[:8]}"
+    integridad = []
+    with tempfile.TemporaryDirectory() as tmp:
+        servidor = None
+        url = args.url
+        if url is None:
+            copiar_servidor(tmp)
+            servidor = ServidorLocal(tmp, args.almacenamiento, args.trabajadores)
+            servidor.iniciar()
+            url = servidor.url
+        try:
+            print(f"{args.clientes} clientes x {args.envios} envíos contra {url}"
+                  + (f" (ALMACENAMIENTO={args.almacenamiento}, {args.trabajadores} proceso(s))" if servidor else ""))
+            resultados, duracion = generar_carga(url, args, etiqueta)
+            integridad.append(("al terminar", verificar(resultados.confirmadas, guardadas(url, etiqueta, args.timeout))))
+            if servidor is not None:
+                servidor.detener()
+                servidor.iniciar()
+                integridad.append(("tras reiniciar", verificar(resultados.confirmadas, guardadas(url, etiqueta, args.timeout))))
+        finally:
+            if servidor is not None:
+                servidor.detener()
+
+    tasa_error = informe(resultados, duracion, integridad)
+    if any(datos["perdidas"] for _, datos in integridad) or tasa_error > args.max_errores:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
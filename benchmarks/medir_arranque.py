@@ -0,0 +1,139 @@
+"""
+Mide el arranque en frío de app.py: cuánto tarda el primer run (lo que el usuario espera
+hasta ver la primera sección dibujada) y qué módulos se importan en ese momento.
+
+Cada repetición corre en un proceso nuevo sobre una copia limpia de la app en una carpeta
+temporal, sin datos_guardados ni __pycache__ de la app (como un contenedor recién creado).
+Streamlit ya está importado cuando empieza la medición: el primer run cuenta solo lo que
+agrega la app (sus imports, la inicialización de archivos y la primera sección).
+
+Además del tiempo, muestra el desglose de `python -X importtime` de los módulos que carga
+el primer run, agrupados por paquete.
+
+Uso:
+    python benchmarks/medir_arranque.py [--repeticiones 10] [--top 12]
+    python benchmarks/medir_arranque.py --ref HEAD~1      # una versión anterior (git)
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# ----------------------------
+# Proceso de medición (uno por repetición)
+# ----------------------------
+def trabajador(app_dir):
+    from streamlit.testing.v1 import AppTest
+
+    os.chdir(app_dir)
+    sys.path.insert(0, app_dir)
+    previos = sorted(sys.modules)
+    at = AppTest.from_file(os.path.join(app_dir, "app.py"), default_timeout=120)
+    inicio = time.perf_counter()
+    at.run()
+    primer_run = time.perf_counter() - inicio
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    nuevos = set(sys.modules).difference(previos)
+    print(json.dumps({
+        "primer_run_s": primer_run,
+        "modulos": len(nuevos),
+        "pandas": "pandas" in nuevos,
+        "previos": previos,
+    }))
+
+
+# ----------------------------
+# Orquestación
+# ----------------------------
+def copiar_app(origen, destino, ref=None):
+    if ref is None:
+        shutil.copytree(origen, destino, dirs_exist_ok=True,
+                        ignore=shutil.ignore_patterns(".git", "datos_guardados", "__pycache__"))
+    else:
+        archivo = subprocess.run(["git", "-C", origen, "archive", ref], check=True, capture_output=True).stdout
+        subprocess.run(["tar", "-x", "-C", destino], input=archivo, check=True)
+        shutil.rmtree(os.path.join(destino, "datos_guardados"), ignore_errors=True)
+    secrets = os.path.join(destino, ".streamlit", "secrets.toml")
+    ejemplo = f"{secrets}.example"
+    if not os.path.exists(secrets) and os.path.exists(ejemplo):
+        shutil.copy(ejemplo, secrets)
+
+
+def correr(args, importtime=False):
+    with tempfile.TemporaryDirectory() as tmp:
+        copiar_app(args.app_dir, tmp, args.ref)
+        comando = [sys.executable]
+        if importtime:
+            comando += ["-X", "importtime"]
+        comando += [os.path.abspath(__file__), "--trabajador", tmp]
+        inicio = time.perf_counter()
+        proceso = subprocess.run(comando, capture_output=True, text=True)
+        total = time.perf_counter() - inicio
+    if proceso.returncode != 0:
+        raise RuntimeError(proceso.stderr.strip().splitlines()[-1])
+    resultado = json.loads(proceso.stdout.strip().splitlines()[-1])
+    resultado["proceso_s"] = total
+    resultado["stderr"] = proceso.stderr
+    return resultado
+
+
+def desglose_importtime(stderr, previos, top):
+    """
+    Suma el tiempo propio (self) de -X importtime por paquete, solo de los módulos que no
+    estaban cargados antes del primer run.
+    """
+    previos = set(previos)
+    por_paquete = defaultdict(int)
+    for linea in stderr.splitlines():
+        if not linea.startswith("import time:") or "self [us]" in linea:
+            continue
+        propio, _, nombre = linea[len("import time:"):].split("|")
+        nombre = nombre.strip()
+        if nombre not in previos:
+            por_paquete[nombre.split(".")[0]] += int(propio)
+    return sorted(por_paquete.items(), key=lambda kv: -kv[1])[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--app-dir", default=RAIZ, help="Carpeta que contiene app.py (por defecto, este repo)")
+    parser.add_argument("--ref", help="Medir esta versión de git de --app-dir en lugar de la carpeta actual")
+    parser.add_argument("--repeticiones", type=int, default=10)
+    parser.add_argument("--top", type=int, default=12, help="Paquetes a mostrar en el desglose de imports")
+    parser.add_argument("--trabajador", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.trabajador:
+        trabajador(args.trabajador)
+        return
+
+    args.app_dir = os.path.abspath(args.app_dir)
+    resultados = [correr(args) for _ in range(args.repeticiones)]
+    primer_run = sorted(r["primer_run_s"] * 1000 for r in resultados)
+    proceso = sorted(r["proceso_s"] * 1000 for r in resultados)
+
+    print(f"Versión: {args.ref or args.app_dir}  ({args.repeticiones} procesos nuevos)")
+    print(f"Primer run (mediana):      {statistics.median(primer_run):8.1f} ms")
+    print(f"Primer run (mín / máx):    {primer_run[0]:8.1f} / {primer_run[-1]:.1f} ms")
+    print(f"Proceso completo (mediana):{statistics.median(proceso):8.1f} ms")
+    print(f"Módulos importados por la app: {resultados[0]['modulos']}"
+          f" (pandas: {'sí' if resultados[0]['pandas'] else 'no'})")
+
+    perfil = correr(args, importtime=True)
+    print("\nImports del primer run por paquete (tiempo propio, -X importtime):")
+    for paquete, microsegundos in desglose_importtime(perfil["stderr"], perfil["previos"], args.top):
+        print(f"  {paquete:30s} {microsegundos / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
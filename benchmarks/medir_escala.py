@@ -0,0 +1,286 @@
+"""
+Mide cómo escalan los caminos de almacenamiento más usados con la cantidad de datos
+guardados: latencia por operación (mediana y p95), operaciones por segundo y memoria pico.
+
+Operaciones:
+- guardar_feedback:    guardar_feedback_seguro (una respuesta del cuestionario)
+- leer_csv_frio:       leer_csv_seguro de feedback_app.csv sin caché
+- leer_csv_cache:      leer_csv_seguro con el caché ya cargado
+- registrar_prof:      alta de un profesional (RegistroProfesionales.registrar)
+- api_guardar_datos:   POST /api/guardar_datos de server.py (backend de ALMACENAMIENTO)
+
+Cada operación y tamaño corre en un proceso aparte sobre datos sintéticos en una carpeta
+temporal (los archivos reales no se tocan), así los cachés y la memoria no se mezclan.
+La memoria pico es la de tracemalloc durante las operaciones (una pasada aparte, para no
+distorsionar los tiempos) y el RSS máximo del proceso.
+
+Los resultados se comparan con la línea base guardada (benchmarks/linea_base_escala.json):
+una mediana o memoria pico que supere a la base en más de --tolerancia se marca como
+regresión y el script termina con código 1. La base guarda el commit y el entorno en que se
+tomó; si el código (los .py fuera de benchmarks/) o el entorno cambiaron desde entonces se avisa,
+porque las diferencias pueden venir de ahí y no de una regresión.
+
+Uso:
+    python benchmarks/medir_escala.py [--tamanos 1000 10000 100000 1000000]
+                                      [--operaciones guardar_feedback leer_csv_frio ...]
+                                      [--guardar-linea-base] [--tolerancia 0.5]
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LINEA_BASE = os.path.join(RAIZ, "benchmarks", "linea_base_escala.json")
+OPERACIONES = ["guardar_feedback", "leer_csv_frio", "leer_csv_cache", "registrar_prof", "api_guardar_datos"]
+TAMANOS = [1000, 10000, 100000, 1000000]
+
+FILA_FEEDBACK = {
+    "nombre_profesional": "Profesional de prueba", "utilidad": 5, "utilidad_opcion": "Mucho",
+    "eficiencia": 3, "eficiencia_opcion": "Parcialmente", "intencion_uso": 4,
+    "satisfaccion_claridad": 5, "satisfaccion_claridad_opcion": "Sí", "satisfaccion_diseño": 4,
+    "satisfaccion_diseño_opcion": "Bueno", "modificar_secciones": "ninguna",
+    "comentarios": "muy útil para el registro de la evaluación", "fecha_envio": "2025-01-01 10:00:00",
+    "cedula_profesional": "12345678", "profesion_profesional": "Psicomotricista",
+}
+
+
+# ----------------------------
+# Datos sintéticos
+# ----------------------------
+def sembrar(operacion, carpeta, filas):
+    sys.path.insert(0, RAIZ)
+    from almacenamiento import FEEDBACK_COLUMNAS, PROFESIONALES_COLUMNAS
+
+    datos = os.path.join(carpeta, "datos_guardados")
+    os.makedirs(datos, exist_ok=True)
+    if operacion in ("guardar_feedback", "leer_csv_frio", "leer_csv_cache"):
+        linea = ",".join(str(FILA_FEEDBACK[col]) for col in FEEDBACK_COLUMNAS) + "\n"
+        with open(os.path.join(datos, "feedback_app.csv"), "w", encoding="utf-8-sig", newline="") as f:
+            f.write(",".join(FEEDBACK_COLUMNAS) + "\n")
+            for inicio in range(0, filas, 10000):
+                f.write(linea * min(10000, filas - inicio))
+    elif operacion == "registrar_prof":
+        with open(os.path.join(datos, "profesionales.csv"), "w", encoding="utf-8-sig", newline="") as f:
+            f.write(",".join(PROFESIONALES_COLUMNAS) + "\n")
+            for i in range(filas):
+                f.write(f"Profesional {i},Psicomotricista,{10000000 + i},2025-01-01 10:00:00\n")
+    elif operacion == "api_guardar_datos":
+        # Copia del servidor: evaluaciones.json vive junto a server.py
+        for nombre in os.listdir(RAIZ):
+            if nombre.endswith(".py"):
+                shutil.copy(os.path.join(RAIZ, nombre), carpeta)
+        evaluacion = {"nombre": "Paciente", "puntajes": {"coordinacion": 3, "equilibrio": 4, "atencion": 5}}
+        backend = os.environ.get("ALMACENAMIENTO", "json")
+        if backend == "sqlite":
+            os.environ["SQLITE_PATH"] = os.path.join(datos, "psicomotriz.db")
+            from repositorio_sqlite import RepositorioSQLite
+            repo = RepositorioSQLite(os.environ["SQLITE_PATH"])
+            for inicio in range(0, filas, 10000):
+                repo.agregar_evaluaciones([evaluacion] * min(10000, filas - inicio))
+        else:
+            with open(os.path.join(carpeta, "evaluaciones.json"), "w", encoding="utf-8") as f:
+                json.dump([evaluacion] * filas, f, ensure_ascii=False, indent=4)
+
+
+# ----------------------------
+# Operaciones (corren en el proceso trabajador)
+# ----------------------------
+def preparar_operacion(operacion, carpeta):
+    """
+    Devuelve (antes, operación): antes() se llama antes de cada repetición, fuera del tiempo.
+    """
+    os.chdir(carpeta)
+    if operacion == "api_guardar_datos":
+        sys.path.insert(0, carpeta)
+        import server
+        cliente = server.app.test_client()
+        cuerpo = {"nombre": "Paciente nuevo", "puntajes": {"coordinacion": 3, "equilibrio": 4, "atencion": 5}}
+
+        def guardar():
+            respuesta = cliente.post("/api/guardar_datos", json=cuerpo)
+            assert respuesta.status_code == 200, respuesta.get_data(as_text=True)
+        return None, guardar
+
+    sys.path.insert(0, RAIZ)
+    import almacenamiento
+    ruta_feedback = os.path.join("datos_guardados", "feedback_app.csv")
+    if operacion == "guardar_feedback":
+        return None, lambda: almacenamiento.guardar_feedback_seguro(dict(FILA_FEEDBACK), ruta_feedback)
+    if operacion == "leer_csv_frio":
+        return almacenamiento.limpiar_cache_csv, lambda: almacenamiento.leer_csv_seguro(ruta_feedback)
+    if operacion == "leer_csv_cache":
+        almacenamiento.leer_csv_seguro(ruta_feedback)
+        return None, lambda: almacenamiento.leer_csv_seguro(ruta_feedback)
+    if operacion == "registrar_prof":
+        from registro_profesionales import RegistroProfesionales
+        registro = RegistroProfesionales(os.path.join("datos_guardados", "profesionales.csv"))
+        # El índice se arma una vez por proceso; acá se mide el alta en régimen
+        registro.buscar_por_nombre("")
+        cedulas = iter(range(90000000, 99999999))
+        return None, lambda: registro.registrar("Profesional nuevo", "Psicomotricista", next(cedulas))
+    raise ValueError(f"Operación desconocida: {operacion}")
+
+def trabajador(operacion, carpeta, repeticiones, max_segundos):
+    antes, funcion = preparar_operacion(operacion, carpeta)
+    tiempos = []
+    limite = time.perf_counter() + max_segundos
+    while len(tiempos) < repeticiones and (len(tiempos) < 3 or time.perf_counter() < limite):
+        if antes:
+            antes()
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+
+    # Pasada aparte para la memoria: tracemalloc hace más lentas las asignaciones
+    if antes:
+        antes()
+    tracemalloc.start()
+    funcion()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tiempos.sort()
+    return {
+        "repeticiones": len(tiempos),
+        "mediana_ms": statistics.median(tiempos) * 1000,
+        "p95_ms": tiempos[min(len(tiempos) - 1, int(len(tiempos) * 0.95))] * 1000,
+        "ops_por_s": len(tiempos) / sum(tiempos),
+        "pico_mb": pico / 1e6,
+        "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+# ----------------------------
+# Orquestación y línea base
+# ----------------------------
+def medir(operacion, filas, args):
+    with tempfile.TemporaryDirectory() as carpeta:
+        inicio = time.perf_counter()
+        sembrar(operacion, carpeta, filas)
+        sembrado = time.perf_counter() - inicio
+        salida = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--trabajador", operacion, carpeta,
+             "--repeticiones", str(args.repeticiones), "--max-segundos", str(args.max_segundos)],
+            capture_output=True, text=True, check=False
+        )
+        if salida.returncode != 0:
+            # Que una operación no aguante un tamaño también es un resultado
+            errores = salida.stderr.strip().splitlines()
+            return {"error": errores[-1] if errores else f"código {salida.returncode}", "sembrado_s": sembrado}
+        resultado = json.loads(salida.stdout.strip().splitlines()[-1])
+        resultado["sembrado_s"] = sembrado
+        return resultado
+
+def comparar(clave, resultado, base, tolerancia):
+    """
+    Mensajes de regresión frente a la línea base (lista vacía si no hay).
+    """
+    if not base or clave not in base["resultados"]:
+        return []
+    anterior = base["resultados"][clave]
+    if "error" in resultado:
+        return [] if "error" in anterior else [f"{clave}: {resultado['error']}"]
+    if "error" in anterior:
+        return []
+    regresiones = []
+    for metrica in ("mediana_ms", "pico_mb"):
+        # Diferencias de menos de 1 ms / 1 MB son ruido
+        piso = 1.0
+        if resultado[metrica] > max(anterior[metrica] * (1 + tolerancia), anterior[metrica] + piso):
+            regresiones.append(f"{clave} {metrica}: {resultado[metrica]:.1f} (base {anterior[metrica]:.1f})")
+    return regresiones
+
+def entorno():
+    return {
+        "python": platform.python_version(),
+        "sistema": platform.platform(),
+        "cpus": os.cpu_count(),
+        "almacenamiento_servidor": os.environ.get("ALMACENAMIENTO", "json"),
+    }
+
+def commit_actual():
+    salida = subprocess.run(["git", "-C", RAIZ, "rev-parse", "HEAD"], capture_output=True, text=True)
+    return salida.stdout.strip() if salida.returncode == 0 else None
+
+def codigo_cambio(commit):
+    """
+    True si el código medido (los .py fuera de benchmarks/) difiere del de `commit`, incluidos los
+    cambios sin commitear; también si el commit no existe (historia reescrita) o no hay git.
+    """
+    if not commit:
+        return True
+    salida = subprocess.run(
+        ["git", "-C", RAIZ, "diff", "--quiet", commit, "--", ":(glob)**/*.py", ":(exclude)benchmarks"],
+        capture_output=True,
+    )
+    return salida.returncode != 0
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", default=TAMANOS)
+    parser.add_argument("--operaciones", nargs="+", choices=OPERACIONES, default=OPERACIONES)
+    parser.add_argument("--repeticiones", type=int, default=20)
+    parser.add_argument("--max-segundos", type=float, default=20.0,
+                        help="Tope de tiempo por operación y tamaño (mínimo 3 repeticiones)")
+    parser.add_argument("--linea-base", default=LINEA_BASE)
+    parser.add_argument("--guardar-linea-base", action="store_true")
+    parser.add_argument("--tolerancia", type=float, default=0.5,
+                        help="Empeoramiento admitido respecto de la base (0.5 = 50%%)")
+    parser.add_argument("--trabajador", nargs=2, metavar=("OPERACION", "CARPETA"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.trabajador:
+        operacion, carpeta = args.trabajador
+        print(json.dumps(trabajador(operacion, carpeta, args.repeticiones, args.max_segundos)))
+        return
+
+    base = None
+    if os.path.exists(args.linea_base) and not args.guardar_linea_base:
+        with open(args.linea_base, "r", encoding="utf-8") as f:
+            base = json.load(f)
+        if base.get("entorno") != entorno():
+            print("Aviso: la línea base es de otro entorno; las comparaciones son orientativas.")
+        if codigo_cambio(base.get("commit")):
+            print(f"Aviso: el código cambió desde la línea base (commit {base.get('commit') or 'desconocido'}); "
+                  "si los cambios son esperados, regrabala con --guardar-linea-base.")
+
+    print(f"{'operación':18s} {'filas':>9s} {'mediana':>10s} {'p95':>10s} {'ops/s':>9s} "
+          f"{'pico MB':>8s} {'RSS MB':>8s} {'n':>4s}")
+    resultados, regresiones = {}, []
+    for operacion in args.operaciones:
+        for filas in args.tamanos:
+            r = medir(operacion, filas, args)
+            clave = f"{operacion}/{filas}"
+            resultados[clave] = r
+            nuevas = comparar(clave, r, base, args.tolerancia)
+            regresiones += nuevas
+            marca = "  REGRESIÓN" if nuevas else ""
+            if "error" in r:
+                print(f"{operacion:18s} {filas:9d} FALLÓ: {r['error']}{marca}", flush=True)
+                continue
+            print(f"{operacion:18s} {filas:9d} {r['mediana_ms']:8.2f}ms {r['p95_ms']:8.2f}ms "
+                  f"{r['ops_por_s']:9.1f} {r['pico_mb']:8.1f} {r['rss_mb']:8.1f} {r['repeticiones']:4d}"
+                  f"{marca}", flush=True)
+
+    if args.guardar_linea_base:
+        with open(args.linea_base, "w", encoding="utf-8") as f:
+            json.dump({"commit": commit_actual(), "entorno": entorno(), "resultados": resultados}, f, ensure_ascii=False, indent=2)
+        print(f"Línea base guardada en {args.linea_base}")
+    if regresiones:
+        print("\nRegresiones respecto de la línea base:")
+        for mensaje in regresiones:
+            print(f"- {mensaje}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Compara la limpieza de texto anterior (nueve str.replace + re.sub por valor) con
+limpieza_texto.py, valor por valor y vectorizada, sobre DataFrames sintéticos.
+
+Uso:
+    python benchmarks/medir_limpieza.py --filas 100000 --repeticiones 5
+"""
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+import pandas as pd
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+from limpieza_texto import limpiar_dataframe, limpiar_texto  # noqa: E402
+
+COLUMNAS_TEXTO = ["nombre_profesional", "modificar_secciones", "comentarios"]
+FRAGMENTOS = [
+    "muy útil", "la sección de tests", "faltan campos, por ejemplo", "\"claro\"", "diseño;colores",
+    "línea\nnueva", "tab\tseparado", "a|b", "c\\d", "  ", "ñandú", "evaluación psicomotriz",
+]
+
+
+def limpiar_anterior(texto):
+    """
+    Cadena de reemplazos previa a limpieza_texto.py, para comparar.
+    """
+    if not texto or pd.isna(texto):
+        return ""
+    texto = str(texto).strip()
+    texto = texto.replace(',', ' ')
+    texto = texto.replace('"', ' ')
+    texto = texto.replace("'", ' ')
+    texto = texto.replace(';', ' ')
+    texto = texto.replace('\n', ' ')
+    texto = texto.replace('\r', ' ')
+    texto = texto.replace('\t', ' ')
+    texto = texto.replace('|', ' ')
+    texto = texto.replace('\\', ' ')
+    texto = re.sub(r'\s+', ' ', texto).strip()
+    if len(texto) > 2000:
+        texto = texto[:1997] + "..."
+    return texto
+
+
+def generar(filas, semilla=0):
+    azar = random.Random(semilla)
+    return pd.DataFrame({
+        col: [" ".join(azar.choices(FRAGMENTOS, k=azar.randint(1, 15))) for _ in range(filas)]
+        for col in COLUMNAS_TEXTO
+    })
+
+
+def cronometrar(funcion, df, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion(df)
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos), resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=100000)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    df = generar(args.filas)
+    variantes = {
+        "anterior (9 replace + re.sub)": lambda d: d.apply(lambda col: col.map(limpiar_anterior)),
+        "limpiar_texto por valor": lambda d: d.apply(lambda col: col.map(limpiar_texto)),
+        "limpiar_dataframe (vectorizada)": lambda d: limpiar_dataframe(d),
+    }
+    celdas = args.filas * len(COLUMNAS_TEXTO)
+    print(f"{args.filas} filas x {len(COLUMNAS_TEXTO)} columnas de texto, mediana de {args.repeticiones} corridas")
+    referencia = None
+    for nombre, funcion in variantes.items():
+        segundos, resultado = cronometrar(funcion, df, args.repeticiones)
+        resultado = resultado.astype(object)
+        if referencia is None:
+            referencia, base = resultado, segundos
+        elif not resultado.equals(referencia):
+            raise SystemExit(f"{nombre}: el resultado no coincide con la limpieza anterior")
+        print(f"{nombre:34s} {segundos * 1000:8.1f} ms  {celdas / segundos / 1e6:5.2f} M celdas/s  x{base / segundos:.2f}")
+
+
+if __name__ == "__main__":
+    main()
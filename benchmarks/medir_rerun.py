@@ -0,0 +1,103 @@
+"""
+Mide el tiempo de pared de cada rerun de app.py mientras se escribe en
+"Registro de datos del profesional", con datos sintéticos.
+
+Uso:
+    python benchmarks/medir_rerun.py --pacientes 2000 --feedback 20000 --reruns 20
+
+La app se copia a un directorio temporal: los CSV reales no se tocan.
+"""
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+from almacenamiento import FEEDBACK_COLUMNAS  # noqa: E402
+
+
+def sembrar_datos(carpeta, n_pacientes, n_feedback, n_profesionales):
+    datos = os.path.join(carpeta, "datos_guardados")
+    os.makedirs(datos, exist_ok=True)
+    pd.DataFrame({
+        "Nombre": [f"Paciente {i}" for i in range(n_pacientes)],
+        "Escolaridad": ["Primaria"] * n_pacientes,
+        "Fecha": ["2025-01-01"] * n_pacientes,
+        "Hora": ["10:00"] * n_pacientes,
+    }).to_csv(os.path.join(datos, "pacientes.csv"), index=False, encoding="utf-8-sig")
+    pd.DataFrame({
+        "Nombre": [f"Profesional {i}" for i in range(n_profesionales)],
+        "Profesión": ["Psicomotricista"] * n_profesionales,
+        "Cédula": [f"{10000000 + i}" for i in range(n_profesionales)],
+        "Fecha registro": ["2025-01-01 10:00:00"] * n_profesionales,
+    }).to_csv(os.path.join(datos, "profesionales.csv"), index=False, encoding="utf-8-sig")
+    fila = {col: "texto de ejemplo" for col in FEEDBACK_COLUMNAS}
+    fila.update(utilidad=5, eficiencia=3, intencion_uso=7, satisfaccion_claridad=5, satisfaccion_diseño=4)
+    pd.DataFrame([fila] * n_feedback, columns=FEEDBACK_COLUMNAS).to_csv(
+        os.path.join(datos, "feedback_app.csv"), index=False, encoding="utf-8-sig")
+
+
+def medir(app_dir, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        shutil.copytree(app_dir, tmp, dirs_exist_ok=True,
+                        ignore=shutil.ignore_patterns(".git", "datos_guardados", "__pycache__"))
+        sembrar_datos(tmp, args.pacientes, args.feedback, args.profesionales)
+        secrets = os.path.join(tmp, ".streamlit", "secrets.toml")
+        if not os.path.exists(secrets):
+            shutil.copy(os.path.join(tmp, ".streamlit", "secrets.toml.example"), secrets)
+
+        anterior = os.getcwd()
+        os.chdir(tmp)
+        sys.path.insert(0, tmp)
+        try:
+            at = AppTest.from_file(os.path.join(tmp, "app.py"), default_timeout=120)
+            # Sesión de administrador: la pestaña de descargas también participa del rerun
+            at.session_state["logged_in"] = True
+            inicio = time.perf_counter()
+            at.run()
+            primera = time.perf_counter() - inicio
+            for radio in at.radio:
+                if radio.key == "seccion_activa":
+                    radio.set_value("Registro de datos del profesional")
+                    at.run()
+            tiempos = []
+            for i in range(args.reruns):
+                at.text_input(key="prof_nombre").input(f"Profesional nuevo {i}")
+                inicio = time.perf_counter()
+                at.run()
+                tiempos.append(time.perf_counter() - inicio)
+            if at.exception:
+                raise RuntimeError(at.exception[0].message)
+        finally:
+            sys.path.remove(tmp)
+            os.chdir(anterior)
+    return primera, tiempos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--app-dir", default=RAIZ, help="Carpeta que contiene app.py (por defecto, este repo)")
+    parser.add_argument("--pacientes", type=int, default=2000)
+    parser.add_argument("--feedback", type=int, default=20000)
+    parser.add_argument("--profesionales", type=int, default=500)
+    parser.add_argument("--reruns", type=int, default=20)
+    args = parser.parse_args()
+
+    primera, tiempos = medir(os.path.abspath(args.app_dir), args)
+    tiempos_ms = sorted(t * 1000 for t in tiempos)
+    p95 = tiempos_ms[min(len(tiempos_ms) - 1, int(len(tiempos_ms) * 0.95))]
+    print(f"Datos: {args.pacientes} pacientes, {args.feedback} feedback, {args.profesionales} profesionales")
+    print(f"Primer run:        {primera * 1000:8.1f} ms")
+    print(f"Rerun (mediana):   {statistics.median(tiempos_ms):8.1f} ms")
+    print(f"Rerun (p95):       {p95:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Bloqueos de archivo entre procesos (varios workers de server.py sobre los mismos datos).
+
+Se bloquea un archivo auxiliar (<datos>.lock) y no el de datos, que se reemplaza con
+os.replace en cada escritura. flock en Linux/macOS; msvcrt.locking en Windows. El sistema
+operativo libera el bloqueo si el proceso muere.
+"""
+import os
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+def _abrir(ruta):
+    return os.open(ruta, os.O_RDWR | os.O_CREAT, 0o644)
+
+def _bloquear(fd, esperar):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX if esperar else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return
+    while True:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return
+        except OSError:
+            if not esperar:
+                raise BlockingIOError(f"Bloqueo tomado por otro proceso: {fd}")
+            time.sleep(0.005)
+
+def _liberar(fd):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+@contextmanager
+def bloqueo_exclusivo(ruta):
+    """
+    Espera hasta tener el bloqueo exclusivo de `ruta` y lo libera al salir del bloque.
+    """
+    fd = _abrir(ruta)
+    try:
+        _bloquear(fd, esperar=True)
+        try:
+            yield
+        finally:
+            _liberar(fd)
+    finally:
+        os.close(fd)
+
+def tomar_bloqueo_exclusivo(ruta):
+    """
+    Toma el bloqueo de `ruta` sin esperar y lo mantiene mientras viva el proceso (o hasta
+    cerrar el descriptor devuelto). Lanza BlockingIOError si otro proceso lo tiene.
+    """
+    fd = _abrir(ruta)
+    try:
+        _bloquear(fd, esperar=False)
+    except OSError:
+        os.close(fd)
+        raise BlockingIOError(f"{ruta} está en uso por otro proceso")
+    return fd
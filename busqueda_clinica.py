@@ -0,0 +1,145 @@
+"""
+Búsqueda de texto libre en las historias clínicas (motivo de consulta, entrevista,
+resultados de tests, notas de seguimiento...).
+
+Índice invertido en memoria: término -> {(paciente, sección): apariciones}. Se alimenta
+del mismo diario de eventos de historia_clinica.py y en cada búsqueda solo procesa los
+eventos agregados desde la anterior (también los guardados por otros procesos). Como en
+la historia, vale la última versión de cada sección: al reindexarla se descuentan los
+términos de la versión anterior.
+
+Los términos se normalizan sin tildes ni mayúsculas ("Praxias" = "praxías") y se
+descartan las palabras vacías más comunes del español. Una consulta recorre solo las
+listas de sus términos; el puntaje es TF-IDF sumado por paciente.
+"""
+import math
+import os
+import re
+import threading
+import unicodedata
+from collections import Counter
+from almacenamiento import normalizar_nombre
+from historia_clinica import EVENTOS_FILE, leer_eventos
+
+PALABRAS_VACIAS = frozenset("""
+a al algo ante como con de del desde donde e el ella ellas ellos en entre era es esa ese eso esta
+este esto fue ha hay la las le les lo los mas me mi muy no o para pero por que se si sin sobre
+su sus tambien te tiene un una uno unos unas y ya
+""".split())
+
+_PALABRA = re.compile(r"[a-z0-9ñ]+")
+
+# Vocales acentuadas del español por tabla (rápido); cualquier otro carácter no ASCII pasa por NFKD
+_TILDES = str.maketrans("áéíóúüàèìòùâêîôû", "aeiouuaeiouaeiou")
+
+def _sin_tildes(texto):
+    texto = texto.lower().translate(_TILDES)
+    if texto.isascii() or all(c.isascii() or c == "ñ" for c in texto):
+        return texto
+    # La ñ se conserva: "año" y "ano" no son la misma palabra
+    texto = "".join(c for c in unicodedata.normalize("NFKD", texto.replace("ñ", "\0")) if not unicodedata.combining(c))
+    return texto.replace("\0", "ñ")
+
+def tokenizar(texto):
+    """
+    Términos de búsqueda de un texto: minúsculas, sin tildes, sin palabras vacías.
+    """
+    return [t for t in _PALABRA.findall(_sin_tildes(str(texto))) if len(t) > 1 and t not in PALABRAS_VACIAS]
+
+def _textos(valor):
+    if isinstance(valor, dict):
+        for v in valor.values():
+            yield from _textos(v)
+    elif isinstance(valor, (list, tuple)):
+        for v in valor:
+            yield from _textos(v)
+    elif valor is not None:
+        yield str(valor)
+
+class IndiceClinico:
+
+    def __init__(self, ruta=EVENTOS_FILE):
+        self.ruta = ruta
+        self._lock = threading.Lock()
+        self._postings = {}    # término -> {(paciente normalizado, sección): apariciones}
+        self._documentos = {}  # (paciente normalizado, sección) -> Counter de términos
+        self._nombres = {}     # paciente normalizado -> nombre tal como se guardó
+        self._fin = 0
+
+    def _indexar(self, evento):
+        clave = normalizar_nombre(evento["paciente"])
+        documento = (clave, evento["seccion"])
+        # Última versión gana: sacar los términos de la anterior
+        for termino in self._documentos.pop(documento, ()):
+            lista = self._postings[termino]
+            del lista[documento]
+            if not lista:
+                del self._postings[termino]
+        terminos = Counter(t for texto in _textos(evento["datos"]) for t in tokenizar(texto))
+        if terminos:
+            self._documentos[documento] = terminos
+            for termino, n in terminos.items():
+                self._postings.setdefault(termino, {})[documento] = n
+        self._nombres[clave] = evento["paciente"]
+
+    def _ponerse_al_dia(self):
+        """
+        Indexa los eventos nuevos del diario. Se llama con self._lock tomado.
+        """
+        tamano = os.path.getsize(self.ruta) if os.path.exists(self.ruta) else 0
+        if tamano < self._fin:
+            self._postings, self._documentos, self._nombres, self._fin = {}, {}, {}, 0
+        if tamano == self._fin:
+            return
+        for offset, largo, evento in leer_eventos(self.ruta, self._fin):
+            if evento is not None:
+                self._indexar(evento)
+            self._fin = offset + largo
+
+    def buscar(self, consulta, limite=20):
+        """
+        Pacientes ordenados por relevancia: primero los que contienen más términos de la
+        consulta, después por puntaje TF-IDF. Cada resultado es un dict con paciente,
+        puntaje, términos encontrados y secciones donde aparecen.
+        """
+        terminos = list(dict.fromkeys(tokenizar(consulta)))
+        if not terminos:
+            return []
+        with self._lock:
+            self._ponerse_al_dia()
+            total = max(len(self._documentos), 1)
+            resultados = {}
+            for termino in terminos:
+                lista = self._postings.get(termino, {})
+                if not lista:
+                    continue
+                idf = math.log(1 + total / len(lista))
+                for (clave, seccion), n in lista.items():
+                    r = resultados.setdefault(clave, {"puntaje": 0.0, "terminos": set(), "secciones": set()})
+                    r["puntaje"] += (1 + math.log(n)) * idf
+                    r["terminos"].add(termino)
+                    r["secciones"].add(seccion)
+            nombres = {clave: self._nombres[clave] for clave in resultados}
+        ordenados = sorted(resultados.items(), key=lambda kv: (-len(kv[1]["terminos"]), -kv[1]["puntaje"]))
+        return [
+            {
+                "paciente": nombres[clave],
+                "puntaje": r["puntaje"],
+                "terminos": sorted(r["terminos"]),
+                "secciones": sorted(r["secciones"]),
+            }
+            for clave, r in ordenados[:limite]
+        ]
+
+_indice = None
+_lock_indice = threading.Lock()
+
+def obtener_indice():
+    """
+    Instancia única por proceso, compartida por todas las sesiones.
+    """
+    global _indice
+    with _lock_indice:
+        if _indice is None:
+            _indice = IndiceClinico()
+        return _indice
@@ -0,0 +1,199 @@
+"""
+Cola persistente de envíos para la app Kivy (main.py).
+
+Cada evaluación se guarda primero en una base SQLite del dispositivo y un hilo en
+segundo plano la envía al servidor por lotes (/api/guardar_lote, o de a una con
+/api/guardar_datos si el servidor no tiene carga masiva). Sin conexión se reintenta con
+espera exponencial; lo pendiente sobrevive a reinicios de la app. Una evaluación sale de
+la cola solo cuando el servidor confirmó que la guardó (entrega "al menos una vez").
+"""
+import json
+import random
+import sqlite3
+import threading
+import time
+import traceback
+import requests
+from requests.adapters import HTTPAdapter
+
+TIMEOUT = (3.05, 15)  # (conexión, lectura) en segundos
+TAMANO_LOTE = 200
+ESPERA_MIN = 1.0
+ESPERA_MAX = 120.0
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS pendientes (
+    id INTEGER PRIMARY KEY,
+    datos TEXT NOT NULL,
+    creado REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rechazadas (
+    id INTEGER PRIMARY KEY,
+    datos TEXT NOT NULL,
+    error TEXT NOT NULL,
+    fecha REAL NOT NULL
+);
+"""
+
+class ErrorServidor(Exception):
+    """
+    El servidor respondió pero no guardó (5xx, 503 por cola llena, etc.): se reintenta.
+    """
+
+class ColaEnvios:
+    """
+    `al_cambiar(estado)` se llama desde el hilo de envío con un dict:
+    pendientes (int), enviados (ids confirmados), rechazadas ([(id, error)]) y error
+    (texto del último fallo de conexión, o None).
+    """
+
+    def __init__(self, ruta_db, server_url, al_cambiar=None, tamano_lote=TAMANO_LOTE):
+        self.server_url = server_url.rstrip("/")
+        self.al_cambiar = al_cambiar
+        self.tamano_lote = tamano_lote
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(ruta_db, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.executescript(ESQUEMA)
+        # Una sola conexión HTTP reutilizada (keep-alive) en lugar de abrir una por envío
+        self._sesion = requests.Session()
+        adaptador = HTTPAdapter(pool_connections=1, pool_maxsize=2)
+        self._sesion.mount("http://", adaptador)
+        self._sesion.mount("https://", adaptador)
+        self._lote_disponible = True
+        self._despertar = threading.Event()
+        self._detener = threading.Event()
+        self._hilo = threading.Thread(target=self._bucle, name="envios", daemon=True)
+        self._hilo.start()
+
+    # ----------------------------
+    # Uso desde la interfaz
+    # ----------------------------
+    def encolar(self, evaluacion):
+        """
+        Guarda la evaluación en el dispositivo (un INSERT local, no bloquea por la red)
+        y avisa al hilo de envío. Devuelve el id local.
+        """
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "INSERT INTO pendientes (datos, creado) VALUES (?, ?)",
+                (json.dumps(evaluacion, ensure_ascii=False), time.time())
+            )
+        self._despertar.set()
+        return cur.lastrowid
+
+    def pendientes(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM pendientes").fetchone()[0]
+
+    def cerrar(self):
+        """
+        Detiene el hilo de envío; lo que no se envió queda en la base para la próxima vez.
+        """
+        self._detener.set()
+        self._despertar.set()
+        self._hilo.join(timeout=5)
+        self._sesion.close()
+        with self._lock:
+            self._conn.close()
+
+    # ----------------------------
+    # Hilo de envío
+    # ----------------------------
+    def _siguiente_lote(self):
+        with self._lock:
+            filas = self._conn.execute(
+                "SELECT id, datos FROM pendientes ORDER BY id LIMIT ?", (self.tamano_lote,)
+            ).fetchall()
+        return [(id_, json.loads(datos)) for id_, datos in filas]
+
+    def _confirmar(self, enviados, rechazadas):
+        """
+        Saca de la cola lo que el servidor guardó. Lo que rechazó por inválido no se
+        reintenta, pero se conserva en la tabla rechazadas.
+        """
+        if not enviados and not rechazadas:
+            return
+        with self._lock, self._conn:
+            if rechazadas:
+                self._conn.executemany(
+                    "INSERT INTO rechazadas (datos, error, fecha) "
+                    "SELECT datos, ?, ? FROM pendientes WHERE id = ?",
+                    [(error, time.time(), id_) for id_, error in rechazadas]
+                )
+            self._conn.executemany(
+                "DELETE FROM pendientes WHERE id = ?",
+                [(id_,) for id_ in enviados] + [(id_,) for id_, _ in rechazadas]
+            )
+        self._notificar(enviados=enviados, rechazadas=rechazadas)
+
+    def _enviar(self, lote):
+        if self._lote_disponible:
+            r = self._sesion.post(
+                f"{self.server_url}/api/guardar_lote", json=[e for _, e in lote], timeout=TIMEOUT
+            )
+            if r.status_code == 404:
+                # Servidor anterior a la carga masiva
+                self._lote_disponible = False
+            elif r.status_code != 200:
+                raise ErrorServidor(f"HTTP {r.status_code}")
+            else:
+                resultados = r.json()["resultados"]
+                self._confirmar(
+                    [lote[x["indice"]][0] for x in resultados if x["ok"]],
+                    [(lote[x["indice"]][0], x.get("error", "")) for x in resultados if not x["ok"]]
+                )
+                return
+        for id_, evaluacion in lote:
+            r = self._sesion.post(f"{self.server_url}/api/guardar_datos", json=evaluacion, timeout=TIMEOUT)
+            if r.status_code == 200:
+                self._confirmar([id_], [])
+            elif r.status_code == 400:
+                self._confirmar([], [(id_, r.json().get("error", ""))])
+            else:
+                raise ErrorServidor(f"HTTP {r.status_code}")
+
+    def _bucle(self):
+        espera = 0.0
+        while not self._detener.is_set():
+            try:
+                lote = self._siguiente_lote()
+                if not lote:
+                    self._despertar.wait()
+                    self._despertar.clear()
+                    continue
+                self._enviar(lote)
+                espera = 0.0
+            except Exception as e:
+                if self._detener.is_set():
+                    # Base ya cerrada por cerrar()
+                    break
+                if not isinstance(e, (requests.RequestException, ErrorServidor, ValueError)):
+                    # Respuesta inesperada, error de la base local, etc.: se registra y se
+                    # reintenta igual, así el hilo no muere y la cola sigue vaciándose
+                    traceback.print_exc()
+                espera = min(max(espera * 2, ESPERA_MIN), ESPERA_MAX)
+                self._notificar(error=str(e))
+                # Espera con jitter; una evaluación nueva o cerrar() la interrumpen
+                self._despertar.wait(espera * random.uniform(0.5, 1.0))
+                self._despertar.clear()
+
+    def _notificar(self, enviados=(), rechazadas=(), error=None):
+        if self.al_cambiar is None:
+            return
+        try:
+            pendientes = self.pendientes()
+        except sqlite3.ProgrammingError:
+            # Base ya cerrada por cerrar()
+            return
+        try:
+            self.al_cambiar({
+                "pendientes": pendientes,
+                "enviados": list(enviados),
+                "rechazadas": list(rechazadas),
+                "error": error
+            })
+        except Exception:
+            # Un error de la interfaz no debe cortar el envío
+            traceback.print_exc()
@@ -0,0 +1,216 @@
+"""
+Almacenamiento de evaluaciones con diario append-only (JSONL) y compactación en segundo plano.
+
+- Cada evaluación se agrega como una línea JSON compacta + fsync: el costo de escribir
+  no depende de cuántas evaluaciones haya guardadas.
+- Un hilo compacta periódicamente el diario en la instantánea (evaluaciones.json, mismo
+  formato de lista que usa server.py) con escritura atómica (.tmp + os.replace).
+- Al iniciar se carga la instantánea y se reproduce el diario. Cada línea lleva su número
+  de secuencia global ("n"), así una compactación interrumpida nunca duplica registros.
+- La lista vive en memoria de un solo proceso: un segundo proceso sobre el mismo diario
+  (otro worker de server.py) no arranca. Para varios workers, ALMACENAMIENTO=sqlite o json.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+import uuid
+from bloqueo_archivos import tomar_bloqueo_exclusivo
+
+def paginar_evaluaciones(evaluaciones, despues_de=0, limite=50, nombre=None):
+    """
+    Hasta `limite` pares (id, evaluación) con id > despues_de. El id es la posición
+    (desde 1) en la lista, estable porque las evaluaciones solo se agregan.
+    `nombre` filtra por coincidencia parcial sin distinguir mayúsculas.
+    """
+    filtro = nombre.strip().lower() if nombre else ""
+    pagina = []
+    for i in range(max(despues_de, 0), len(evaluaciones)):
+        evaluacion = evaluaciones[i]
+        if filtro and filtro not in str(evaluacion.get("nombre", "")).lower():
+            continue
+        pagina.append((i + 1, evaluacion))
+        if len(pagina) >= limite:
+            break
+    return pagina
+
+class DiarioEvaluaciones:
+
+    def __init__(self, ruta_instantanea, ruta_diario=None, umbral_compactacion=1000, intervalo=60.0):
+        self.ruta_instantanea = str(ruta_instantanea)
+        self.ruta_diario = str(ruta_diario) if ruta_diario else self.ruta_instantanea + "l"
+        self.ruta_sellado = self.ruta_diario + ".compactando"
+        self.umbral_compactacion = umbral_compactacion
+        self.intervalo = intervalo
+        self._lock = threading.Lock()
+        self._lock_compactacion = threading.Lock()
+        try:
+            self._fd_bloqueo = tomar_bloqueo_exclusivo(self.ruta_diario + ".lock")
+        except BlockingIOError:
+            raise RuntimeError(
+                f"{self.ruta_diario} ya está abierto por otro proceso; el backend 'diario' admite "
+                "un solo proceso (con varios workers use ALMACENAMIENTO=sqlite o json)"
+            )
+        self._evaluaciones = self._cargar()
+        self._instancia = uuid.uuid4().hex[:8]
+        self._modificado = time.time()
+        self._fd = os.open(self.ruta_diario, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._lineas_diario = self._contar_lineas(self.ruta_diario)
+        self._despertar = threading.Event()
+        self._detener = threading.Event()
+        self._hilo = threading.Thread(target=self._bucle_compactacion, name="compactador-evaluaciones", daemon=True)
+        self._hilo.start()
+        atexit.register(self.cerrar)
+
+    # ----------------------------
+    # Carga inicial
+    # ----------------------------
+    def _cargar(self):
+        evaluaciones = []
+        if os.path.exists(self.ruta_instantanea):
+            with open(self.ruta_instantanea, "r", encoding="utf-8") as f:
+                try:
+                    evaluaciones = json.load(f)
+                except json.JSONDecodeError as e:
+                    # No arrancar con una lista vacía: la próxima compactación borraría los datos
+                    raise RuntimeError(f"Instantánea corrupta en {self.ruta_instantanea}: {e}")
+        # Primero el diario sellado por una compactación interrumpida, luego el actual
+        for ruta in (self.ruta_sellado, self.ruta_diario):
+            for n, evaluacion in self._leer_diario(ruta):
+                if n == len(evaluaciones) + 1:
+                    evaluaciones.append(evaluacion)
+        return evaluaciones
+
+    def _leer_diario(self, ruta):
+        """
+        Devuelve (n, evaluación) de cada línea válida. Si la última línea quedó cortada
+        por una caída a mitad de escritura, se trunca el archivo hasta la última línea completa.
+        Una línea inválida seguida de otras no es un corte: se lanza RuntimeError en lugar de
+        descartar las evaluaciones (ya confirmadas) que vienen después.
+        """
+        if not os.path.exists(ruta):
+            return []
+        entradas = []
+        fin_valido = 0
+        error = None
+        with open(ruta, "rb") as f:
+            for numero, linea in enumerate(f, start=1):
+                if error is not None:
+                    raise RuntimeError(f"Diario corrupto en {ruta}, línea {numero - 1}: {error}")
+                try:
+                    if not linea.endswith(b"\n"):
+                        raise ValueError("línea sin salto final")
+                    registro = json.loads(linea)
+                    entradas.append((registro["n"], registro["e"]))
+                except (ValueError, KeyError, TypeError) as e:
+                    error = e
+                    continue
+                fin_valido += len(linea)
+        if fin_valido < os.path.getsize(ruta):
+            with open(ruta, "r+b") as f:
+                f.truncate(fin_valido)
+        return entradas
+
+    def _contar_lineas(self, ruta):
+        with open(ruta, "rb") as f:
+            return sum(1 for _ in f)
+
+    # ----------------------------
+    # Escritura
+    # ----------------------------
+    def agregar_evaluaciones(self, evaluaciones):
+        """
+        Agrega las evaluaciones al diario con una sola escritura + fsync. Si algo falla, el
+        diario vuelve al tamaño previo (como almacenamiento._anexar_texto): sin líneas a medias
+        a las que se pegue la próxima escritura ni números "n" repetidos.
+        """
+        with self._lock:
+            inicio = len(self._evaluaciones) + 1
+            datos = "".join(
+                json.dumps({"n": inicio + i, "e": e}, ensure_ascii=False, separators=(",", ":")) + "\n"
+                for i, e in enumerate(evaluaciones)
+            ).encode("utf-8")
+            tamaño_antes = os.fstat(self._fd).st_size
+            try:
+                while datos:
+                    datos = datos[os.write(self._fd, datos):]
+                os.fsync(self._fd)
+            except BaseException:
+                os.ftruncate(self._fd, tamaño_antes)
+                raise
+            self._evaluaciones.extend(evaluaciones)
+            self._lineas_diario += len(evaluaciones)
+            self._modificado = time.time()
+            if self._lineas_diario >= self.umbral_compactacion:
+                self._despertar.set()
+
+    def agregar_evaluacion(self, evaluacion):
+        self.agregar_evaluaciones([evaluacion])
+
+    def listar_evaluaciones(self):
+        with self._lock:
+            return list(self._evaluaciones)
+
+    def pagina_evaluaciones(self, despues_de=0, limite=50, nombre=None):
+        with self._lock:
+            return paginar_evaluaciones(self._evaluaciones, despues_de, limite, nombre)
+
+    def version(self):
+        """
+        (etiqueta, timestamp) que cambia con cada escritura; sirve de ETag en server.py.
+        """
+        with self._lock:
+            return f"{self._instancia}-{len(self._evaluaciones)}", self._modificado
+
+    # ----------------------------
+    # Compactación
+    # ----------------------------
+    def compactar(self):
+        """
+        Sella el diario actual, escribe la instantánea completa y borra el diario sellado.
+        Las escrituras solo esperan el renombrado del diario, no la escritura de la instantánea.
+        """
+        with self._lock_compactacion:
+            with self._lock:
+                if self._lineas_diario == 0 and not os.path.exists(self.ruta_sellado):
+                    return
+                if not os.path.exists(self.ruta_sellado):
+                    os.close(self._fd)
+                    os.replace(self.ruta_diario, self.ruta_sellado)
+                    self._fd = os.open(self.ruta_diario, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                    self._lineas_diario = 0
+                datos = list(self._evaluaciones)
+
+            tmp = self.ruta_instantanea + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(datos, f, ensure_ascii=False, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.ruta_instantanea)
+            os.remove(self.ruta_sellado)
+
+    def _bucle_compactacion(self):
+        while not self._detener.is_set():
+            self._despertar.wait(self.intervalo)
+            self._despertar.clear()
+            if self._detener.is_set():
+                break
+            try:
+                self.compactar()
+            except OSError:
+                # Se reintenta en el próximo ciclo; el diario sigue siendo la fuente de verdad
+                pass
+
+    def cerrar(self):
+        """
+        Detiene el hilo de compactación y deja todo volcado en la instantánea.
+        """
+        if self._detener.is_set():
+            return
+        self._detener.set()
+        self._despertar.set()
+        self._hilo.join(timeout=5)
+        self.compactar()
+        os.close(self._fd)
+        os.close(self._fd_bloqueo)
@@ -0,0 +1,131 @@
+"""
+Escritura agrupada (group commit) de evaluaciones.
+
+Los hilos que atienden pedidos HTTP no escriben: encolan la evaluación y esperan.
+Un único hilo escritor junta todo lo que llega dentro de una ventana corta y lo
+persiste con una sola llamada a agregar_evaluaciones() del almacén (una sola
+escritura durable). Cada pedido se confirma recién cuando su lote quedó guardado.
+"""
+import atexit
+import queue
+import threading
+import time
+
+class ColaLlena(Exception):
+    """
+    La cola de escritura alcanzó su capacidad: el cliente debe reintentar más tarde.
+    """
+
+class _Pedido:
+    __slots__ = ("evaluaciones", "listo", "error", "_lock", "_tomado", "_abandonado")
+
+    def __init__(self, evaluaciones):
+        self.evaluaciones = evaluaciones
+        self.listo = threading.Event()
+        self.error = None
+        self._lock = threading.Lock()
+        self._tomado = False
+        self._abandonado = False
+
+    def tomar(self):
+        """
+        El hilo escritor lo reclama para su lote. False si quien lo encoló ya se fue.
+        """
+        with self._lock:
+            if self._abandonado:
+                return False
+            self._tomado = True
+            return True
+
+    def abandonar(self):
+        """
+        Quien lo encoló deja de esperar. False si ya está en un lote que se está escribiendo.
+        """
+        with self._lock:
+            if self._tomado:
+                return False
+            self._abandonado = True
+            return True
+
+_FIN = object()
+
+class EscritorAgrupado:
+
+    def __init__(self, almacen, ventana=0.005, max_lote=500, capacidad=1000):
+        self.almacen = almacen
+        self.ventana = ventana
+        self.max_lote = max_lote
+        self._cola = queue.Queue(maxsize=capacidad)
+        self._hilo = threading.Thread(target=self._bucle, name="escritor-evaluaciones", daemon=True)
+        self._hilo.start()
+        atexit.register(self.cerrar)
+
+    def agregar_evaluaciones(self, evaluaciones, timeout=30.0):
+        """
+        Encola las evaluaciones y bloquea hasta que estén persistidas.
+        Lanza ColaLlena en el acto si no hay lugar (sin ocupar el hilo del pedido esperando),
+        TimeoutError si en `timeout` segundos no entró en un lote (el pedido se descarta y no
+        se guarda, así reintentar no duplica), o la excepción del almacén si la escritura
+        falló. Si ya entró en un lote, espera a que esa escritura termine.
+        """
+        pedido = _Pedido(list(evaluaciones))
+        try:
+            self._cola.put_nowait(pedido)
+        except queue.Full:
+            raise ColaLlena("Cola de escritura llena")
+        if not pedido.listo.wait(timeout):
+            if pedido.abandonar():
+                raise TimeoutError("La escritura no se confirmó a tiempo")
+            pedido.listo.wait()
+        if pedido.error is not None:
+            raise pedido.error
+
+    def agregar_evaluacion(self, evaluacion, timeout=30.0):
+        self.agregar_evaluaciones([evaluacion], timeout=timeout)
+
+    def listar_evaluaciones(self):
+        return self.almacen.listar_evaluaciones()
+
+    def _juntar_lote(self, primero):
+        lote = [primero]
+        cantidad = len(primero.evaluaciones)
+        limite = time.monotonic() + self.ventana
+        while cantidad < self.max_lote:
+            restante = limite - time.monotonic()
+            try:
+                pedido = self._cola.get(timeout=restante) if restante > 0 else self._cola.get_nowait()
+            except queue.Empty:
+                break
+            if pedido is _FIN:
+                # Se reencola para que el bucle termine después de guardar este lote
+                self._cola.put(_FIN)
+                break
+            lote.append(pedido)
+            cantidad += len(pedido.evaluaciones)
+        return lote
+
+    def _bucle(self):
+        while True:
+            primero = self._cola.get()
+            if primero is _FIN:
+                return
+            lote = [pedido for pedido in self._juntar_lote(primero) if pedido.tomar()]
+            if not lote:
+                continue
+            error = None
+            try:
+                self.almacen.agregar_evaluaciones([e for p in lote for e in p.evaluaciones])
+            except Exception as e:
+                error = e
+            for pedido in lote:
+                pedido.error = error
+                pedido.listo.set()
+
+    def cerrar(self):
+        """
+        Guarda lo pendiente y detiene el hilo escritor.
+        """
+        if not self._hilo.is_alive():
+            return
+        self._cola.put(_FIN)
+        self._hilo.join(timeout=10)
@@ -0,0 +1,176 @@
+"""
+Agregados del cuestionario de validación mantenidos de forma incremental.
+
+Cada feedback guardado actualiza, en O(1): cantidad total, media y varianza de cada
+puntaje (algoritmo de Welford), mínimo y máximo, histograma de cada opción elegida y
+los mismos puntajes desglosados por profesion_profesional. El resultado se persiste en
+un JSON chico (su tamaño no depende de cuántas respuestas haya), así la sección de
+análisis lee los agregados sin recorrer feedback_app.csv.
+"""
+import json
+import math
+import os
+import threading
+from datetime import datetime
+from almacenamiento import DATA_FOLDER, FEEDBACK_COLUMNAS, FEEDBACK_NUMERICOS
+
+ESTADISTICAS_FILE = os.path.join(DATA_FOLDER, "estadisticas_feedback.json")
+FEEDBACK_OPCIONES = [col for col in FEEDBACK_COLUMNAS if col.endswith("_opcion")]
+SIN_PROFESION = "(sin profesión)"
+
+def _numero(valor):
+    try:
+        numero = float(valor)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(numero) else numero
+
+def _acumulador():
+    return {"n": 0, "media": 0.0, "m2": 0.0, "min": None, "max": None}
+
+def _sumar(acumulador, x):
+    """
+    Un paso de Welford: media y suma de cuadrados de las diferencias sin guardar los valores.
+    """
+    acumulador["n"] += 1
+    delta = x - acumulador["media"]
+    acumulador["media"] += delta / acumulador["n"]
+    acumulador["m2"] += delta * (x - acumulador["media"])
+    acumulador["min"] = x if acumulador["min"] is None else min(acumulador["min"], x)
+    acumulador["max"] = x if acumulador["max"] is None else max(acumulador["max"], x)
+
+def describir(acumulador):
+    """
+    n, media, varianza y desvío (muestrales), mínimo y máximo de un acumulador.
+    """
+    n = acumulador["n"]
+    varianza = acumulador["m2"] / (n - 1) if n > 1 else 0.0
+    return {
+        "n": n,
+        "media": acumulador["media"] if n else None,
+        "varianza": varianza if n else None,
+        "desvio": math.sqrt(varianza) if n else None,
+        "min": acumulador["min"],
+        "max": acumulador["max"],
+    }
+
+class EstadisticasFeedback:
+
+    def __init__(self, ruta=ESTADISTICAS_FILE):
+        self.ruta = ruta
+        self._lock = threading.Lock()
+        self._al_dia = False
+        self._datos = self._cargar()
+
+    def _vacio(self):
+        return {
+            "total": 0,
+            "numericos": {campo: _acumulador() for campo in FEEDBACK_NUMERICOS},
+            "opciones": {campo: {} for campo in FEEDBACK_OPCIONES},
+            "por_profesion": {},
+            "actualizado": None,
+        }
+
+    def _cargar(self):
+        if os.path.exists(self.ruta):
+            try:
+                with open(self.ruta, "r", encoding="utf-8") as f:
+                    datos = json.load(f)
+                self._al_dia = True
+                return datos
+            except (OSError, ValueError):
+                # Los agregados se pueden recalcular desde los datos guardados
+                pass
+        return self._vacio()
+
+    def existe(self):
+        return os.path.exists(self.ruta)
+
+    def _sumar_fila(self, fila):
+        datos = self._datos
+        datos["total"] += 1
+        profesion = str(fila.get("profesion_profesional") or "").strip() or SIN_PROFESION
+        grupo = datos["por_profesion"].setdefault(
+            profesion, {"total": 0, "numericos": {campo: _acumulador() for campo in FEEDBACK_NUMERICOS}}
+        )
+        grupo["total"] += 1
+        for campo in FEEDBACK_NUMERICOS:
+            x = _numero(fila.get(campo))
+            if x is not None:
+                _sumar(datos["numericos"][campo], x)
+                _sumar(grupo["numericos"][campo], x)
+        for campo in FEEDBACK_OPCIONES:
+            opcion = str(fila.get(campo) or "").strip()
+            if opcion:
+                histograma = datos["opciones"][campo]
+                histograma[opcion] = histograma.get(opcion, 0) + 1
+
+    def _guardar(self):
+        self._datos["actualizado"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        carpeta = os.path.dirname(os.path.abspath(self.ruta))
+        if not os.path.exists(carpeta):
+            os.makedirs(carpeta)
+        tmp = f"{self.ruta}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._datos, f, ensure_ascii=False)
+        os.replace(tmp, self.ruta)
+        self._al_dia = True
+
+    def registrar(self, fila, filas_guardadas):
+        """
+        Suma una respuesta ya guardada a los agregados. Si todavía no hay agregados en disco
+        (primer guardado en un despliegue con respuestas previas, o el JSON se perdió), los
+        arma desde filas_guardadas(), que ya incluye esta respuesta.
+        """
+        with self._lock:
+            if self._al_dia and os.path.exists(self.ruta):
+                self._sumar_fila(fila)
+            else:
+                self._datos = self._vacio()
+                for guardada in filas_guardadas():
+                    self._sumar_fila(guardada)
+            self._guardar()
+
+    def reconstruir(self, filas):
+        """
+        Recalcula todo desde cero (primera vez o si los agregados quedaron desfasados).
+        """
+        with self._lock:
+            self._datos = self._vacio()
+            for fila in filas:
+                self._sumar_fila(fila)
+            self._guardar()
+
+    def resumen(self):
+        """
+        Agregados listos para mostrar: total, describir() por puntaje, histogramas de
+        opciones y desglose por profesión. No depende de la cantidad de respuestas.
+        """
+        with self._lock:
+            datos = json.loads(json.dumps(self._datos))
+        return {
+            "total": datos["total"],
+            "actualizado": datos["actualizado"],
+            "numericos": {campo: describir(acc) for campo, acc in datos["numericos"].items()},
+            "opciones": datos["opciones"],
+            "por_profesion": {
+                profesion: {
+                    "total": grupo["total"],
+                    "numericos": {campo: describir(acc) for campo, acc in grupo["numericos"].items()},
+                }
+                for profesion, grupo in datos["por_profesion"].items()
+            },
+        }
+
+_estadisticas = None
+_lock_estadisticas = threading.Lock()
+
+def obtener_estadisticas():
+    """
+    Instancia única por proceso, compartida por todas las sesiones.
+    """
+    global _estadisticas
+    with _lock_estadisticas:
+        if _estadisticas is None:
+            _estadisticas = EstadisticasFeedback()
+        return _estadisticas
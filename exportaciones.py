@@ -0,0 +1,88 @@
+"""
+Archivos de descarga del panel restringido, generados recién cuando se piden.
+
+Cada exportación se escribe una sola vez por versión de los datos en
+datos_guardados/exportaciones/ (el nombre incluye un hash de repo.version_tabla()) y
+las descargas siguientes la leen del disco. Al cambiar los datos se genera la nueva y se
+borra la anterior. Formatos: CSV (igual que la descarga histórica), CSV comprimido con
+gzip y Parquet (solo si está instalado pyarrow).
+"""
+import hashlib
+import importlib.util
+import os
+import threading
+from almacenamiento import DATA_FOLDER
+from metricas import medir
+from repositorio import EXPORTACIONES
+
+CARPETA_EXPORTACIONES = os.path.join(DATA_FOLDER, "exportaciones")
+
+# formato -> (extensión, mime)
+FORMATOS = {
+    "csv": (".csv", "text/csv"),
+    "csv.gz": (".csv.gz", "application/gzip"),
+    "parquet": (".parquet", "application/vnd.apache.parquet"),
+}
+
+_lock_exportaciones = threading.Lock()
+
+def formatos_disponibles():
+    formatos = ["csv", "csv.gz"]
+    if importlib.util.find_spec("pyarrow") is not None:
+        formatos.append("parquet")
+    return formatos
+
+def _escribir(df, ruta, tabla, formato):
+    if formato == "csv":
+        df.to_csv(ruta, index=False, encoding=EXPORTACIONES[tabla])
+    elif formato == "csv.gz":
+        # mtime fijo: la misma versión de los datos da siempre el mismo archivo
+        df.to_csv(ruta, index=False, encoding=EXPORTACIONES[tabla],
+                  compression={"method": "gzip", "mtime": 0})
+    elif formato == "parquet":
+        # Columnas de texto como texto aunque mezclen números (cédulas, puntajes viejos)
+        texto = {col: "string" for col in df.columns if df[col].dtype == object}
+        df.astype(texto).to_parquet(ruta, index=False)
+    else:
+        raise ValueError(f"Formato de exportación desconocido: {formato}")
+
+def ruta_exportacion(repo, tabla, formato="csv"):
+    """
+    Ruta del archivo de exportación para la versión actual de la tabla; lo genera si no existe.
+    """
+    extension = FORMATOS[formato][0]
+    version = repo.version_tabla(tabla)
+    os.makedirs(CARPETA_EXPORTACIONES, exist_ok=True)
+    prefijo = f"{tabla}-"
+    if version is None:
+        nombre = f"{prefijo}actual{extension}"
+    else:
+        clave = hashlib.sha1(repr((type(repo).__name__, version)).encode("utf-8")).hexdigest()[:16]
+        nombre = f"{prefijo}{clave}{extension}"
+    ruta = os.path.join(CARPETA_EXPORTACIONES, nombre)
+
+    with _lock_exportaciones:
+        if version is not None and os.path.exists(ruta):
+            return ruta
+        tmp = f"{ruta}.tmp"
+        with medir("exportar", tabla=tabla, formato=formato) as tramo:
+            df = getattr(repo, f"listar_{tabla}")()
+            _escribir(df, tmp, tabla, formato)
+            tramo.anotar(filas=len(df), bytes=os.path.getsize(tmp))
+        os.replace(tmp, ruta)
+        # Borrar las exportaciones de versiones anteriores de esta tabla y formato
+        for otro in os.listdir(CARPETA_EXPORTACIONES):
+            if otro != nombre and otro.startswith(prefijo) and otro.endswith(extension) \
+                    and otro[len(prefijo):-len(extension)].isalnum():
+                os.remove(os.path.join(CARPETA_EXPORTACIONES, otro))
+    return ruta
+
+def descarga_diferida(repo, tabla, formato="csv"):
+    """
+    Función sin argumentos para st.download_button(data=...): Streamlit la llama recién
+    cuando se hace clic, así los reruns del panel no leen ni serializan nada.
+    """
+    def leer():
+        with open(ruta_exportacion(repo, tabla, formato), "rb") as f:
+            return f.read()
+    return leer
@@ -0,0 +1,146 @@
+"""
+Historia clínica por paciente, guardada sección por sección.
+
+Cada "Guardar" de Antecedentes, Entrevista inicial, Tests psicomotrices, Seguimiento o
+Evaluación completa agrega un evento (una línea JSON con paciente, sección, datos y fecha)
+a datos_guardados/historias/eventos.jsonl, con una sola escritura + fsync: el costo es el
+tamaño de esa sección, sin reescribir el resto de la historia ni otros pacientes.
+
+La vista vigente es "gana el último": un índice en memoria guarda, por paciente y por
+sección, dónde empieza su evento más reciente. Cargar una historia lee solo esas líneas.
+El índice se arma una vez por proceso y después solo se ponen al día los eventos que
+otro proceso haya agregado al final del archivo.
+"""
+import json
+import os
+import threading
+from datetime import datetime
+from almacenamiento import DATA_FOLDER, normalizar_nombre
+
+CARPETA_HISTORIAS = os.path.join(DATA_FOLDER, "historias")
+EVENTOS_FILE = os.path.join(CARPETA_HISTORIAS, "eventos.jsonl")
+
+# Sección guardada -> nombre en la app
+NOMBRES_SECCIONES = {
+    "antecedentes": "Antecedentes",
+    "entrevista_inicial": "Entrevista inicial",
+    "tests": "Tests psicomotrices",
+    "seguimiento": "Seguimiento del proceso",
+    "evaluacion_completa": "Evaluación completa",
+}
+SECCIONES_HISTORIA = list(NOMBRES_SECCIONES)
+
+def leer_eventos(ruta, desde=0):
+    """
+    (offset, largo, evento) de cada evento completo a partir del byte `desde`. Una última
+    línea sin salto (a medio escribir o cortada por una caída) no se devuelve; las líneas
+    ilegibles se devuelven con evento None para que el que lee pueda avanzar igual.
+    """
+    if not os.path.exists(ruta):
+        return
+    with open(ruta, "rb") as f:
+        f.seek(desde)
+        offset = desde
+        for linea in f:
+            if not linea.endswith(b"\n"):
+                break
+            try:
+                evento = json.loads(linea)
+            except ValueError:
+                evento = None
+            yield offset, len(linea), evento
+            offset += len(linea)
+
+class HistoriasClinicas:
+
+    def __init__(self, ruta=EVENTOS_FILE):
+        self.ruta = ruta
+        self._lock = threading.Lock()
+        self._indice = {}   # paciente normalizado -> {sección: (offset, largo)}
+        self._nombres = {}  # paciente normalizado -> nombre tal como se guardó
+        self._fin = 0       # bytes del archivo ya indexados
+
+    # ----------------------------
+    # Índice
+    # ----------------------------
+    def _actualizar_indice(self):
+        """
+        Pone el índice al día con el archivo. Se llama con self._lock tomado.
+        """
+        tamano = os.path.getsize(self.ruta) if os.path.exists(self.ruta) else 0
+        if tamano < self._fin:
+            # El archivo fue reemplazado por fuera: reconstruir
+            self._indice, self._nombres, self._fin = {}, {}, 0
+        if tamano == self._fin:
+            return
+        for offset, largo, evento in leer_eventos(self.ruta, self._fin):
+            if evento is not None:
+                clave = normalizar_nombre(evento["paciente"])
+                self._indice.setdefault(clave, {})[evento["seccion"]] = (offset, largo)
+                self._nombres[clave] = evento["paciente"]
+            self._fin = offset + largo
+
+    # ----------------------------
+    # Escritura y lectura
+    # ----------------------------
+    def guardar_seccion(self, paciente, seccion, datos):
+        """
+        Agrega el evento de una sección y devuelve su fecha. Lanza ValueError si falta el paciente.
+        """
+        if not str(paciente or "").strip():
+            raise ValueError("Elegí un paciente antes de guardar")
+        if seccion not in SECCIONES_HISTORIA:
+            raise ValueError(f"Sección desconocida: {seccion}")
+        fecha = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        evento = {"paciente": str(paciente).strip(), "seccion": seccion, "fecha": fecha, "datos": datos}
+        linea = (json.dumps(evento, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            os.makedirs(os.path.dirname(os.path.abspath(self.ruta)), exist_ok=True)
+            self._actualizar_indice()
+            fd = os.open(self.ruta, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                offset = os.fstat(fd).st_size
+                # Resto de una línea cortada por una caída: el evento nuevo empieza en otra línea
+                prefijo = b"\n" if offset > self._fin else b""
+                os.write(fd, prefijo + linea)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self._actualizar_indice()
+        return fecha
+
+    def cargar_historia(self, paciente):
+        """
+        {sección: {"fecha": ..., "datos": {...}}} con la última versión guardada de cada sección.
+        """
+        clave = normalizar_nombre(paciente)
+        with self._lock:
+            self._actualizar_indice()
+            posiciones = dict(self._indice.get(clave, {}))
+        historia = {}
+        if not posiciones:
+            return historia
+        with open(self.ruta, "rb") as f:
+            for seccion, (offset, largo) in posiciones.items():
+                f.seek(offset)
+                evento = json.loads(f.read(largo))
+                historia[seccion] = {"fecha": evento["fecha"], "datos": evento["datos"]}
+        return historia
+
+    def pacientes(self):
+        with self._lock:
+            self._actualizar_indice()
+            return sorted(self._nombres.values())
+
+_historias = None
+_lock_historias = threading.Lock()
+
+def obtener_historias():
+    """
+    Instancia única por proceso, compartida por todas las sesiones.
+    """
+    global _historias
+    with _lock_historias:
+        if _historias is None:
+            _historias = HistoriasClinicas()
+        return _historias
@@ -0,0 +1,189 @@
+"""
+Imágenes de la sección Insumos (dibujos escaneados, protocolos DFH Koppitz, Bender, etc.).
+
+Almacenamiento direccionado por contenido en datos_guardados/insumos/:
+- objetos/ab/<sha256>.<ext>: el archivo original, copiado por bloques mientras se calcula
+  el hash. La misma imagen subida dos veces (o para dos pacientes) se guarda una sola vez.
+- miniaturas/<sha256>_<lado>.jpg: miniatura y vista reducida, generadas en un pool de
+  hilos fuera del rerun; mientras no estén, la sección muestra un aviso. Si PIL no puede
+  decodificar la imagen queda <sha256>_<lado>.error con el motivo y no se vuelve a
+  intentar; los errores del entorno (disco lleno, memoria, archivo no disponible) se
+  reintentan en un rerun posterior.
+- insumos.csv: índice append-only paciente -> hash.
+"""
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from almacenamiento import DATA_FOLDER, anexar_fila_csv, leer_csv_seguro, normalizar_nombre
+
+CARPETA_INSUMOS = os.path.join(DATA_FOLDER, "insumos")
+CARPETA_OBJETOS = os.path.join(CARPETA_INSUMOS, "objetos")
+CARPETA_MINIATURAS = os.path.join(CARPETA_INSUMOS, "miniaturas")
+INSUMOS_FILE = os.path.join(CARPETA_INSUMOS, "insumos.csv")
+INSUMOS_COLUMNAS = ["Paciente", "Hash", "Archivo", "Extension", "Bytes", "Fecha"]
+
+LADO_MINIATURA = 256
+LADO_VISTA = 1024
+TAMANO_BLOQUE = 1024 * 1024
+EXTENSIONES = {"JPEG": ".jpg", "PNG": ".png"}
+# Lo que devuelve miniatura() cuando no se pudo generar
+MINIATURA_FALLIDA = "fallida"
+
+_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="miniaturas")
+_pendientes = {}  # (hash, lado) -> Future
+_lock_pendientes = threading.Lock()
+_lock_indice = threading.Lock()
+
+def _ruta_objeto(hash_imagen, extension):
+    return os.path.join(CARPETA_OBJETOS, hash_imagen[:2], f"{hash_imagen}{extension}")
+
+def _ruta_miniatura(hash_imagen, lado):
+    return os.path.join(CARPETA_MINIATURAS, f"{hash_imagen}_{lado}.jpg")
+
+def _ruta_error(hash_imagen, lado):
+    return os.path.join(CARPETA_MINIATURAS, f"{hash_imagen}_{lado}.error")
+
+def _formato_imagen(ruta):
+    """
+    Formato real del archivo (no el que dice la extensión); ValueError si no es jpg/png.
+    """
+    from PIL import Image, UnidentifiedImageError
+    try:
+        with Image.open(ruta) as imagen:
+            formato = imagen.format
+            imagen.verify()
+    except Image.DecompressionBombError:
+        raise ValueError("La imagen es demasiado grande")
+    except (UnidentifiedImageError, OSError, SyntaxError):
+        raise ValueError("El archivo no es una imagen válida")
+    if formato not in EXTENSIONES:
+        raise ValueError("Solo se aceptan imágenes JPG o PNG")
+    return formato
+
+def guardar_objeto(archivo):
+    """
+    Copia el archivo (file-like) al almacén por bloques. Devuelve (hash, extensión, bytes).
+    """
+    os.makedirs(CARPETA_OBJETOS, exist_ok=True)
+    sha = hashlib.sha256()
+    tamano = 0
+    tmp = os.path.join(CARPETA_OBJETOS, f".subida-{threading.get_ident()}-{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as destino:
+            for bloque in iter(lambda: archivo.read(TAMANO_BLOQUE), b""):
+                sha.update(bloque)
+                destino.write(bloque)
+                tamano += len(bloque)
+            destino.flush()
+            os.fsync(destino.fileno())
+        extension = EXTENSIONES[_formato_imagen(tmp)]
+        hash_imagen = sha.hexdigest()
+        ruta = _ruta_objeto(hash_imagen, extension)
+        if not os.path.exists(ruta):
+            os.makedirs(os.path.dirname(ruta), exist_ok=True)
+            os.replace(tmp, ruta)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return hash_imagen, extension, tamano
+
+def listar_imagenes(paciente):
+    """
+    Imágenes asociadas al paciente (dicts con las columnas de insumos.csv), en orden de carga.
+    """
+    if not os.path.exists(INSUMOS_FILE):
+        return []
+    df = leer_csv_seguro(INSUMOS_FILE, INSUMOS_COLUMNAS)
+    clave = normalizar_nombre(paciente)
+    filas = df[df["Paciente"].astype(str).map(normalizar_nombre) == clave]
+    return filas.to_dict("records")
+
+def guardar_imagen(paciente, archivo):
+    """
+    Guarda una imagen subida para el paciente y encarga sus miniaturas.
+    Devuelve (hash, nueva): nueva es False si el paciente ya tenía esa misma imagen.
+    """
+    hash_imagen, extension, tamano = guardar_objeto(archivo)
+    with _lock_indice:
+        nueva = all(fila["Hash"] != hash_imagen for fila in listar_imagenes(paciente))
+        if nueva:
+            anexar_fila_csv(INSUMOS_FILE, {
+                "Paciente": paciente,
+                "Hash": hash_imagen,
+                "Archivo": getattr(archivo, "name", ""),
+                "Extension": extension,
+                "Bytes": tamano,
+                "Fecha": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }, INSUMOS_COLUMNAS)
+    for lado in (LADO_MINIATURA, LADO_VISTA):
+        programar_miniatura(hash_imagen, extension, lado)
+    return hash_imagen, nueva
+
+# ----------------------------
+# Miniaturas en segundo plano
+# ----------------------------
+def _generar_miniatura(hash_imagen, extension, lado):
+    from PIL import Image
+    destino = _ruta_miniatura(hash_imagen, lado)
+    os.makedirs(CARPETA_MINIATURAS, exist_ok=True)
+    with Image.open(_ruta_objeto(hash_imagen, extension)) as imagen:
+        # En JPEG draft() decodifica directamente a una escala menor
+        imagen.draft("RGB", (lado, lado))
+        imagen = imagen.convert("RGB")
+        imagen.thumbnail((lado, lado))
+        tmp = f"{destino}.tmp"
+        imagen.save(tmp, "JPEG", quality=85, optimize=True)
+    os.replace(tmp, destino)
+    return destino
+
+def _es_error_de_imagen(error):
+    """
+    True si el error viene del contenido de la imagen (reintentar no lo arregla).
+    PIL informa imágenes truncadas o corruptas con OSError sin errno; los OSError del
+    sistema (ENOSPC, EMFILE, ENOENT...) sí lo traen.
+    """
+    from PIL import Image, UnidentifiedImageError
+    if isinstance(error, (UnidentifiedImageError, SyntaxError, Image.DecompressionBombError)):
+        return True
+    return isinstance(error, OSError) and error.errno is None
+
+def _terminada(clave, futuro):
+    error = futuro.exception()
+    if error is not None and _es_error_de_imagen(error):
+        # Imagen dañada o ilegible: se marca para no reintentarla en cada rerun
+        try:
+            os.makedirs(CARPETA_MINIATURAS, exist_ok=True)
+            with open(_ruta_error(*clave), "w", encoding="utf-8") as f:
+                f.write(f"{type(error).__name__}: {error}\n")
+        except OSError:
+            pass
+    with _lock_pendientes:
+        _pendientes.pop(clave, None)
+
+def programar_miniatura(hash_imagen, extension, lado):
+    """
+    Encarga la miniatura al pool (una sola vez aunque varias sesiones la pidan).
+    """
+    clave = (hash_imagen, lado)
+    with _lock_pendientes:
+        if clave in _pendientes or os.path.exists(_ruta_miniatura(hash_imagen, lado)) \
+                or os.path.exists(_ruta_error(hash_imagen, lado)):
+            return
+        futuro = _pool.submit(_generar_miniatura, hash_imagen, extension, lado)
+        _pendientes[clave] = futuro
+    futuro.add_done_callback(lambda f: _terminada(clave, f))
+
+def miniatura(fila, lado=LADO_MINIATURA):
+    """
+    Ruta de la miniatura de una fila de listar_imagenes(), None si todavía se está generando
+    o MINIATURA_FALLIDA si no se pudo generar.
+    """
+    ruta = _ruta_miniatura(fila["Hash"], lado)
+    if os.path.exists(ruta):
+        return ruta
+    if os.path.exists(_ruta_error(fila["Hash"], lado)):
+        return MINIATURA_FALLIDA
+    programar_miniatura(fila["Hash"], fila["Extension"], lado)
+    return None
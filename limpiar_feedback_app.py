@@ -1,14 +1,26 @@
+"""
+Limpia datos_guardados/feedback_app.csv y genera feedback_app_limpio.csv.
 
-import pandas as pd
+Modo incremental (por defecto): feedback_app.csv solo crece por el final, así que se
+guarda una marca con el byte hasta el que se procesó (y la última fecha_envio) y en cada
+corrida solo se leen, filtran y agregan al archivo limpio las filas nuevas.
+Si el archivo original fue reescrito (otro encabezado, más corto que la marca) se
+reconstruye todo. --completo fuerza la reconstrucción.
+
+Uso:
+    python limpiar_feedback_app.py [--completo] [--entrada ...] [--salida ...]
+"""
+import argparse
+import io
+import json
 import os
+import pandas as pd
+from limpieza_texto import limpiar_dataframe
 
 # Ruta del archivo original y el archivo limpio
 input_file = os.path.join('datos_guardados', 'feedback_app.csv')
 output_file = os.path.join('datos_guardados', 'feedback_app_limpio.csv')
 
-# Leer el archivo original
-df = pd.read_csv(input_file, encoding='utf-8-sig')
-
 # Seleccionar solo las columnas relevantes (una por pregunta, sin duplicados conceptuales)
 columnas_deseadas = [
     'nombre_profesional',
@@ -23,21 +35,180 @@ columnas_deseadas = [
     'cedula_profesional',
     'profesion_profesional'
 ]
+columnas_texto = ['nombre_profesional', 'modificar_secciones', 'comentarios']
+obligatorias = ["nombre_profesional", "utilidad", "eficiencia", "intencion_uso", "satisfaccion_claridad", "satisfaccion_diseño"]
 
-# Filtrar solo las columnas que existen en el archivo
-columnas_finales = [col for col in columnas_deseadas if col in df.columns]
-df_limpio = df[columnas_finales].copy()
+CHUNKSIZE = 50000
 
+class _LectorAcotado(io.RawIOBase):
+    """
+    Lectura de un archivo abierto desde la posición actual hasta `limite` bytes.
+    """
 
-# Eliminar filas con datos obligatorios vacíos o nulos
-obligatorias = ["nombre_profesional", "utilidad", "eficiencia", "intencion_uso", "satisfaccion_claridad", "satisfaccion_diseño"]
-for col in obligatorias:
-    df_limpio = df_limpio[df_limpio[col].astype(str).str.strip() != ""]
-    df_limpio = df_limpio[df_limpio[col].notna()]
+    def __init__(self, archivo, limite):
+        self.archivo = archivo
+        self.restante = limite
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        n = min(len(buffer), self.restante)
+        if n <= 0:
+            return 0
+        datos = self.archivo.read(n)
+        buffer[:len(datos)] = datos
+        self.restante -= len(datos)
+        return len(datos)
+
+def _leer_encabezado(ruta):
+    with open(ruta, 'rb') as f:
+        return f.readline().decode('utf-8-sig').rstrip('\r\n').split(',')
+
+def _fin_ultima_linea(ruta):
+    """
+    Posición justo después del último salto de línea: una fila que se está escribiendo
+    en este momento queda para la próxima corrida.
+    """
+    with open(ruta, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        posicion = f.tell()
+        while posicion > 0:
+            paso = min(64 * 1024, posicion)
+            f.seek(posicion - paso)
+            bloque = f.read(paso)
+            salto = bloque.rfind(b"\n")
+            if salto >= 0:
+                return posicion - paso + salto + 1
+            posicion -= paso
+    return 0
+
+def limpiar_bloque(df):
+    """
+    Columnas relevantes, texto limpio y filas con todos los datos obligatorios.
+    """
+    # Filtrar solo las columnas que existen en el archivo
+    columnas_finales = [col for col in columnas_deseadas if col in df.columns]
+    df = limpiar_dataframe(df[columnas_finales], [col for col in columnas_texto if col in df.columns])
+    # Una sola máscara para todas las obligatorias: vacías, solo espacios o nulas
+    presentes = [col for col in obligatorias if col in df.columns]
+    completas = df[presentes].replace(r'^\s*$', pd.NA, regex=True).notna().all(axis=1)
+    # No eliminar duplicados, mantener todos los registros completos
+    return df[completas]
+
+def leer_bloques(ruta, inicio, fin, encabezado):
+    """
+    Bloques de DataFrame con las filas entre los bytes [inicio, fin) del CSV.
+    """
+    with open(ruta, 'rb') as f:
+        f.seek(inicio)
+        lector = io.BufferedReader(_LectorAcotado(f, fin - inicio))
+        if inicio == 0:
+            opciones = dict(encoding='utf-8-sig')
+        else:
+            opciones = dict(encoding='utf-8', header=None, names=encabezado)
+        # Todo como texto: cada bloque se escribe igual sin importar qué filas le tocaron
+        yield from pd.read_csv(lector, chunksize=CHUNKSIZE, dtype=str, keep_default_na=False, **opciones)
+
+def _ruta_marca(salida):
+    return f"{salida}.marca.json"
+
+def _leer_marca(salida):
+    try:
+        with open(_ruta_marca(salida), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _guardar_marca(salida, marca):
+    tmp = f"{_ruta_marca(salida)}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(marca, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, _ruta_marca(salida))
+
+def _marca_valida(marca, entrada, salida, encabezado):
+    if not marca or marca.get("encabezado") != encabezado or not os.path.exists(salida):
+        return False
+    if marca["offset"] <= 0:
+        return False
+    if os.path.getsize(entrada) < marca["offset"] or os.path.getsize(salida) < marca["tamano_salida"]:
+        return False
+    # La marca tiene que caer justo después de un fin de línea
+    with open(entrada, 'rb') as f:
+        f.seek(marca["offset"] - 1)
+        return f.read(1) == b"\n"
+
+def _ultima_fecha(df, anterior):
+    if 'fecha_envio' not in df.columns or df.empty:
+        return anterior
+    fecha = str(df['fecha_envio'].astype(str).max())
+    return max(fecha, anterior) if anterior else fecha
+
+def limpiar(entrada=input_file, salida=output_file, completo=False):
+    """
+    Devuelve (filas nuevas leídas, filas agregadas al archivo limpio, modo).
+    """
+    encabezado = _leer_encabezado(entrada)
+    fin = _fin_ultima_linea(entrada)
+    marca = None if completo else _leer_marca(salida)
+
+    if marca and _marca_valida(marca, entrada, salida, encabezado):
+        # Incremental: deshacer un agregado interrumpido y seguir desde la marca
+        with open(salida, 'r+b') as f:
+            f.truncate(marca["tamano_salida"])
+        leidas = agregadas = 0
+        ultima_fecha = marca.get("ultima_fecha_envio")
+        if fin > marca["offset"]:
+            with open(salida, 'a', encoding='utf-8', newline='') as f:
+                for bloque in leer_bloques(entrada, marca["offset"], fin, encabezado):
+                    limpio = limpiar_bloque(bloque)
+                    limpio.to_csv(f, index=False, header=False)
+                    leidas += len(bloque)
+                    agregadas += len(limpio)
+                    ultima_fecha = _ultima_fecha(limpio, ultima_fecha)
+                f.flush()
+                os.fsync(f.fileno())
+        modo = "incremental"
+    else:
+        # Reconstrucción completa, atómica
+        tmp = f"{salida}.tmp"
+        leidas = agregadas = 0
+        ultima_fecha = None
+        with open(tmp, 'w', encoding='utf-8-sig', newline='') as f:
+            for i, bloque in enumerate(leer_bloques(entrada, 0, fin, encabezado)):
+                limpio = limpiar_bloque(bloque)
+                limpio.to_csv(f, index=False, header=(i == 0))
+                leidas += len(bloque)
+                agregadas += len(limpio)
+                ultima_fecha = _ultima_fecha(limpio, ultima_fecha)
+            if f.tell() == 0:
+                # Sin filas: solo el encabezado
+                f.write(",".join(col for col in columnas_deseadas if col in encabezado) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, salida)
+        modo = "completo"
+
+    _guardar_marca(salida, {
+        "offset": fin,
+        "tamano_salida": os.path.getsize(salida),
+        "ultima_fecha_envio": ultima_fecha,
+        "encabezado": encabezado,
+    })
+    return leidas, agregadas, modo
 
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--completo", action="store_true", help="Reconstruir todo el archivo limpio")
+    parser.add_argument("--entrada", default=input_file)
+    parser.add_argument("--salida", default=output_file)
+    args = parser.parse_args()
 
-# No eliminar duplicados, mantener todos los registros completos
+    leidas, agregadas, modo = limpiar(args.entrada, args.salida, args.completo)
+    print(f"Archivo limpio guardado en: {args.salida} "
+          f"(modo {modo}: {leidas} filas leídas, {agregadas} agregadas)")
 
-# Guardar el archivo limpio con todos los registros
-df_limpio.to_csv(output_file, index=False, encoding='utf-8-sig')
-print(f"Archivo limpio guardado en: {output_file}")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Limpieza de texto libre compartida por la app y los scripts de feedback.
+
+Criterio histórico: las comas, comillas, punto y coma, pipes, barras invertidas y todo
+espacio en blanco (saltos de línea, tabs...) se reemplazan por un espacio, los espacios
+repetidos se colapsan, se recorta el texto y se trunca a 2000 caracteres.
+
+- limpiar_texto (un valor): seis str.replace en C + split/join, que ya colapsa todos los
+  espacios en blanco; sin re.sub. Medido, es más rápido que translate o una regex única.
+- limpiar_serie / limpiar_dataframe (columnas): una sola expresión regular por celda,
+  ejecutada por pandas (en Arrow si pyarrow está instalado).
+
+Ver benchmarks/medir_limpieza.py.
+"""
+import re
+
+LARGO_MAXIMO = 2000
+CARACTERES_PROBLEMATICOS = ',"\';|\\'
+
+# Los espacios se listan explícitamente (los mismos que str.isspace / str.split) para que
+# la versión vectorizada dé el mismo resultado que limpiar_texto también en el motor RE2
+# de pandas con Arrow, donde \s solo cubre espacios ASCII.
+_ESPACIOS = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004"
+    "\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+PATRON = "[" + re.sub(r'([\\\]\^\-])', r'\\\1', CARACTERES_PROBLEMATICOS + _ESPACIOS) + "]+"
+
+def _tipo_texto():
+    try:
+        import pyarrow  # noqa: F401
+        return "string[pyarrow]"
+    except ImportError:
+        return object
+
+def limpiar_texto(texto):
+    """
+    Limpia un valor suelto. None, NaN y valores vacíos devuelven "".
+    """
+    if not isinstance(texto, str):
+        import pandas as pd
+        if not texto or pd.isna(texto):
+            return ""
+        texto = str(texto)
+    for caracter in CARACTERES_PROBLEMATICOS:
+        texto = texto.replace(caracter, " ")
+    texto = " ".join(texto.split())
+    if len(texto) > LARGO_MAXIMO:
+        texto = texto[:LARGO_MAXIMO - 3] + "..."
+    return texto
+
+def limpiar_serie(serie):
+    """
+    Versión vectorizada para una columna completa: una pasada del patrón por celda.
+    Los nulos quedan como "" y el resto se convierte a texto (str(valor)).
+    Con pyarrow instalado el reemplazo corre en Arrow, fuera del intérprete.
+    """
+    serie = serie.fillna("").astype(str).astype(_tipo_texto())
+    # El patrón va como texto (no compilado) para que pandas pueda usar el motor de Arrow
+    serie = serie.str.replace(PATRON, " ", regex=True).str.strip(" ")
+    largos = serie.str.len()
+    if (largos > LARGO_MAXIMO).any():
+        serie = serie.where(largos <= LARGO_MAXIMO, serie.str.slice(0, LARGO_MAXIMO - 3) + "...")
+    return serie
+
+def limpiar_dataframe(df, columnas=None):
+    """
+    Aplica limpiar_serie a las columnas indicadas (por defecto, todas). Devuelve una copia.
+    """
+    df = df.copy()
+    for col in (df.columns if columnas is None else columnas):
+        df[col] = limpiar_serie(df[col])
+    return df
@@ -1,11 +1,13 @@
 import kivy
+import os
 from kivy.app import App
+from kivy.clock import Clock
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
-import requests
 import webbrowser
+from cola_envios import ColaEnvios
 
 SERVER_URL = "http://127.0.0.1:5000"  # Cambiar por IP si se usa otro dispositivo
 
@@ -30,8 +32,22 @@ class FormApp(App):
         self.mensaje = Label(text="")
         layout.add_widget(self.mensaje)
 
+        # Envíos en segundo plano con cola persistente en el dispositivo
+        self.cola = ColaEnvios(
+            os.path.join(self.user_data_dir, "envios_pendientes.db"),
+            SERVER_URL,
+            al_cambiar=self.al_cambiar_cola
+        )
+        self.esperando_envio = None
+        pendientes = self.cola.pendientes()
+        if pendientes:
+            self.mensaje.text = f"{pendientes} evaluación(es) pendiente(s) de enviar"
+
         return layout
 
+    def on_stop(self):
+        self.cola.cerrar()
+
     def guardar(self, instance):
         nombre = self.nombre_input.text.strip()
         try:
@@ -53,21 +69,36 @@ class FormApp(App):
 
         data = {"nombre": nombre, "puntajes": {"coordinacion": coord, "equilibrio": equi, "atencion": aten}}
 
-        try:
-            r = requests.post(f"{SERVER_URL}/api/guardar_datos", json=data)
-            if r.status_code == 200:
-                self.mensaje.text = "✅ Guardado correctamente. Abriendo web..."
-                # Abrir la web de resultados
-                webbrowser.open(f"{SERVER_URL}/resultados_web")
-                # Limpiar inputs
-                self.nombre_input.text = ""
-                self.coord_input.text = ""
-                self.equi_input.text = ""
-                self.aten_input.text = ""
-            else:
-                self.mensaje.text = f"Error: {r.json().get('error')}"
-        except Exception as e:
-            self.mensaje.text = f"Error de conexión: {e}"
+        # Se guarda en el dispositivo y se envía en segundo plano: la interfaz no espera a la red
+        self.esperando_envio = self.cola.encolar(data)
+        self.mensaje.text = "💾 Guardado en el dispositivo. Enviando..."
+        # Limpiar inputs
+        self.nombre_input.text = ""
+        self.coord_input.text = ""
+        self.equi_input.text = ""
+        self.aten_input.text = ""
+
+    def al_cambiar_cola(self, estado):
+        # Llega desde el hilo de envío: los widgets solo se tocan en el hilo principal
+        Clock.schedule_once(lambda dt: self.mostrar_estado_cola(estado))
+
+    def mostrar_estado_cola(self, estado):
+        rechazadas = dict(estado["rechazadas"])
+        if self.esperando_envio in estado["enviados"]:
+            self.esperando_envio = None
+            self.mensaje.text = "✅ Guardado correctamente. Abriendo web..."
+            # Abrir la web de resultados
+            webbrowser.open(f"{SERVER_URL}/resultados_web")
+        elif self.esperando_envio in rechazadas:
+            self.mensaje.text = f"Error: {rechazadas[self.esperando_envio]}"
+            self.esperando_envio = None
+        elif estado["error"]:
+            self.mensaje.text = (
+                f"Sin conexión con el servidor. {estado['pendientes']} evaluación(es) "
+                "guardada(s) en el dispositivo, se reintentará automáticamente"
+            )
+        elif estado["enviados"] and estado["pendientes"] == 0 and self.esperando_envio is None:
+            self.mensaje.text = "✅ Evaluaciones pendientes enviadas"
 
 if __name__ == "__main__":
     FormApp().run()
@@ -0,0 +1,228 @@
+"""
+Tiempos de la app por rerun, por sección y por operación de E/S.
+
+Se activa con la variable de entorno METRICAS=1 (se lee al iniciar el proceso). Apagado,
+medir() devuelve siempre el mismo objeto que no hace nada y @medido deja la función
+original sin envolver: el costo es una comparación por llamada, o ninguno.
+
+Cada tramo registra duración y, si se anotan, filas y bytes. Los tramos se agregan por
+proceso en histogramas con los mismos límites que usa Prometheus (sin guardar las
+muestras), y se exponen:
+- en texto de Prometheus, escrito cada METRICAS_INTERVALO segundos (15) en
+  METRICAS_ARCHIVO (datos_guardados/metricas.prom) para el textfile collector;
+- en la sección restringida "Diagnóstico de rendimiento".
+
+Uso:
+    with medir("leer_csv", archivo="feedback_app.csv") as tramo:
+        df = ...
+        tramo.anotar(filas=len(df))
+
+    @medido("exportar")
+    def exportar(...): ...
+"""
+import bisect
+import functools
+import os
+import threading
+import time
+
+ACTIVAS = os.environ.get("METRICAS", "").strip().lower() in ("1", "true", "si", "sí")
+METRICAS_ARCHIVO = os.environ.get("METRICAS_ARCHIVO", os.path.join("datos_guardados", "metricas.prom"))
+METRICAS_INTERVALO = float(os.environ.get("METRICAS_INTERVALO", "15"))
+
+_CONTROL_DE_FLUJO = ("RerunException", "StopException")
+
+# Límites superiores de los buckets, en segundos
+LIMITES = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class _Serie:
+    __slots__ = ("buckets", "cantidad", "suma", "filas", "bytes")
+
+    def __init__(self):
+        self.buckets = [0] * (len(LIMITES) + 1)
+        self.cantidad = 0
+        self.suma = 0.0
+        self.filas = 0
+        self.bytes = 0
+
+_series = {}  # (nombre, etiquetas ordenadas) -> _Serie
+_lock_series = threading.Lock()
+
+def registrar(nombre, segundos, etiquetas=(), filas=0, bytes_=0):
+    clave = (nombre, tuple(sorted(etiquetas)))
+    indice = bisect.bisect_left(LIMITES, segundos)
+    with _lock_series:
+        serie = _series.get(clave)
+        if serie is None:
+            serie = _series[clave] = _Serie()
+        serie.buckets[indice] += 1
+        serie.cantidad += 1
+        serie.suma += segundos
+        serie.filas += filas
+        serie.bytes += bytes_
+
+class _Tramo:
+    __slots__ = ("nombre", "etiquetas", "filas", "bytes", "_inicio")
+
+    def __init__(self, nombre, etiquetas):
+        self.nombre = nombre
+        self.etiquetas = etiquetas
+        self.filas = 0
+        self.bytes = 0
+
+    def anotar(self, filas=0, bytes=0):
+        self.filas += filas
+        self.bytes += bytes
+
+    def __enter__(self):
+        self._inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        etiquetas = self.etiquetas
+        # st.rerun() y st.stop() cortan el script con excepciones que no son errores
+        if tipo is not None and tipo.__name__ not in _CONTROL_DE_FLUJO:
+            etiquetas = etiquetas + (("error", tipo.__name__),)
+        registrar(self.nombre, time.perf_counter() - self._inicio, etiquetas, self.filas, self.bytes)
+        return False
+
+class _TramoInactivo:
+    __slots__ = ()
+
+    def anotar(self, filas=0, bytes=0):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        return False
+
+_INACTIVO = _TramoInactivo()
+
+def medir(nombre, **etiquetas):
+    """
+    Context manager que mide un tramo. Devuelve un objeto con anotar(filas=, bytes=).
+    """
+    if not ACTIVAS:
+        return _INACTIVO
+    return _Tramo(nombre, tuple(etiquetas.items()))
+
+def medido(nombre, **etiquetas):
+    """
+    Decorador: mide cada llamada a la función. Apagado, devuelve la función sin cambios.
+    """
+    def decorador(funcion):
+        if not ACTIVAS:
+            return funcion
+
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            with medir(nombre, **etiquetas):
+                return funcion(*args, **kwargs)
+        return envoltura
+    return decorador
+
+# ----------------------------
+# Consulta y exportación
+# ----------------------------
+def _percentil(buckets, cantidad, q):
+    """
+    Estimación por interpolación dentro del bucket, como histogram_quantile de Prometheus.
+    """
+    objetivo = q * cantidad
+    acumulado = 0
+    for i, n in enumerate(buckets):
+        if n and acumulado + n >= objetivo:
+            inferior = LIMITES[i - 1] if i > 0 else 0.0
+            superior = LIMITES[i] if i < len(LIMITES) else LIMITES[-1]
+            return inferior + (superior - inferior) * (objetivo - acumulado) / n
+        acumulado += n
+    return 0.0
+
+def resumen():
+    """
+    Lista de dicts (una fila por nombre + etiquetas) con cantidad, media, p50, p95 y totales.
+    """
+    with _lock_series:
+        copia = [(clave, serie.cantidad, serie.suma, list(serie.buckets), serie.filas, serie.bytes)
+                 for clave, serie in _series.items()]
+    filas = []
+    for (nombre, etiquetas), cantidad, suma, buckets, total_filas, total_bytes in copia:
+        filas.append({
+            "tramo": nombre,
+            "etiquetas": ", ".join(f"{k}={v}" for k, v in etiquetas),
+            "cantidad": cantidad,
+            "media_ms": suma / cantidad * 1000,
+            "p50_ms": _percentil(buckets, cantidad, 0.5) * 1000,
+            "p95_ms": _percentil(buckets, cantidad, 0.95) * 1000,
+            "total_s": suma,
+            "filas": total_filas,
+            "bytes": total_bytes,
+        })
+    return sorted(filas, key=lambda f: -f["total_s"])
+
+def _escapar(valor):
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def texto_prometheus():
+    """
+    Métricas en formato de texto de Prometheus (histogramas + contadores de filas y bytes).
+    """
+    with _lock_series:
+        copia = [(clave, serie.cantidad, serie.suma, list(serie.buckets), serie.filas, serie.bytes)
+                 for clave, serie in sorted(_series.items())]
+    lineas = [
+        "# HELP psicomotriz_tramo_segundos Duración de los tramos medidos.",
+        "# TYPE psicomotriz_tramo_segundos histogram",
+    ]
+    contadores = []
+    for (nombre, etiquetas), cantidad, suma, buckets, filas, bytes_ in copia:
+        base = ",".join(f'{k}="{_escapar(v)}"' for k, v in (("tramo", nombre),) + etiquetas)
+        acumulado = 0
+        for limite, n in zip(LIMITES + ("+Inf",), buckets):
+            acumulado += n
+            lineas.append(f'psicomotriz_tramo_segundos_bucket{{{base},le="{limite}"}} {acumulado}')
+        lineas.append(f"psicomotriz_tramo_segundos_sum{{{base}}} {suma}")
+        lineas.append(f"psicomotriz_tramo_segundos_count{{{base}}} {cantidad}")
+        contadores.append((base, filas, bytes_))
+    lineas += ["# HELP psicomotriz_tramo_filas_total Filas procesadas por los tramos.",
+               "# TYPE psicomotriz_tramo_filas_total counter"]
+    lineas += [f"psicomotriz_tramo_filas_total{{{base}}} {filas}" for base, filas, _ in contadores]
+    lineas += ["# HELP psicomotriz_tramo_bytes_total Bytes leídos o escritos por los tramos.",
+               "# TYPE psicomotriz_tramo_bytes_total counter"]
+    lineas += [f"psicomotriz_tramo_bytes_total{{{base}}} {bytes_}" for base, _, bytes_ in contadores]
+    return "\n".join(lineas) + "\n"
+
+def escribir_archivo(ruta=METRICAS_ARCHIVO):
+    carpeta = os.path.dirname(os.path.abspath(ruta))
+    os.makedirs(carpeta, exist_ok=True)
+    # Escritura atómica: el collector nunca lee un archivo a medias
+    tmp = f"{ruta}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(texto_prometheus())
+    os.replace(tmp, ruta)
+
+_exportador = None
+_lock_exportador = threading.Lock()
+
+def iniciar_exportacion(ruta=METRICAS_ARCHIVO, intervalo=METRICAS_INTERVALO):
+    """
+    Escribe el archivo de Prometheus periódicamente desde un hilo (una vez por proceso).
+    """
+    global _exportador
+    if not ACTIVAS:
+        return
+    with _lock_exportador:
+        if _exportador is not None:
+            return
+
+        def bucle():
+            while True:
+                time.sleep(intervalo)
+                try:
+                    escribir_archivo(ruta)
+                except OSError:
+                    pass
+        _exportador = threading.Thread(target=bucle, name="exportador-metricas", daemon=True)
+        _exportador.start()
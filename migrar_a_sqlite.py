@@ -0,0 +1,55 @@
+"""
+Migración única de datos_guardados/*.csv y evaluaciones.json a la base SQLite.
+
+Uso:
+    python migrar_a_sqlite.py [--db datos_guardados/psicomotriz.db]
+
+Las tablas que ya tienen filas se omiten, así que volver a ejecutarlo no duplica datos.
+Los archivos originales no se modifican.
+"""
+import argparse
+import json
+import os
+import pandas as pd
+from almacenamiento import DATA_FILE_PROF, PACIENTES_FILE, FEEDBACK_FILE
+from repositorio_sqlite import RUTA_SQLITE, RepositorioSQLite
+
+EVALUACIONES_JSON = os.path.join(os.path.dirname(os.path.abspath(__file__)), "evaluaciones.json")
+
+def leer_csv(ruta):
+    # dtype=str conserva cédulas con ceros a la izquierda y evita "nan" en textos vacíos
+    return pd.read_csv(ruta, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+
+def main():
+    parser = argparse.ArgumentParser(description="Migra los CSV y evaluaciones.json a SQLite")
+    parser.add_argument("--db", default=RUTA_SQLITE, help="Ruta de la base SQLite de destino")
+    args = parser.parse_args()
+
+    repo = RepositorioSQLite(args.db)
+    fuentes = [
+        ("profesionales", DATA_FILE_PROF, lambda df: repo.importar_profesionales(df.to_dict('records'))),
+        ("pacientes", PACIENTES_FILE, repo.guardar_pacientes),
+        ("feedback", FEEDBACK_FILE, lambda df: repo.importar_feedback(df.to_dict('records'))),
+    ]
+    for tabla, ruta, importar in fuentes:
+        if repo.contar(tabla) > 0:
+            print(f"{tabla}: la tabla ya tiene datos, se omite")
+        elif not os.path.exists(ruta):
+            print(f"{tabla}: no existe {ruta}, se omite")
+        else:
+            df = leer_csv(ruta)
+            importar(df)
+            print(f"{tabla}: {len(df)} filas leídas, {repo.contar(tabla)} en la base")
+
+    if repo.contar("evaluaciones") > 0:
+        print("evaluaciones: la tabla ya tiene datos, se omite")
+    elif os.path.exists(EVALUACIONES_JSON):
+        with open(EVALUACIONES_JSON, "r", encoding="utf-8") as f:
+            evaluaciones = json.load(f)
+        repo.agregar_evaluaciones([e for e in evaluaciones if e.get("nombre")])
+        print(f"evaluaciones: {repo.contar('evaluaciones')} migradas")
+
+    print(f"Base SQLite lista en: {args.db}")
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,25 @@
-import pandas as pd
+"""
+Normaliza un export de feedback (feedback1.csv) al esquema de 15 columnas de feedback2.csv.
+
+Procesa el archivo por bloques (chunksize) con el parser C de pandas, así la memoria
+no depende del tamaño del export:
+- separador detectado con csv.Sniffer sobre una muestra del inicio del archivo; si no
+  decide o elige uno ausente del encabezado, por la primera línea (';', tab o ',')
+- codificación detectada de forma incremental (BOM, UTF-8 validado por bloques o cp1252)
+- texto limpiado con el mismo criterio que la app (limpieza_texto.py)
+
+Uso:
+    python normalizar_feedback1.py [entrada.csv] [salida.csv] [--chunksize 50000]
+"""
+import argparse
+import codecs
 import csv
 import os
+import pandas as pd
+from limpieza_texto import limpiar_dataframe
 
-# Detectar el separador de feedback1.csv
-with open('feedback1.csv', 'r', encoding='utf-8', newline='') as f:
-    first_line = f.readline()
-    if ';' in first_line:
-        sep = ';'
-    elif '\t' in first_line:
-        sep = '\t'
-    elif ',' in first_line:
-        sep = ','
-    else:
-        sep = ','  # Por defecto
-
-# Leer el archivo con el separador detectado
-try:
-    df = pd.read_csv('feedback1.csv', sep=sep, encoding='utf-8', engine='python')
-except Exception:
-    # Si falla, intenta con cp1252
-    df = pd.read_csv('feedback1.csv', sep=sep, encoding='cp1252', engine='python')
-
-# Si los datos están todos en una sola columna, intenta separarlos
-if df.shape[1] == 1:
-    # Intenta dividir por coma
-    df = df[df.columns[0]].str.split(',', expand=True)
-
-# Asignar nombres de columna igual que feedback2.csv (ajusta si tu CSV2 tiene otros nombres)
-df.columns = [
+# Nombres de columna igual que feedback2.csv
+COLUMNAS = [
     "nombre_profesional", "cedula_profesional", "profesion_profesional",
     "utilidad", "utilidad_opcion", "eficiencia", "eficiencia_opcion",
     "intencion_uso", "satisfaccion_claridad", "satisfaccion_claridad_opcion",
@@ -35,10 +27,96 @@ df.columns = [
     "modificar_secciones", "comentarios", "fecha_envio"
 ]
 
-# Limpiar espacios
-for col in df.columns:
-    df[col] = df[col].astype(str).str.strip()
+TAMANO_MUESTRA = 64 * 1024
+TAMANO_BLOQUE = 1024 * 1024
+
+def detectar_codificacion(ruta):
+    """
+    'utf-8-sig' si hay BOM, 'utf-8' si todo el archivo decodifica como UTF-8 (validado de a
+    bloques, sin cargarlo), o 'cp1252' (exports de Excel en Windows).
+    """
+    with open(ruta, 'rb') as f:
+        if f.read(3) == codecs.BOM_UTF8:
+            return 'utf-8-sig'
+        f.seek(0)
+        decodificador = codecs.getincrementaldecoder('utf-8')()
+        try:
+            for bloque in iter(lambda: f.read(TAMANO_BLOQUE), b""):
+                decodificador.decode(bloque)
+            decodificador.decode(b"", final=True)
+        except UnicodeDecodeError:
+            return 'cp1252'
+    return 'utf-8'
+
+def detectar_separador(ruta, codificacion):
+    with open(ruta, 'r', encoding=codificacion, errors='replace', newline='') as f:
+        muestra = f.read(TAMANO_MUESTRA)
+    primera_linea = muestra.split('\n', 1)[0]
+    try:
+        sep = csv.Sniffer().sniff(muestra, delimiters=";,\t").delimiter
+        # El encabezado no tiene comillas: el separador real tiene que aparecer en él
+        if sep in primera_linea:
+            return sep
+    except csv.Error:
+        pass
+    # Criterio histórico: ';', luego tab, luego ',' según la primera línea
+    if ';' in primera_linea:
+        return ';'
+    if '\t' in primera_linea:
+        return '\t'
+    return ','  # Por defecto
+
+def normalizar_bloque(df):
+    # Si los datos están todos en una sola columna, intenta separarlos por coma
+    if df.shape[1] == 1:
+        df = df[df.columns[0]].str.split(',', expand=True)
+    if df.shape[1] != len(COLUMNAS):
+        raise ValueError(f"Se esperaban {len(COLUMNAS)} columnas y el archivo tiene {df.shape[1]}")
+    df.columns = COLUMNAS
+    # Limpiar el texto con el mismo criterio que la app (una pasada por celda)
+    return limpiar_dataframe(df)
+
+def normalizar(entrada, salida, chunksize=50000):
+    """
+    Escribe `salida` bloque a bloque (primero en un .tmp, que reemplaza al final).
+    Devuelve (filas, codificación, separador).
+    """
+    codificacion = detectar_codificacion(entrada)
+    sep = detectar_separador(entrada, codificacion)
+    lector = pd.read_csv(
+        entrada, sep=sep, encoding=codificacion, engine='c', dtype=str,
+        keep_default_na=False, chunksize=chunksize
+    )
+    tmp = f"{salida}.tmp"
+    filas = 0
+    try:
+        with open(tmp, 'w', encoding='utf-8-sig', newline='') as f:
+            for i, bloque in enumerate(lector):
+                normalizar_bloque(bloque).to_csv(f, index=False, header=(i == 0))
+                filas += len(bloque)
+            if f.tell() == 0:
+                # Export sin filas: solo el encabezado
+                f.write(",".join(COLUMNAS) + "\n")
+        os.replace(tmp, salida)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return filas, codificacion, sep
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("entrada", nargs="?", default="feedback1.csv")
+    parser.add_argument("salida", nargs="?", default="feedback1_normalizado.csv")
+    parser.add_argument("--chunksize", type=int, default=50000, help="Filas por bloque (memoria constante)")
+    args = parser.parse_args()
+
+    try:
+        filas, codificacion, sep = normalizar(args.entrada, args.salida, args.chunksize)
+    except ValueError as e:
+        # Esquema inesperado: mensaje claro en lugar del traceback
+        parser.exit(1, f"{parser.prog}: error: {e}\n")
+    print(f"CSV normalizado y listo para análisis: {args.salida} "
+          f"({filas} filas, codificación {codificacion}, separador {sep!r})")
 
-# Guardar el CSV normalizado
-df.to_csv('feedback1_normalizado.csv', index=False, encoding='utf-8-sig')
-print("CSV1 normalizado y listo para análisis: feedback1_normalizado.csv")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import os
+import threading
+from datetime import datetime
+import pandas as pd
+import streamlit as st
+from almacenamiento import PROFESIONALES_COLUMNAS, anexar_fila_csv, normalizar_nombre
+
+class RegistroProfesionales:
+    """
+    Índice en memoria de profesionales.csv (nombre normalizado -> fila, cédula -> fila).
+    Se construye una vez por proceso y se actualiza incrementalmente en cada registro;
+    solo se reconstruye si el archivo fue modificado por fuera de esta clase.
+    """
+
+    def __init__(self, archivo_path):
+        self.archivo_path = archivo_path
+        self._lock = threading.RLock()
+        self._por_nombre = {}
+        self._por_cedula = {}
+        self._version = None
+
+    def _version_archivo(self):
+        if not os.path.exists(self.archivo_path):
+            return None
+        info = os.stat(self.archivo_path)
+        return (info.st_mtime_ns, info.st_size)
+
+    def _indexar(self, fila):
+        # Ante nombres repetidos gana el primero, igual que la búsqueda histórica (iloc[0])
+        self._por_nombre.setdefault(normalizar_nombre(fila["Nombre"]), fila)
+        if fila["Cédula"]:
+            self._por_cedula.setdefault(fila["Cédula"], fila)
+
+    def _asegurar_indice(self):
+        version = self._version_archivo()
+        if version == self._version:
+            return
+        self._por_nombre = {}
+        self._por_cedula = {}
+        if version is not None:
+            # dtype=str conserva ceros a la izquierda en la cédula
+            df = pd.read_csv(self.archivo_path, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+            for col in PROFESIONALES_COLUMNAS:
+                if col not in df.columns:
+                    df[col] = ""
+            for fila in df[PROFESIONALES_COLUMNAS].to_dict('records'):
+                self._indexar({k: str(v).strip() for k, v in fila.items()})
+        self._version = version
+
+    def buscar_por_nombre(self, nombre):
+        with self._lock:
+            self._asegurar_indice()
+            return self._por_nombre.get(normalizar_nombre(nombre))
+
+    def buscar_por_cedula(self, cedula):
+        with self._lock:
+            self._asegurar_indice()
+            return self._por_cedula.get(str(cedula).strip())
+
+    def esta_registrado(self, nombre):
+        return self.buscar_por_nombre(nombre) is not None
+
+    def registrar(self, nombre, profesion, cedula):
+        """
+        Agrega un profesional al CSV (append de una fila) y al índice.
+        Lanza ValueError si la cédula ya está registrada.
+        """
+        with self._lock:
+            self._asegurar_indice()
+            cedula = str(cedula).strip()
+            if cedula in self._por_cedula:
+                raise ValueError(f"La cédula {cedula} ya está registrada")
+            fila = {
+                "Nombre": nombre,
+                "Profesión": profesion,
+                "Cédula": cedula,
+                "Fecha registro": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+            anexar_fila_csv(self.archivo_path, fila, PROFESIONALES_COLUMNAS)
+            self._indexar(fila)
+            self._version = self._version_archivo()
+            return fila
+
+@st.cache_resource(show_spinner=False)
+def obtener_registro_profesionales(archivo_path):
+    """
+    Instancia única por proceso, compartida por todas las sesiones.
+    """
+    return RegistroProfesionales(archivo_path)
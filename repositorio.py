@@ -0,0 +1,108 @@
+"""
+Interfaz de almacenamiento de la app (profesionales, pacientes y feedback).
+
+El backend se elige con la variable de entorno ALMACENAMIENTO:
+- "csv" (por defecto): archivos en datos_guardados/ (repositorio_csv.py)
+- "sqlite": base local en modo WAL (repositorio_sqlite.py)
+"""
+import os
+import threading
+from almacenamiento import ConflictoVersion  # noqa: F401 (parte de la interfaz)
+
+BACKEND = os.environ.get("ALMACENAMIENTO", "csv").strip().lower()
+
+# Codificación de cada exportación, igual que las descargas históricas del panel restringido
+EXPORTACIONES = {
+    "profesionales": "utf-8",
+    "feedback": "utf-8-sig",
+    "pacientes": "utf-8-sig",
+}
+
+class Repositorio:
+    """
+    Operaciones que usan las secciones. Los backends implementan todos los métodos.
+    Los profesionales se devuelven como dict con las claves de PROFESIONALES_COLUMNAS
+    y los listados como DataFrame con las columnas del CSV equivalente.
+    """
+
+    def buscar_profesional(self, nombre):
+        raise NotImplementedError
+
+    def registrar_profesional(self, nombre, profesion, cedula):
+        """
+        Lanza ValueError si la cédula ya está registrada.
+        """
+        raise NotImplementedError
+
+    def listar_profesionales(self):
+        raise NotImplementedError
+
+    def listar_pacientes(self):
+        raise NotImplementedError
+
+    def guardar_pacientes(self, df):
+        raise NotImplementedError
+
+    def version_pacientes(self):
+        """
+        Sello que cambia con cada escritura de pacientes. Leerlo antes que listar_pacientes().
+        """
+        raise NotImplementedError
+
+    def aplicar_cambios_pacientes(self, version, agregados=(), editados=None, eliminados=()):
+        """
+        Guarda solo las filas agregadas (dicts), editadas ({posición: {columna: valor}}) y
+        eliminadas (posiciones) respecto del listado leído en la versión `version`.
+        Lanza ConflictoVersion si la tabla cambió desde entonces; devuelve la nueva versión.
+        """
+        raise NotImplementedError
+
+    def agregar_feedback(self, datos_feedback):
+        """
+        Valida y guarda una respuesta del cuestionario. Lanza ValueError si es inválida.
+        """
+        raise NotImplementedError
+
+    def listar_feedback(self):
+        raise NotImplementedError
+
+    def existe(self, tabla):
+        return True
+
+    def version_tabla(self, tabla):
+        """
+        Sello que cambia cuando cambian los datos de la tabla (clave del caché de exportaciones).
+        None si el backend no puede darlo: la exportación se regenera en cada descarga.
+        """
+        return None
+
+    def exportar_csv(self, tabla):
+        """
+        Vista CSV de una tabla para el botón de descarga (bytes), o None si todavía no existe.
+        """
+        if not self.existe(tabla):
+            return None
+        df = getattr(self, f"listar_{tabla}")()
+        return df.to_csv(index=False).encode(EXPORTACIONES[tabla])
+
+_repositorio = None
+_lock_repositorio = threading.Lock()
+
+def crear_repositorio(backend=BACKEND):
+    if backend == "sqlite":
+        from repositorio_sqlite import RepositorioSQLite
+        return RepositorioSQLite()
+    if backend == "csv":
+        from repositorio_csv import RepositorioCSV
+        return RepositorioCSV()
+    raise ValueError(f"Backend de almacenamiento desconocido: {backend}")
+
+def obtener_repositorio():
+    """
+    Repositorio único por proceso, compartido por todas las sesiones.
+    """
+    global _repositorio
+    with _lock_repositorio:
+        if _repositorio is None:
+            _repositorio = crear_repositorio()
+        return _repositorio
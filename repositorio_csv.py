@@ -0,0 +1,59 @@
+import os
+from almacenamiento import (
+    DATA_FILE_PROF, PACIENTES_FILE, FEEDBACK_FILE,
+    PROFESIONALES_COLUMNAS, PACIENTES_COLUMNAS,
+    leer_csv_seguro, guardar_csv, guardar_feedback_seguro, registrar_estadisticas,
+    aplicar_cambios_csv, version_archivo
+)
+from registro_profesionales import obtener_registro_profesionales
+from repositorio import Repositorio
+
+ARCHIVOS = {
+    "profesionales": DATA_FILE_PROF,
+    "pacientes": PACIENTES_FILE,
+    "feedback": FEEDBACK_FILE,
+}
+
+class RepositorioCSV(Repositorio):
+    """
+    Backend histórico: un CSV por tabla en datos_guardados/.
+    """
+
+    def _registro(self):
+        return obtener_registro_profesionales(DATA_FILE_PROF)
+
+    def buscar_profesional(self, nombre):
+        return self._registro().buscar_por_nombre(nombre)
+
+    def registrar_profesional(self, nombre, profesion, cedula):
+        return self._registro().registrar(nombre, profesion, cedula)
+
+    def listar_profesionales(self):
+        return leer_csv_seguro(DATA_FILE_PROF, PROFESIONALES_COLUMNAS)
+
+    def listar_pacientes(self):
+        df = leer_csv_seguro(PACIENTES_FILE, PACIENTES_COLUMNAS)
+        return df[PACIENTES_COLUMNAS]
+
+    def guardar_pacientes(self, df):
+        guardar_csv(df, PACIENTES_FILE)
+
+    def version_pacientes(self):
+        return version_archivo(PACIENTES_FILE)
+
+    def aplicar_cambios_pacientes(self, version, agregados=(), editados=None, eliminados=()):
+        return aplicar_cambios_csv(PACIENTES_FILE, PACIENTES_COLUMNAS, version, agregados, editados, eliminados)
+
+    def agregar_feedback(self, datos_feedback):
+        guardar_feedback_seguro(datos_feedback, FEEDBACK_FILE)
+        registrar_estadisticas(datos_feedback, self.listar_feedback)
+        return True
+
+    def listar_feedback(self):
+        return leer_csv_seguro(FEEDBACK_FILE)
+
+    def existe(self, tabla):
+        return os.path.exists(ARCHIVOS[tabla])
+
+    def version_tabla(self, tabla):
+        return version_archivo(ARCHIVOS[tabla])
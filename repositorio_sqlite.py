@@ -0,0 +1,295 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+import pandas as pd
+from almacenamiento import (
+    FEEDBACK_COLUMNAS, PROFESIONALES_COLUMNAS, PACIENTES_COLUMNAS,
+    ConflictoVersion, registrar_estadisticas, normalizar_nombre, preparar_feedback
+)
+from repositorio import Repositorio
+
+RUTA_SQLITE = os.environ.get(
+    "SQLITE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "datos_guardados", "psicomotriz.db")
+)
+
+# Columna del CSV -> columna de la tabla
+COLUMNAS_PROFESIONALES = dict(zip(PROFESIONALES_COLUMNAS, ["nombre", "profesion", "cedula", "fecha_registro"]))
+COLUMNAS_PACIENTES = dict(zip(PACIENTES_COLUMNAS, ["nombre", "escolaridad", "fecha", "hora"]))
+FEEDBACK_NUMERICOS = {"utilidad", "eficiencia", "intencion_uso", "satisfaccion_claridad", "satisfaccion_diseño"}
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS profesionales (
+    id INTEGER PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    nombre_normalizado TEXT NOT NULL,
+    profesion TEXT NOT NULL DEFAULT '',
+    cedula TEXT NOT NULL UNIQUE,
+    fecha_registro TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_profesionales_nombre ON profesionales(nombre_normalizado);
+
+CREATE TABLE IF NOT EXISTS pacientes (
+    id INTEGER PRIMARY KEY,
+    nombre TEXT NOT NULL DEFAULT '',
+    escolaridad TEXT NOT NULL DEFAULT '',
+    fecha TEXT NOT NULL DEFAULT '',
+    hora TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_pacientes_nombre ON pacientes(nombre);
+
+-- Sello de versión por tabla, incrementado en cada escritura (detección de conflictos)
+CREATE TABLE IF NOT EXISTS versiones (
+    tabla TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS feedback (
+    id INTEGER PRIMARY KEY,
+    {columnas_feedback}
+);
+CREATE INDEX IF NOT EXISTS idx_feedback_fecha ON feedback(fecha_envio);
+CREATE INDEX IF NOT EXISTS idx_feedback_cedula ON feedback(cedula_profesional);
+
+CREATE TABLE IF NOT EXISTS evaluaciones (
+    id INTEGER PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    datos TEXT NOT NULL,
+    fecha_registro TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_evaluaciones_nombre ON evaluaciones(nombre);
+CREATE INDEX IF NOT EXISTS idx_evaluaciones_fecha ON evaluaciones(fecha_registro);
+""".format(columnas_feedback=",\n    ".join(
+    f'"{col}" {"NUMERIC" if col in FEEDBACK_NUMERICOS else "TEXT"}' for col in FEEDBACK_COLUMNAS
+))
+
+def _texto(valor):
+    if valor is None or (isinstance(valor, float) and pd.isna(valor)):
+        return ""
+    return str(valor)
+
+def _ahora():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+class RepositorioSQLite(Repositorio):
+    """
+    Backend SQLite en modo WAL: lectores concurrentes con un único escritor,
+    búsquedas indexadas e inserciones O(1) en lugar de reescribir archivos completos.
+    Cada hilo usa su propia conexión (sqlite3 no comparte conexiones entre hilos), y
+    también cada proceso: un worker creado con fork no reutiliza las conexiones del padre.
+    """
+
+    def __init__(self, ruta=RUTA_SQLITE):
+        self.ruta = ruta
+        self._local = threading.local()
+        carpeta = os.path.dirname(os.path.abspath(ruta))
+        if not os.path.exists(carpeta):
+            os.makedirs(carpeta)
+        self._conexion().executescript(ESQUEMA)
+
+    def _conexion(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.ruta, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=FULL")
+            # lower() de SQLite solo convierte ASCII; los nombres llevan acentos y ñ
+            conn.create_function("minusculas", 1, lambda s: s.lower() if s else "", deterministic=True)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    # ----------------------------
+    # Profesionales
+    # ----------------------------
+    def buscar_profesional(self, nombre):
+        fila = self._conexion().execute(
+            "SELECT nombre, profesion, cedula, fecha_registro FROM profesionales "
+            "WHERE nombre_normalizado = ? ORDER BY id LIMIT 1",
+            (normalizar_nombre(nombre),)
+        ).fetchone()
+        return dict(zip(PROFESIONALES_COLUMNAS, fila)) if fila else None
+
+    def registrar_profesional(self, nombre, profesion, cedula):
+        fila = {
+            "Nombre": nombre,
+            "Profesión": profesion,
+            "Cédula": str(cedula).strip(),
+            "Fecha registro": _ahora()
+        }
+        try:
+            with self._conexion() as conn:
+                conn.execute(
+                    "INSERT INTO profesionales (nombre, nombre_normalizado, profesion, cedula, fecha_registro) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (nombre, normalizar_nombre(nombre), profesion, fila["Cédula"], fila["Fecha registro"])
+                )
+        except sqlite3.IntegrityError:
+            raise ValueError(f"La cédula {fila['Cédula']} ya está registrada")
+        return fila
+
+    def importar_profesionales(self, filas):
+        """
+        Alta masiva (migración). Las cédulas repetidas se ignoran: se conserva la primera.
+        """
+        with self._conexion() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO profesionales (nombre, nombre_normalizado, profesion, cedula, fecha_registro) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(_texto(f.get("Nombre")), normalizar_nombre(_texto(f.get("Nombre"))), _texto(f.get("Profesión")),
+                  _texto(f.get("Cédula")).strip(), _texto(f.get("Fecha registro"))) for f in filas]
+            )
+
+    def listar_profesionales(self):
+        select = ", ".join(f'{sql} AS "{csv}"' for csv, sql in COLUMNAS_PROFESIONALES.items())
+        return pd.read_sql_query(f"SELECT {select} FROM profesionales ORDER BY id", self._conexion())
+
+    # ----------------------------
+    # Pacientes
+    # ----------------------------
+    def listar_pacientes(self):
+        select = ", ".join(f'{sql} AS "{csv}"' for csv, sql in COLUMNAS_PACIENTES.items())
+        return pd.read_sql_query(f"SELECT {select} FROM pacientes ORDER BY id", self._conexion())
+
+    def guardar_pacientes(self, df):
+        filas = [
+            tuple(_texto(fila.get(col)) for col in PACIENTES_COLUMNAS)
+            for fila in df.to_dict('records')
+        ]
+        with self._conexion() as conn:
+            conn.execute("DELETE FROM pacientes")
+            conn.executemany(
+                "INSERT INTO pacientes (nombre, escolaridad, fecha, hora) VALUES (?, ?, ?, ?)", filas
+            )
+            self._incrementar_version(conn, "pacientes")
+
+    def _incrementar_version(self, conn, tabla):
+        conn.execute(
+            "INSERT INTO versiones (tabla, version) VALUES (?, 1) "
+            "ON CONFLICT(tabla) DO UPDATE SET version = version + 1",
+            (tabla,)
+        )
+
+    def _version(self, conn, tabla):
+        fila = conn.execute("SELECT version FROM versiones WHERE tabla = ?", (tabla,)).fetchone()
+        return fila[0] if fila else 0
+
+    def version_pacientes(self):
+        return self._version(self._conexion(), "pacientes")
+
+    def version_tabla(self, tabla):
+        conn = self._conexion()
+        if tabla == "pacientes":
+            return self._version(conn, "pacientes")
+        # Profesionales y feedback solo crecen: alcanza con cantidad y último id
+        return tuple(conn.execute(f"SELECT COUNT(*), MAX(id) FROM {tabla}").fetchone())
+
+    def aplicar_cambios_pacientes(self, version, agregados=(), editados=None, eliminados=()):
+        """
+        UPDATE/DELETE/INSERT solo de las filas tocadas, en una transacción que toma el
+        lock de escritura antes de comparar la versión (BEGIN IMMEDIATE).
+        """
+        editados = editados or {}
+        conn = self._conexion()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if self._version(conn, "pacientes") != version:
+                raise ConflictoVersion("La tabla de pacientes fue modificada por otro usuario")
+            if not agregados and not editados and not eliminados:
+                conn.rollback()
+                return version
+            # Con la versión sin cambios, la posición en el listado identifica la fila
+            ids = [id_ for (id_,) in conn.execute("SELECT id FROM pacientes ORDER BY id")]
+            for posicion, cambios in editados.items():
+                asignaciones = [(COLUMNAS_PACIENTES[col], _texto(valor)) for col, valor in cambios.items()
+                                if col in COLUMNAS_PACIENTES]
+                if asignaciones:
+                    conn.execute(
+                        f"UPDATE pacientes SET {', '.join(f'{sql} = ?' for sql, _ in asignaciones)} WHERE id = ?",
+                        [valor for _, valor in asignaciones] + [ids[posicion]]
+                    )
+            conn.executemany("DELETE FROM pacientes WHERE id = ?", [(ids[p],) for p in eliminados])
+            conn.executemany(
+                "INSERT INTO pacientes (nombre, escolaridad, fecha, hora) VALUES (?, ?, ?, ?)",
+                [tuple(_texto(fila.get(col)) for col in PACIENTES_COLUMNAS) for fila in agregados]
+            )
+            self._incrementar_version(conn, "pacientes")
+            nueva = self._version(conn, "pacientes")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return nueva
+
+    # ----------------------------
+    # Feedback
+    # ----------------------------
+    def agregar_feedback(self, datos_feedback):
+        preparar_feedback(datos_feedback)
+        self.importar_feedback([datos_feedback])
+        registrar_estadisticas(datos_feedback, self.listar_feedback)
+        return True
+
+    def importar_feedback(self, filas):
+        columnas = ", ".join(f'"{col}"' for col in FEEDBACK_COLUMNAS)
+        marcas = ", ".join("?" for _ in FEEDBACK_COLUMNAS)
+        with self._conexion() as conn:
+            conn.executemany(
+                f"INSERT INTO feedback ({columnas}) VALUES ({marcas})",
+                [tuple(fila.get(col) for col in FEEDBACK_COLUMNAS) for fila in filas]
+            )
+
+    def listar_feedback(self):
+        columnas = ", ".join(f'"{col}"' for col in FEEDBACK_COLUMNAS)
+        return pd.read_sql_query(f"SELECT {columnas} FROM feedback ORDER BY id", self._conexion())
+
+    # ----------------------------
+    # Evaluaciones (server.py)
+    # ----------------------------
+    def agregar_evaluaciones(self, evaluaciones):
+        """
+        Inserta una lista de evaluaciones en una sola transacción. Se guarda el objeto
+        completo en JSON para no perder claves de formatos anteriores.
+        """
+        fecha = _ahora()
+        with self._conexion() as conn:
+            conn.executemany(
+                "INSERT INTO evaluaciones (nombre, datos, fecha_registro) VALUES (?, ?, ?)",
+                [(e["nombre"], json.dumps(e, ensure_ascii=False), fecha) for e in evaluaciones]
+            )
+
+    def agregar_evaluacion(self, evaluacion):
+        self.agregar_evaluaciones([evaluacion])
+
+    def listar_evaluaciones(self):
+        filas = self._conexion().execute("SELECT datos FROM evaluaciones ORDER BY id")
+        return [json.loads(datos) for (datos,) in filas]
+
+    def pagina_evaluaciones(self, despues_de=0, limite=50, nombre=None):
+        """
+        Hasta `limite` pares (id, evaluación) con id > despues_de (paginación por cursor).
+        """
+        sql = "SELECT id, datos FROM evaluaciones WHERE id > ?"
+        parametros = [despues_de]
+        if nombre and nombre.strip():
+            sql += " AND instr(minusculas(nombre), ?) > 0"
+            parametros.append(nombre.strip().lower())
+        sql += " ORDER BY id LIMIT ?"
+        parametros.append(limite)
+        return [(id_, json.loads(datos)) for id_, datos in self._conexion().execute(sql, parametros)]
+
+    def version(self):
+        """
+        (etiqueta, timestamp) de la tabla de evaluaciones. Es append-only, así que el
+        último id identifica la versión; también ve lo que escriben otros procesos.
+        """
+        ultimo_id, ultima_fecha = self._conexion().execute(
+            "SELECT MAX(id), MAX(fecha_registro) FROM evaluaciones"
+        ).fetchone()
+        modificado = datetime.strptime(ultima_fecha, "%Y-%m-%d %H:%M:%S").timestamp() if ultima_fecha else None
+        return str(ultimo_id or 0), modificado
+
+    def contar(self, tabla):
+        return self._conexion().execute(f"SELECT COUNT(*) FROM {tabla}").fetchone()[0]
@@ -0,0 +1,48 @@
+"""
+Secciones de la app. Cada módulo expone render() y se importa recién la primera
+vez que se abre esa sección: en cada rerun solo se ejecuta la sección activa.
+"""
+import importlib
+from metricas import medir
+
+SECCIONES = {
+    "Introducción": "introduccion",
+    "Registro de datos del profesional": "registro_profesional",
+    "Datos del paciente": "datos_paciente",
+    "Antecedentes": "antecedentes",
+    "Entrevista inicial": "entrevista_inicial",
+    "Insumos": "insumos",
+    "Tests psicomotrices": "tests_psicomotrices",
+    "Seguimiento del proceso": "seguimiento",
+    "Guardar Evaluación Completa": "evaluacion_completa",
+    "Lista de pacientes registrados": "lista_pacientes",
+    "Cuestionario de validación": "cuestionario_validacion",
+    "Acceso restringido": "acceso_restringido",
+    "Análisis del cuestionario": "analisis_feedback",
+    "Diagnóstico de rendimiento": "diagnostico",
+}
+
+# Claves de widgets cuyo contenido debe sobrevivir al cambiar de sección
+# (Streamlit descarta el estado de los widgets que no se dibujan en un rerun).
+# Botones, file_uploader y data_editor no admiten asignación y quedan afuera.
+PREFIJOS_PERSISTENTES = (
+    "prof_", "antec_", "peri_", "amamantamiento", "neuro_", "ritmo_", "escolaridad_",
+    "social_", "limites_", "tests_", "seguimiento_", "guardar_comentario", "feedback_",
+    "paciente_actual",
+)
+
+def conservar_estado_widgets(session_state):
+    """
+    Copia el valor de los widgets al estado de sesión para que no se pierda al navegar.
+    """
+    for clave in list(session_state.keys()):
+        if isinstance(clave, str) and clave.startswith(PREFIJOS_PERSISTENTES):
+            session_state[clave] = session_state[clave]
+
+def renderizar(nombre):
+    """
+    Importa (solo la primera vez) y dibuja la sección indicada.
+    """
+    modulo = importlib.import_module(f"{__name__}.{SECCIONES[nombre]}")
+    with medir("seccion", seccion=SECCIONES[nombre]):
+        modulo.render()
@@ -0,0 +1,102 @@
+import streamlit as st
+from exportaciones import FORMATOS, descarga_diferida, formatos_disponibles
+from repositorio import obtener_repositorio
+
+NOMBRES_FORMATO = {"csv": "CSV", "csv.gz": "CSV comprimido (gzip)", "parquet": "Parquet"}
+
+# ----------------------------
+# Sección: Acceso restringido para descarga de datos
+# ----------------------------
+def render():
+    st.header("🔐 Acceso restringido para descarga de datos")
+    
+    # Inicializar estado de sesión si no existe
+    if 'logged_in' not in st.session_state:
+        st.session_state.logged_in = False
+    if 'show_login' not in st.session_state:
+        st.session_state.show_login = False
+    
+    if not st.session_state.logged_in:
+        if not st.session_state.show_login:
+            st.info("Por favor ingresa tus credenciales para acceder a la descarga.")
+            if st.button("🎯 Iniciar sesión para descargar archivos", key="btn_show_login"):
+                st.session_state.show_login = True
+                st.rerun()
+        else:
+            st.subheader("Login para descarga de datos")
+            
+            # Sistema de login
+            with st.form("login_form"):
+                username = st.text_input("📧 Email", key="login_user")
+                password = st.text_input("🔒 Contraseña", type="password", key="login_pass")
+                login_button = st.form_submit_button("🚀 Iniciar sesión")
+                
+                if login_button:
+                    # Obtener credenciales desde secrets
+                    try:
+                        admin_username = st.secrets["admin"]["username"]
+                        admin_password = st.secrets["admin"]["password"]
+                    except KeyError:
+                        st.error("❌ Error de configuración del sistema. Contacte al administrador.")
+                        admin_username = admin_password = None
+                    
+                    if admin_username and username == admin_username and password == admin_password:
+                        st.session_state.logged_in = True
+                        st.session_state.show_login = False
+                        st.success("¡Login exitoso! Bienvenido Diego.")
+                        st.rerun()
+                    else:
+                        st.error("❌ Usuario o contraseña incorrectos")
+            
+            if st.button("↩️ Volver atrás"):
+                st.session_state.show_login = False
+                st.rerun()
+    
+    else:
+        # Usuario logueado - mostrar opciones de descarga
+        st.success("✅ ¡Sesión iniciada correctamente! Puedes descargar los archivos.")
+        
+        # Botón para cerrar sesión
+        if st.button("🚪 Cerrar sesión"):
+            st.session_state.logged_in = False
+            st.rerun()
+        
+        st.markdown("---")
+        st.subheader("📥 Descargar archivos CSV")
+        
+        repo = obtener_repositorio()
+
+        # Los archivos se generan recién al hacer clic, una vez por versión de los datos
+        formatos = formatos_disponibles()
+        formato = st.radio(
+            "Formato",
+            formatos,
+            format_func=NOMBRES_FORMATO.get,
+            horizontal=True,
+            key="formato_descarga"
+        )
+        extension, mime = FORMATOS[formato]
+
+        # Descargar profesionales.csv
+        if repo.existe("profesionales"):
+            st.download_button(
+                label="📋 Descargar registro de profesionales",
+                data=descarga_diferida(repo, "profesionales", formato),
+                file_name=f"profesionales{extension}",
+                mime=mime,
+                key="download_prof"
+            )
+        else:
+            st.info("ℹ️ El archivo profesionales.csv no existe o aún no se ha generado.")
+
+        # Descargar archivo canónico de feedback
+        if repo.existe("feedback"):
+            st.download_button(
+                label="📊 Descargar respuestas del cuestionario",
+                data=descarga_diferida(repo, "feedback", formato),
+                file_name=f"feedback_app{extension}",
+                mime=mime,
+                key="download_feedback"
+            )
+        else:
+            st.info("ℹ️ Aún no hay respuestas de cuestionario guardadas.")
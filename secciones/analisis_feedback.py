@@ -0,0 +1,80 @@
+import pandas as pd
+import streamlit as st
+from estadisticas_feedback import obtener_estadisticas
+from repositorio import obtener_repositorio
+
+# Puntajes del cuestionario con escala 0 a 10 (slider); el resto va de 1 a 5
+ESCALA_0_A_10 = ["intencion_uso"]
+
+def _reconstruir(estadisticas):
+    df = obtener_repositorio().listar_feedback()
+    estadisticas.reconstruir(df.to_dict("records"))
+
+def _tabla_numericos(numericos):
+    filas = {
+        campo: {
+            "Respuestas": valores["n"],
+            "Media": valores["media"],
+            "Desvío": valores["desvio"],
+            "Varianza": valores["varianza"],
+            "Mínimo": valores["min"],
+            "Máximo": valores["max"],
+        }
+        for campo, valores in numericos.items()
+    }
+    return pd.DataFrame.from_dict(filas, orient="index")
+
+# ----------------------------
+# Sección: Análisis del cuestionario (restringida)
+# ----------------------------
+def render():
+    st.header("📈 Análisis del cuestionario de validación")
+
+    if not st.session_state.get("logged_in", False):
+        st.info("Iniciá sesión en 'Acceso restringido' para ver el análisis de las respuestas.")
+        return
+
+    estadisticas = obtener_estadisticas()
+    # Primera vez: se arma desde lo ya guardado; después se actualiza con cada respuesta
+    if not estadisticas.existe():
+        _reconstruir(estadisticas)
+    if st.button("🔄 Recalcular desde los datos guardados", key="recalcular_estadisticas"):
+        _reconstruir(estadisticas)
+
+    resumen = estadisticas.resumen()
+    if resumen["total"] == 0:
+        st.info("Aún no hay respuestas de cuestionario guardadas.")
+        return
+
+    st.metric("Respuestas", resumen["total"])
+    st.caption(f"Actualizado: {resumen['actualizado']}")
+
+    numericos = resumen["numericos"]
+    st.subheader("Puntajes (1 a 5)")
+    st.dataframe(_tabla_numericos({
+        campo: valores for campo, valores in numericos.items() if campo not in ESCALA_0_A_10
+    }).round(2), use_container_width=True)
+
+    st.subheader("Intención de uso (0 a 10)")
+    st.dataframe(_tabla_numericos({
+        campo: numericos[campo] for campo in ESCALA_0_A_10
+    }).round(2), use_container_width=True)
+
+    st.subheader("Opciones elegidas")
+    for campo, histograma in resumen["opciones"].items():
+        if histograma:
+            st.markdown(f"**{campo.removesuffix('_opcion')}**")
+            st.bar_chart(pd.Series(histograma, name="Respuestas"))
+
+    st.subheader("Por profesión")
+    por_profesion = pd.DataFrame.from_dict(
+        {
+            profesion: {
+                "Respuestas": grupo["total"],
+                **{campo: valores["media"] for campo, valores in grupo["numericos"].items()},
+            }
+            for profesion, grupo in resumen["por_profesion"].items()
+        },
+        orient="index",
+    ).sort_values("Respuestas", ascending=False)
+    st.dataframe(por_profesion.round(2), use_container_width=True)
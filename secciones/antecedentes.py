@@ -0,0 +1,33 @@
+import streamlit as st
+from secciones.paciente_actual import elegir_paciente, guardar, precargar
+
+CAMPOS = {
+    "datos_relevantes": "antec_datos",
+    "derivado_por": "antec_derivado",
+    "motivo_consulta": "antec_motivo",
+}
+
+# ----------------------------
+# Sección: Antecedentes
+# ----------------------------
+def render():
+    st.header("Antecedentes")
+    paciente = elegir_paciente()
+    if paciente is None:
+        return
+    registro = precargar(paciente, "antecedentes", CAMPOS)
+    if registro:
+        st.caption(f"Última versión guardada: {registro['fecha']}")
+    with st.form("form_antecedentes"):
+        datos_relevantes = st.text_area("Ingrese los datos relevantes", key="antec_datos")
+        derivado_por = st.text_input("Derivado por:", key="antec_derivado")
+        motivo_consulta = st.text_area("Motivo de consulta", key="antec_motivo")
+        submitted_antec = st.form_submit_button("Guardar antecedentes")
+        if submitted_antec:
+            datos = {
+                "datos_relevantes": datos_relevantes,
+                "derivado_por": derivado_por,
+                "motivo_consulta": motivo_consulta,
+            }
+            if guardar(paciente, "antecedentes", datos):
+                st.success("Antecedentes guardados correctamente!")
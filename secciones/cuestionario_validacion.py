@@ -0,0 +1,156 @@
+import streamlit as st
+from datetime import datetime
+import urllib.parse
+import streamlit.components.v1 as components
+from repositorio import obtener_repositorio
+
+# ----------------------------
+# Sección: Cuestionario de validación
+# ----------------------------
+def render():
+    st.header("✅ Cuestionario de validación de la app")
+    
+    # Primero pedir el nombre del profesional (obligatorio)
+    nombre_profesional = st.text_input("Nombre y apellido del profesional*", key="feedback_nombre")
+    
+    utilidad_map = {"Mucho": 5, "Algo": 3, "Nada": 1}
+    eficiencia_map = {"Sí": 5, "Parcialmente": 3, "No": 1}
+    satisfaccion_map = {"Sí": 5, "Parcialmente": 3, "No": 1}
+    diseño_map = {"Muy bueno": 5, "Bueno": 4, "Regular": 3, "Malo": 2, "Muy malo": 1}
+
+    utilidad_resp = st.radio(
+        "¿Este formulario digital le facilitaría su trabajo comparado con el método actual?",
+        ["Mucho", "Algo", "Nada"], key="feedback_utilidad"
+    )
+    eficiencia_resp = st.radio(
+        "¿Cree que este formulario ayuda a que sus procesos sean más eficientes?",
+        ["Sí", "Parcialmente", "No"], key="feedback_eficiencia"
+    )
+    # Valor inicial vía session_state: el slider conserva su estado al navegar entre secciones
+    st.session_state.setdefault("feedback_intencion", 7)
+    intencion_uso = st.slider(
+        "En una escala del 0 al 10, ¿qué probabilidad tiene de usar esta app regularmente?",
+        0, 10, key="feedback_intencion"
+    )
+    satisfaccion_claridad = st.radio(
+        "¿Considera que el formulario es claro y fácil de completar?",
+        ["Sí", "Parcialmente", "No"], key="feedback_satisfaccion_claridad"
+    )
+    satisfaccion_diseño = st.radio(
+        "Cómo evalúa el diseño visual de la app?",
+        ["Muy bueno", "Bueno", "Regular", "Malo", "Muy malo"], key="feedback_satisfaccion_diseño"
+    )
+    modificar_secciones = st.text_area(
+        "¿Qué secciones modificaría o agregaría?",
+        key="feedback_modificar"
+    )
+    comentarios = st.text_area(
+        "Comentarios adicionales",
+        key="feedback_comentarios"
+    )
+    
+    # Botón para enviar el feedback
+    if st.button("Enviar feedback", key="btn_enviar_feedback"):
+        # Validación de campos obligatorios
+        errores = []
+        if not nombre_profesional.strip():
+            errores.append("Por favor ingrese su nombre y apellido (campo obligatorio).")
+        if utilidad_resp == "" or eficiencia_resp == "" or satisfaccion_claridad == "" or satisfaccion_diseño == "" or intencion_uso is None:
+            errores.append("Por favor completá todas las respuestas obligatorias antes de enviar.")
+        # Validar contenido mínimo (menos restrictivo)
+        if comentarios.strip() == "":
+            errores.append("Por favor agregue algún comentario.")
+        if modificar_secciones.strip() == "":
+            errores.append("Por favor complete qué secciones modificaría.")
+        if errores:
+            for err in errores:
+                st.error(err)
+        else:
+            # Verificar si el profesional está registrado (búsqueda indexada)
+            repo = obtener_repositorio()
+            profesional = repo.buscar_profesional(nombre_profesional)
+            if profesional is None:
+                st.error("El nombre ingresado no está registrado como profesional. Por favor regístrese primero en la sección correspondiente.")
+            else:
+                utilidad_val = utilidad_map[utilidad_resp]
+                eficiencia_val = eficiencia_map[eficiencia_resp]
+                satisfaccion_claridad_val = satisfaccion_map[satisfaccion_claridad]
+                satisfaccion_diseño_val = diseño_map[satisfaccion_diseño]
+
+                # Cédula y profesión del registro
+                cedula = profesional["Cédula"]
+                profesion = profesional["Profesión"]
+                # Preparar datos con validación automática
+                datos_feedback = {
+                    "nombre_profesional": nombre_profesional,
+                    "cedula_profesional": cedula,
+                    "profesion_profesional": profesion,
+                    "utilidad": utilidad_val,
+                    "utilidad_opcion": utilidad_resp,
+                    "eficiencia": eficiencia_val,
+                    "eficiencia_opcion": eficiencia_resp,
+                    "intencion_uso": intencion_uso,
+                    "satisfaccion_claridad": satisfaccion_claridad_val,
+                    "satisfaccion_claridad_opcion": satisfaccion_claridad,
+                    "satisfaccion_diseño": satisfaccion_diseño_val,
+                    "satisfaccion_diseño_opcion": satisfaccion_diseño,
+                    "modificar_secciones": modificar_secciones,
+                    "comentarios": comentarios,
+                    "fecha_envio": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                }
+
+                # Guardar con validación automática
+                guardado_ok = False
+                try:
+                    guardado_ok = repo.agregar_feedback(datos_feedback)
+                except Exception as e:
+                    st.error(f"Error guardando feedback: {e}")
+                if guardado_ok:
+                    # Guardado único y estructurado en el repositorio
+                    st.success("✅ ¡Gracias! Tu feedback fue registrado correctamente en el archivo único!")
+                    st.info("🛡️ El archivo CSV canónico mantiene columnas fijas y codificación UTF-8-BOM (compatible con Excel/GitHub).")
+
+                resumen_compacto = (
+                    f"Feedback App\n"
+                    f"Nombre del profesional: {nombre_profesional}\n"
+                    f"Utilidad: {utilidad_resp} ({utilidad_val}/5)\n"
+                    f"Eficiencia: {eficiencia_resp} ({eficiencia_val}/5)\n"
+                    f"Intención de uso: {intencion_uso}/10\n"
+                    f"Satisfacción claridad: {satisfaccion_claridad} ({satisfaccion_claridad_val}/5)\n"
+                    f"Satisfacción diseño: {satisfaccion_diseño} ({satisfaccion_diseño_val}/5)\n"
+                    f"Modificar secciones: {modificar_secciones}\n"
+                    f"Comentarios: {comentarios}"
+                )
+                st.markdown('<h4>Resumen generado:</h4>', unsafe_allow_html=True)
+                st.code(resumen_compacto, language=None)
+
+                # Botón para copiar al portapapeles
+                resumen_js = resumen_compacto.replace("'", "\\'").replace("\n", "\\n")
+                copy_code = f"""
+    <button id='copyBtn' style='background-color:#25D366;color:white;padding:1em 2em;font-size:1.2em;border:none;border-radius:8px;font-weight:bold;cursor:pointer;'>📋 Copiar feedback</button>
+    <script>
+    document.getElementById('copyBtn').onclick = function() {{
+        navigator.clipboard.writeText('{resumen_js}');
+        alert('¡Resumen copiado! Ahora pégalo en WhatsApp.');
+    }}
+    </script>
+    """
+                components.html(copy_code, height=80)
+
+                # SOLO UN BOTÓN DE WHATSAPP (VERDE) - ELIMINAR EL SEGUNDO
+                mensaje_codificado = urllib.parse.quote_plus(resumen_compacto)
+                # Obtener número desde secrets
+                try:
+                    numero = st.secrets["whatsapp"]["numero"]
+                except KeyError:
+                    numero = "59898776605"  # Fallback por compatibilidad
+                js_code = f"""
+    <button id='wappBtn' style='background-color:#25D366;color:white;padding:1em 2em;font-size:1.2em;border:none;border-radius:8px;font-weight:bold;cursor:pointer;margin-top:1em;'>💬 Enviar feedback por WhatsApp</button>
+    <script>
+    document.getElementById('wappBtn').onclick = function() {{
+        var url = 'https://wa.me/{numero}?text={mensaje_codificado}';
+        window.open(url, '_blank');
+    }}
+    </script>
+    """
+                components.html(js_code, height=120)
@@ -0,0 +1,98 @@
+import streamlit as st
+from almacenamiento import PACIENTES_COLUMNAS
+from metricas import medir
+from repositorio import ConflictoVersion, obtener_repositorio
+
+def _cargar_tabla(repo, columnas):
+    """
+    Fija en la sesión la tabla que se edita y la versión con la que se leyó.
+    Las posiciones que devuelve st.data_editor se refieren a esta copia.
+    """
+    version = repo.version_pacientes()
+    df_pacientes = repo.listar_pacientes()
+    # Asegurar que tiene todas las columnas necesarias
+    for col in columnas:
+        if col not in df_pacientes.columns:
+            df_pacientes[col] = ""
+    anterior = st.session_state.get("pacientes_cargados")
+    n = anterior["n"] + 1 if anterior else 0
+    cargado = {
+        "version": version,
+        "df": df_pacientes[columnas],
+        # Clave nueva en cada recarga: el editor arranca sin los cambios de la versión anterior
+        "clave": f"pacientes_editor_{n}",
+        "n": n,
+    }
+    st.session_state["pacientes_cargados"] = cargado
+    return cargado
+
+def _cambios_del_editor(estado, filas_cargadas):
+    """
+    Traduce el estado de st.data_editor a (agregados, editados, eliminados).
+    """
+    eliminados = sorted(p for p in estado.get("deleted_rows", []) if p < filas_cargadas)
+    editados = {
+        int(p): cambios for p, cambios in estado.get("edited_rows", {}).items()
+        if int(p) not in eliminados and cambios
+    }
+    agregados = [
+        fila for fila in estado.get("added_rows", [])
+        if any(valor not in (None, "") for valor in fila.values())
+    ]
+    return agregados, editados, eliminados
+
+# ----------------------------
+# Sección: Datos del paciente
+# ----------------------------
+def render():
+    st.header("Datos del paciente")
+
+    columnas = PACIENTES_COLUMNAS
+
+    repo = obtener_repositorio()
+    cargado = st.session_state.get("pacientes_cargados")
+    version_actual = repo.version_pacientes()
+    if cargado is None:
+        cargado = _cargar_tabla(repo, columnas)
+    else:
+        agregados, editados, eliminados = _cambios_del_editor(
+            st.session_state.get(cargado["clave"], {}), len(cargado["df"])
+        )
+        # Sin ediciones pendientes se muestra siempre la última versión
+        if cargado["version"] != version_actual and not (agregados or editados or eliminados):
+            cargado = _cargar_tabla(repo, columnas)
+
+    mensaje = st.session_state.pop("pacientes_mensaje", None)
+    if mensaje:
+        st.success(mensaje)
+
+    st.subheader("Pacientes registrados (editable)")
+    with medir("editor_pacientes") as tramo:
+        st.data_editor(cargado["df"], num_rows="dynamic", use_container_width=True, key=cargado["clave"])
+        tramo.anotar(filas=len(cargado["df"]))
+
+    if cargado["version"] != version_actual:
+        st.warning("Otro usuario modificó la tabla de pacientes después de que la abriste.")
+        if st.button("Descartar mis cambios y recargar", key="recargar_pacientes"):
+            _cargar_tabla(repo, columnas)
+            st.rerun()
+
+    if st.button("Guardar cambios en la tabla", key="guardar_pacientes"):
+        agregados, editados, eliminados = _cambios_del_editor(
+            st.session_state.get(cargado["clave"], {}), len(cargado["df"])
+        )
+        if not (agregados or editados or eliminados):
+            st.info("No hay cambios para guardar.")
+            return
+        try:
+            # Solo se escriben las filas tocadas, y solo si nadie guardó antes
+            repo.aplicar_cambios_pacientes(cargado["version"], agregados, editados, eliminados)
+        except ConflictoVersion:
+            st.error(
+                "No se guardó: otro usuario modificó la tabla mientras la editabas. "
+                "Recargá la tabla y volvé a aplicar tus cambios."
+            )
+            return
+        _cargar_tabla(repo, columnas)
+        st.session_state["pacientes_mensaje"] = "Cambios guardados correctamente."
+        st.rerun()
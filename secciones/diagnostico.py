@@ -0,0 +1,37 @@
+import pandas as pd
+import streamlit as st
+import metricas
+
+# ----------------------------
+# Sección: Diagnóstico de rendimiento (restringida)
+# ----------------------------
+def render():
+    st.header("⏱️ Diagnóstico de rendimiento")
+
+    if not st.session_state.get("logged_in", False):
+        st.info("Iniciá sesión en 'Acceso restringido' para ver los tiempos de la app.")
+        return
+
+    if not metricas.ACTIVAS:
+        st.info("La medición está apagada. Iniciá la app con la variable de entorno METRICAS=1.")
+        return
+
+    filas = metricas.resumen()
+    if not filas:
+        st.info("Todavía no hay tramos medidos en este proceso.")
+        return
+
+    st.caption("Acumulado desde que arrancó este proceso; p50 y p95 estimados por histograma.")
+    df = pd.DataFrame(filas).rename(columns={
+        "tramo": "Tramo", "etiquetas": "Etiquetas", "cantidad": "Llamadas", "media_ms": "Media (ms)",
+        "p50_ms": "p50 (ms)", "p95_ms": "p95 (ms)", "total_s": "Total (s)", "filas": "Filas", "bytes": "Bytes",
+    })
+    st.dataframe(df.round(2), hide_index=True, use_container_width=True)
+
+    st.download_button(
+        label="📄 Descargar métricas (texto Prometheus)",
+        data=metricas.texto_prometheus,
+        file_name="metricas.prom",
+        mime="text/plain",
+        key="download_metricas"
+    )
@@ -0,0 +1,87 @@
+import streamlit as st
+from secciones.paciente_actual import elegir_paciente, guardar, precargar
+
+CAMPOS = {
+    "peso": "peri_peso",
+    "talla": "peri_talla",
+    "apgar": "peri_apgar",
+    "amamantamiento": "amamantamiento",
+    "control_cefalico": "neuro_cefalico",
+    "gateo": "neuro_gateo",
+    "marcha": "neuro_marcha",
+    "esfinteres": "neuro_esfinteres",
+    "lenguaje": "neuro_lenguaje",
+    "praxias": "neuro_praxias",
+    "sueno": "ritmo_sueno",
+    "colecho": "ritmo_colecho",
+    "cohabitacion": "ritmo_cohabitacion",
+    "alimentacion": "ritmo_alimentacion",
+    "primera_escolarizacion": "escolaridad_inicial",
+    "lecto_escritura": "escolaridad_lecto",
+    "amigos": "social_amigos",
+    "actividades": "social_actividades",
+    "tiempo_pantalla": "social_tiempo",
+    "acepta_limites": "limites_acepta",
+    "estrategias_padres": "limites_estrategias",
+    "antecedentes_familiares": "antec_familiares",
+}
+
+# ----------------------------
+# Sección: Entrevista inicial
+# ----------------------------
+def render():
+    st.header("Entrevista inicial")
+    paciente = elegir_paciente()
+    if paciente is None:
+        return
+    registro = precargar(paciente, "entrevista_inicial", CAMPOS)
+    if registro:
+        st.caption(f"Última versión guardada: {registro['fecha']}")
+    with st.form("form_entrevista"):
+        st.subheader("Datos Perinatales")
+        peso = st.text_input("Peso", key="peri_peso")
+        talla = st.text_input("Talla", key="peri_talla")
+        apgar = st.text_input("APGAR", key="peri_apgar")
+
+        st.subheader("Primeros contactos con la madre")
+        amamantamiento = st.text_area("Amamantamiento cómo y hasta cuándo", key="amamantamiento")
+
+        st.subheader("Desarrollo neuropsíquico")
+        control_cefalico = st.text_input("Control cefálico (edad)", key="neuro_cefalico")
+        gateo = st.text_input("Gateo (edad y cómo fue aprendizaje)", key="neuro_gateo")
+        marcha = st.text_input("Marcha independiente (edad)", key="neuro_marcha")
+        esfinteres = st.text_input("Control de esfínteres (edad y aprendizaje)", key="neuro_esfinteres")
+        lenguaje = st.text_area("Lenguaje (primeras palabras / dificultades)", key="neuro_lenguaje")
+        praxias = st.text_area("Adquisición de praxias", key="neuro_praxias")
+
+        st.subheader("Ritmos")
+        sueno = st.text_area("Sueño: cómo se duerme / cómo duerme", key="ritmo_sueno")
+        colecho = st.text_input("Colecho (sí/no)", key="ritmo_colecho")
+        cohabitacion = st.text_input("Cohabitación (sí/no)", key="ritmo_cohabitacion")
+        alimentacion = st.text_area("Alimentación: transición líquida a semi-sólida, hábitos", key="ritmo_alimentacion")
+
+        st.subheader("Escolaridad")
+        primera_escolarizacion = st.text_area("Primera escolarización / adaptación / instituciones / año en curso", key="escolaridad_inicial")
+        lecto_escritura = st.text_area("Aprendizaje de la lecto-escritura / gusto por la escuela / opinión de padres", key="escolaridad_lecto")
+
+        st.subheader("Social y Juegos")
+        amigos = st.text_area("Amigos, cómo se relaciona y juegos", key="social_amigos")
+        actividades = st.text_area("Otras actividades especiales", key="social_actividades")
+        tiempo_pantalla = st.text_input("Horas dedicadas a TV/PC", key="social_tiempo")
+
+        st.subheader("Límites")
+        acepta_limites = st.text_area("Acepta los límites y reacción frente al 'no'", key="limites_acepta")
+        estrategias_padres = st.text_area("Estrategias de los padres para aprendizaje de normas", key="limites_estrategias")
+
+        antecedentes_familiares = st.text_area("Antecedentes familiares relevantes", key="antec_familiares")
+
+        submitted_entrevista = st.form_submit_button("Guardar entrevista")
+        if submitted_entrevista:
+            campos_obligatorios = [peso, talla, apgar, amamantamiento, control_cefalico, gateo, marcha, esfinteres, lenguaje, praxias, sueno, colecho, cohabitacion, alimentacion, primera_escolarizacion, lecto_escritura, amigos, actividades, tiempo_pantalla, acepta_limites, estrategias_padres, antecedentes_familiares]
+            campos_vacios = any([str(c).strip() == '' for c in campos_obligatorios])
+            if campos_vacios:
+                st.error("Por favor completá todos los campos obligatorios antes de guardar la entrevista inicial.")
+            else:
+                datos = {campo: st.session_state[clave] for campo, clave in CAMPOS.items()}
+                if guardar(paciente, "entrevista_inicial", datos):
+                    st.success("Entrevista inicial guardada correctamente!")
@@ -0,0 +1,34 @@
+import streamlit as st
+from historia_clinica import NOMBRES_SECCIONES, obtener_historias
+from secciones.paciente_actual import elegir_paciente, guardar, precargar
+
+SECCIONES_PREVIAS = {s: n for s, n in NOMBRES_SECCIONES.items() if s != "evaluacion_completa"}
+
+# ----------------------------
+# Sección: Guardar evaluación completa
+# ----------------------------
+def render():
+    st.header("Guardar Evaluación Completa")
+    paciente = elegir_paciente()
+    if paciente is None:
+        return
+    precargar(paciente, "evaluacion_completa", {"comentario_final": "guardar_comentario"})
+
+    # Cada sección ya se guardó por separado; acá solo se ve el estado de la historia
+    historia = obtener_historias().cargar_historia(paciente)
+    for seccion, nombre in SECCIONES_PREVIAS.items():
+        if seccion in historia:
+            st.markdown(f"✅ {nombre} (guardado el {historia[seccion]['fecha']})")
+        else:
+            st.markdown(f"⬜ {nombre}: sin guardar")
+
+    with st.form("form_guardar"):
+        comentario_final = st.text_area("Comentarios finales antes de guardar evaluación", key="guardar_comentario")
+        submitted_final = st.form_submit_button("Guardar evaluación")
+        if submitted_final:
+            faltantes = [nombre for seccion, nombre in SECCIONES_PREVIAS.items() if seccion not in historia]
+            datos = {"comentario_final": comentario_final, "secciones_faltantes": faltantes}
+            if guardar(paciente, "evaluacion_completa", datos):
+                st.success("Evaluación completa guardada!")
+                if faltantes:
+                    st.warning(f"Secciones sin guardar: {', '.join(faltantes)}")
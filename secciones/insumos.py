@@ -0,0 +1,74 @@
+import streamlit as st
+from imagenes_insumos import LADO_VISTA, MINIATURA_FALLIDA, guardar_imagen, listar_imagenes, miniatura
+from secciones.paciente_actual import elegir_paciente
+
+COLUMNAS_GALERIA = 4
+
+def _galeria(paciente):
+    imagenes = listar_imagenes(paciente)
+    if not imagenes:
+        st.info("Este paciente todavía no tiene imágenes guardadas.")
+        return
+
+    st.subheader(f"Imágenes de {paciente} ({len(imagenes)})")
+    pendientes = False
+    columnas = st.columns(COLUMNAS_GALERIA)
+    for i, fila in enumerate(imagenes):
+        with columnas[i % COLUMNAS_GALERIA]:
+            ruta = miniatura(fila)
+            if ruta == MINIATURA_FALLIDA:
+                st.caption(f"⚠️ {fila['Archivo']}: no se pudo generar la miniatura (imagen dañada)")
+            elif ruta:
+                st.image(ruta, caption=fila["Archivo"])
+            else:
+                pendientes = True
+                st.caption(f"⏳ {fila['Archivo']}: generando miniatura…")
+    if pendientes and st.button("Actualizar", key="insumos_actualizar"):
+        st.rerun()
+
+    # La vista ampliada también es una versión reducida; el original queda en el almacén
+    elegida = st.selectbox(
+        "Ver imagen ampliada",
+        range(len(imagenes)),
+        format_func=lambda i: f"{imagenes[i]['Archivo']} ({imagenes[i]['Fecha']})",
+        index=None,
+        key="insumos_vista",
+    )
+    if elegida is not None:
+        ruta = miniatura(imagenes[elegida], LADO_VISTA)
+        if ruta == MINIATURA_FALLIDA:
+            st.warning("No se pudo generar la vista ampliada: la imagen guardada está dañada.")
+        elif ruta:
+            st.image(ruta)
+        else:
+            st.caption("⏳ Generando vista ampliada…")
+
+# ----------------------------
+# Sección: Insumos
+# ----------------------------
+def render():
+    st.header("Insumos")
+
+    paciente = elegir_paciente()
+    if paciente is None:
+        return
+
+    # clear_on_submit: el archivo subido no queda retenido en la sesión después de guardarlo
+    with st.form("form_insumos", clear_on_submit=True):
+        imagen = st.file_uploader("Ingresar imagen", type=["jpg","png","jpeg"], key="insumos_img")
+        submitted_insumos = st.form_submit_button("Guardar insumos")
+        if submitted_insumos:
+            if imagen is None:
+                st.warning("Seleccioná una imagen para guardar.")
+            else:
+                try:
+                    _, nueva = guardar_imagen(paciente, imagen)
+                except ValueError as e:
+                    st.error(f"❌ {e}")
+                else:
+                    if nueva:
+                        st.success("Insumos guardada correctamente!")
+                    else:
+                        st.info("Esa imagen ya estaba guardada para este paciente.")
+
+    _galeria(paciente)
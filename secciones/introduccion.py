@@ -0,0 +1,48 @@
+import streamlit as st
+
+# ----------------------------
+# Sección: Introducción
+# ----------------------------
+def render():
+    st.markdown("<h1 style='text-align: center;'>Formulario Psicomotriz - Prototipo Web</h1>", unsafe_allow_html=True)
+
+    st.markdown("""
+**Equipo responsable del proyecto:**  
+- 👩‍⚕️ **Licenciada en Psicomotricidad**  
+- 📊 **Licenciado en Estadística**
+""")
+    
+    st.header("Resumen")
+    st.write("""
+Estimado profesional:
+
+Has recibido este enlace porque tu experiencia es valiosa para nosotros. Te invitamos a conocer un **prototipo de formulario web** pensado para digitalizar los procesos de evaluación y seguimiento de pacientes en la clínica psicomotriz.
+
+Si tu área profesional es distinta, es porque consideramos que **tus aportes serán fundamentales para este proyecto en la posibilidad de ampliarlo hacia otras disciplinas en un futuro**.
+
+**Nuestros objetivos:**
+
+- **Digitalizar y modernizar los formularios de evaluación.**  
+- **Mejorar la eficiencia y precisión** en la recopilación de datos.  
+- **Facilitar el seguimiento del proceso de cada paciente.**
+
+**¿Por qué queremos tu colaboración?**
+
+- **Recopilar información** de los profesionales que participan.  
+- Obtener datos que nos permitan **perfeccionar la herramienta** y potenciar futuras investigaciones.
+""")
+
+    # Espacio para empujar el bloque al final
+    st.markdown("<br><br><br>", unsafe_allow_html=True)
+
+    st.markdown("""
+---
+✅ **Cómo completar este formulario**  
+
+1. En la sección **Registro de datos del profesional** (menú lateral), ingrese sus datos y presione **“Registrar datos del profesional”**.  
+2. Luego de interactuar con el prototipo, llene los campos del **Cuestionario de validación** y haga clic en **“Enviar feedback”**.  
+3. Presione **“Copiar feedback”** para guardar su respuesta.  
+4. Finalmente, haga clic en **“Enviar feedback por WhatsApp”**, lo que lo llevará directamente a mi número de contacto para compartir la información.
+
+**Tu opinión es clave para hacer de este prototipo una herramienta realmente útil.** ¡Gracias por tu tiempo y colaboración!
+""")
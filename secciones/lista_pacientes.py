@@ -0,0 +1,46 @@
+import pandas as pd
+import streamlit as st
+from almacenamiento import PACIENTES_COLUMNAS
+from busqueda_clinica import obtener_indice
+from historia_clinica import NOMBRES_SECCIONES
+from repositorio import obtener_repositorio
+
+def _buscar_en_historias():
+    consulta = st.text_input(
+        "🔎 Buscar en las historias clínicas",
+        placeholder="Ej.: dificultad lecto-escritura, praxias, Bender",
+        key="busqueda_historias"
+    )
+    if not consulta.strip():
+        return
+    resultados = obtener_indice().buscar(consulta)
+    if not resultados:
+        st.info("Ninguna historia clínica contiene esos términos.")
+        return
+    st.dataframe(pd.DataFrame([
+        {
+            "Paciente": r["paciente"],
+            "Puntaje": round(r["puntaje"], 2),
+            "Términos": ", ".join(r["terminos"]),
+            "Secciones": ", ".join(NOMBRES_SECCIONES.get(s, s) for s in r["secciones"]),
+        }
+        for r in resultados
+    ]), hide_index=True, use_container_width=True)
+
+# ----------------------------
+# Sección: Lista de pacientes registrados
+# ----------------------------
+def render():
+    st.header("📋 Lista de pacientes registrados")
+    _buscar_en_historias()
+    repo = obtener_repositorio()
+    if repo.existe("pacientes"):
+        columnas = PACIENTES_COLUMNAS
+        df_pacientes = repo.listar_pacientes()
+        for col in columnas:
+            if col not in df_pacientes.columns:
+                df_pacientes[col] = ""
+        df_pacientes = df_pacientes[columnas]
+        st.dataframe(df_pacientes)
+    else:
+        st.info("No hay pacientes registrados aún.")
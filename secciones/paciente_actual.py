@@ -0,0 +1,42 @@
+import streamlit as st
+from historia_clinica import obtener_historias
+from repositorio import obtener_repositorio
+
+def elegir_paciente():
+    """
+    Selector del paciente con el que se trabaja, compartido por las secciones de la historia
+    clínica (la elección se conserva al cambiar de sección). None si no hay pacientes.
+    """
+    pacientes = [n for n in obtener_repositorio().listar_pacientes()["Nombre"].astype(str).unique() if n.strip()]
+    if not pacientes:
+        st.info("Registrá primero al paciente en 'Datos del paciente'.")
+        return None
+    return st.selectbox("Paciente", pacientes, key="paciente_actual")
+
+def precargar(paciente, seccion, campos, vacios=None):
+    """
+    Cuando se elige otro paciente, carga en los widgets (campos: {campo: clave del widget})
+    lo último guardado de la sección. Devuelve ese registro ({"fecha", "datos"}) o None.
+    Se llama antes de dibujar el formulario.
+    """
+    vacios = vacios or {}
+    registro = obtener_historias().cargar_historia(paciente).get(seccion)
+    marca = f"historia_precargada_{seccion}"
+    if st.session_state.get(marca) != paciente:
+        datos = registro["datos"] if registro else {}
+        for campo, clave in campos.items():
+            st.session_state[clave] = datos.get(campo, vacios.get(campo, ""))
+        st.session_state[marca] = paciente
+    return registro
+
+def guardar(paciente, seccion, datos):
+    """
+    Guarda la sección en la historia del paciente y muestra el resultado.
+    """
+    try:
+        fecha = obtener_historias().guardar_seccion(paciente, seccion, datos)
+    except (ValueError, OSError) as e:
+        st.error(f"❌ No se pudo guardar: {e}")
+        return False
+    st.caption(f"Guardado el {fecha}")
+    return True
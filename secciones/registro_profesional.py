@@ -0,0 +1,63 @@
+import streamlit as st
+import re
+from almacenamiento import validar_y_limpiar_texto
+from repositorio import obtener_repositorio
+
+# ----------------------------
+# Sección: Registro de datos del profesional
+# ----------------------------
+def render():
+    st.header("Registro de datos del profesional")
+    
+    nombre_prof = st.text_input("Nombre completo", key="prof_nombre")
+    profesion_prof = st.text_input("Profesión", key="prof_profesion")
+    cedula_prof = st.text_input("Cédula (solo números, exactamente 8 dígitos)", key="prof_cedula", 
+                               help="Ingrese solo números. Se eliminarán automáticamente letras y símbolos.")
+
+    # Validación en tiempo real de cédula
+    if cedula_prof:
+        # Eliminar todos los caracteres que no sean números
+        cedula_limpia = re.sub(r'[^0-9]', '', cedula_prof)
+        
+        if len(cedula_limpia) > 8:
+            st.warning("⚠️ La cédula uruguaya tiene exactamente 8 dígitos. Se tomarán los primeros 8.")
+            cedula_limpia = cedula_limpia[:8]
+        elif len(cedula_limpia) < 8 and len(cedula_limpia) > 0:
+            st.warning(f"⚠️ Faltan {8 - len(cedula_limpia)} dígitos. La cédula uruguaya tiene exactamente 8 dígitos.")
+        elif len(cedula_limpia) == 8:
+            st.success("✅ Cédula válida")
+            
+        # Mostrar la cédula limpia si hay cambios
+        if cedula_limpia != cedula_prof and cedula_limpia:
+            st.info(f"Cédula corregida: {cedula_limpia}")
+
+    if st.button("Registrar datos profesionales", key="btn_registrar_prof"):
+        # Validación final
+        cedula_final = re.sub(r'[^0-9]', '', cedula_prof) if cedula_prof else ""
+        
+        errores = []
+        if not nombre_prof or not nombre_prof.strip():
+            errores.append("Nombre completo es obligatorio")
+        if not profesion_prof or not profesion_prof.strip():
+            errores.append("Profesión es obligatoria")
+        if not cedula_final:
+            errores.append("Cédula es obligatoria")
+        elif len(cedula_final) != 8:
+            errores.append("La cédula debe tener exactamente 8 dígitos")
+        
+        if errores:
+            st.error("Errores encontrados:\n" + "\n".join(f"• {error}" for error in errores))
+        else:
+            # Limpiar datos antes de guardar
+            nombre_limpio = validar_y_limpiar_texto(nombre_prof, "nombre")
+            profesion_limpia = validar_y_limpiar_texto(profesion_prof, "profesion")
+            
+            try:
+                obtener_repositorio().registrar_profesional(nombre_limpio, profesion_limpia, cedula_final)
+            except ValueError as e:
+                st.error(f"{e}. Si ya te registraste, podés completar directamente el cuestionario.")
+            else:
+                st.success(f"Gracias {nombre_limpio}, tus datos fueron registrados correctamente con cédula: {cedula_final}")
+                # El formulario se limpiará automáticamente en el siguiente rerun
+
+    st.markdown("En la sección siguiente comienza el prototipo de formulario para cada paciente.", unsafe_allow_html=True)
@@ -0,0 +1,39 @@
+import streamlit as st
+from secciones.paciente_actual import elegir_paciente, guardar, precargar
+
+CAMPOS = {
+    "notas_clinicas": "seguimiento_notas",
+    "ideas_vinculares": "seguimiento_ideas",
+    "motor": "seguimiento_motor",
+    "afectivo": "seguimiento_afectivo",
+    "cognitivo": "seguimiento_cognitivo",
+}
+
+# ----------------------------
+# Sección: Seguimiento del proceso
+# ----------------------------
+def render():
+    st.header("Seguimiento del proceso")
+    paciente = elegir_paciente()
+    if paciente is None:
+        return
+    registro = precargar(paciente, "seguimiento", CAMPOS)
+    if registro:
+        st.caption(f"Última versión guardada: {registro['fecha']}")
+    with st.form("form_seguimiento"):
+        notas_clinicas = st.text_area("Notas de relevancia clínica", key="seguimiento_notas")
+        ideas_vinculares = st.text_area("Ideas cualitativas sobre el proceso vincular", key="seguimiento_ideas")
+        motor = st.text_area("Motor", key="seguimiento_motor")
+        afectivo = st.text_area("Afectivo", key="seguimiento_afectivo")
+        relacional = st.text_area("Cognitivo", key="seguimiento_cognitivo")
+        submitted_seguimiento = st.form_submit_button("Guardar seguimiento")
+        if submitted_seguimiento:
+            datos = {
+                "notas_clinicas": notas_clinicas,
+                "ideas_vinculares": ideas_vinculares,
+                "motor": motor,
+                "afectivo": afectivo,
+                "cognitivo": relacional,
+            }
+            if guardar(paciente, "seguimiento", datos):
+                st.success("Seguimiento guardado correctamente!")
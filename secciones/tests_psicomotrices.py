@@ -0,0 +1,35 @@
+import streamlit as st
+from secciones.paciente_actual import elegir_paciente, guardar, precargar
+
+CAMPOS = {"seleccionados": "tests_sel", "resultados": "tests_res"}
+
+# ----------------------------
+# Sección: Tests psicomotrices
+# ----------------------------
+def render():
+    st.header("Tests psicomotrices")
+    tests_disponibles = [
+        "DFH Koppitz",
+        "Reversal Test",
+        "Test de Figura Completa",
+        "Test de Escritura de Ajuriaguerra",
+        "Test de Bender",
+        "Esquema Corporal Vitor da Fonseca",
+        "Batería Piaget-Head",
+        "Test de Dibujo Libre",
+        "Test de Frostig",
+        "Test de Pascual"
+    ]
+    paciente = elegir_paciente()
+    if paciente is None:
+        return
+    registro = precargar(paciente, "tests", CAMPOS, vacios={"seleccionados": []})
+    if registro:
+        st.caption(f"Última versión guardada: {registro['fecha']}")
+    with st.form("form_tests"):
+        seleccionados = st.multiselect("Seleccione los tests realizados", tests_disponibles, key="tests_sel")
+        resultados = st.text_area("Detalle los resultados de los tests", key="tests_res")
+        submitted_tests = st.form_submit_button("Guardar tests")
+        if submitted_tests:
+            if guardar(paciente, "tests", {"seleccionados": seleccionados, "resultados": resultados}):
+                st.success("Tests guardados correctamente!")
@@ -1,31 +1,335 @@
-from flask import Flask, request, jsonify, render_template_string
+"""
+API y páginas web de evaluaciones (app Kivy y formulario web).
+
+Desarrollo: python server.py (servidor de Flask, sin modo debug salvo --debug).
+Producción, con un proceso por núcleo:
+    gunicorn -w 4 -b 0.0.0.0:5000 "server:crear_app()"
+Cada worker crea su propia app con crear_app(); lo que comparten es el almacenamiento
+(evaluaciones.json con bloqueo de archivo, o SQLite), nunca una lista en memoria, así cada
+worker ve lo que guardan los demás.
+"""
+from flask import Blueprint, Flask, Response, current_app, request, jsonify, render_template, stream_with_context
+import argparse
 import json
+import os
+import threading
+import time
 from pathlib import Path
+from bloqueo_archivos import bloqueo_exclusivo
+from diario_evaluaciones import paginar_evaluaciones
+from escritura_agrupada import ColaLlena, EscritorAgrupado
 
-app = Flask(__name__)
+bp = Blueprint("evaluaciones", __name__)
 
 # Ruta al archivo JSON en la misma carpeta que server.py
 DB_PATH = Path(__file__).parent / "evaluaciones.json"
 
 # Función para cargar evaluaciones
-def cargar_evaluaciones():
-    if DB_PATH.exists():
+def cargar_evaluaciones(ruta=DB_PATH):
+    if os.path.exists(ruta):
         try:
-            with open(DB_PATH, "r", encoding="utf-8") as f:
+            with open(ruta, "r", encoding="utf-8") as f:
                 return json.load(f)
         except json.JSONDecodeError:
             return []
     return []
 
-# Inicializamos la lista de evaluaciones
-evaluaciones = cargar_evaluaciones()
+# Backend de almacenamiento:
+# - "json" (por defecto): reescribe evaluaciones.json completo en cada guardado
+# - "diario": evaluaciones.jsonl append-only + compactación en segundo plano a evaluaciones.json
+# - "sqlite": misma base que la app Streamlit (ver migrar_a_sqlite.py)
+ALMACENAMIENTO = os.environ.get("ALMACENAMIENTO", "json").strip().lower()
+if ALMACENAMIENTO == "csv":
+    # "csv" es el nombre del backend por defecto de app.py; aquí equivale a JSON
+    ALMACENAMIENTO = "json"
+
+class AlmacenJSON:
+    """
+    Modo histórico: la lista completa en memoria y evaluaciones.json reescrito en cada lote.
+
+    Seguro con varios procesos: cada lote se escribe con el bloqueo de evaluaciones.json.lock
+    tomado, después de releer el archivo si otro proceso lo cambió. Las lecturas comparan
+    (mtime, tamaño, inodo) del archivo y lo releen solo cuando cambió.
+    """
+
+    def __init__(self, ruta):
+        self.ruta = str(ruta)
+        self.ruta_bloqueo = f"{self.ruta}.lock"
+        self._lock = threading.Lock()
+        self._evaluaciones = []
+        self._firma = None
+        self._modificado = time.time()
+        with self._lock:
+            self._sincronizar()
+
+    def _sincronizar(self):
+        """
+        Relee el archivo si cambió desde la última lectura. Se llama con self._lock tomado.
+        """
+        try:
+            st = os.stat(self.ruta)
+        except FileNotFoundError:
+            return
+        firma = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if firma != self._firma:
+            self._evaluaciones = cargar_evaluaciones(self.ruta)
+            self._firma = firma
+            self._modificado = st.st_mtime
+
+    def agregar_evaluaciones(self, evaluaciones):
+        with self._lock, bloqueo_exclusivo(self.ruta_bloqueo):
+            self._sincronizar()
+            nuevas = self._evaluaciones + list(evaluaciones)
+            tmp = f"{self.ruta}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(nuevas, f, ensure_ascii=False, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.ruta)
+            st = os.stat(self.ruta)
+            self._evaluaciones = nuevas
+            self._firma = (st.st_mtime_ns, st.st_size, st.st_ino)
+            self._modificado = st.st_mtime
+
+    def listar_evaluaciones(self):
+        with self._lock:
+            self._sincronizar()
+            return list(self._evaluaciones)
+
+    def pagina_evaluaciones(self, despues_de=0, limite=50, nombre=None):
+        with self._lock:
+            self._sincronizar()
+            return paginar_evaluaciones(self._evaluaciones, despues_de, limite, nombre)
+
+    def version(self):
+        """
+        (etiqueta, timestamp) que cambia con cada lote guardado, igual en todos los procesos.
+        """
+        with self._lock:
+            self._sincronizar()
+            return f"{len(self._evaluaciones)}-{self._firma[0] if self._firma else 0}", self._modificado
+
+def crear_almacen(almacenamiento=ALMACENAMIENTO):
+    if almacenamiento == "sqlite":
+        from repositorio_sqlite import RepositorioSQLite
+        return RepositorioSQLite()
+    if almacenamiento == "diario":
+        from diario_evaluaciones import DiarioEvaluaciones
+        return DiarioEvaluaciones(DB_PATH, DB_PATH.with_suffix(".jsonl"))
+    return AlmacenJSON(DB_PATH)
+
+class Servicio:
+    """
+    Estado de una app creada por crear_app(): almacén, escritor agrupado, plantillas y
+    páginas de resultados ya renderizadas.
+    """
+
+    def __init__(self, almacen, jinja_env):
+        self.almacen = almacen
+        self.plantilla_formulario = jinja_env.from_string(FORMULARIO_HTML)
+        self.plantilla_resultados = jinja_env.from_string(RESULTADOS_HTML)
+        # (cursor, limite, nombre) -> bytes de la versión actual de los datos
+        self.cache_resultados = {"version": None, "paginas": {}}
+        self.lock_resultados = threading.Lock()
+        self._escritor = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def escritor(self):
+        """
+        Un único hilo escritor por proceso agrupa los guardados concurrentes en una sola
+        escritura durable. Se crea en el proceso que atiende los pedidos: si la app se creó
+        antes de un fork (gunicorn --preload), el hilo del padre no existe en el worker.
+        """
+        with self._lock:
+            if self._pid != os.getpid():
+                self._escritor = EscritorAgrupado(
+                    self.almacen,
+                    ventana=float(os.environ.get("ESCRITURA_VENTANA_MS", "5")) / 1000,
+                    capacidad=int(os.environ.get("ESCRITURA_CAPACIDAD", "1000"))
+                )
+                self._pid = os.getpid()
+            return self._escritor
+
+def servicio():
+    return current_app.extensions["evaluaciones"]
+
+def guardar_evaluacion(evaluacion):
+    """
+    Persiste una evaluación a través del escritor agrupado; vuelve cuando su lote quedó guardado.
+    """
+    servicio().escritor.agregar_evaluacion(evaluacion)
+
+def listar_evaluaciones():
+    return servicio().almacen.listar_evaluaciones()
+
+# -----------------------
+# Paginación por cursor
+# -----------------------
+TAMANO_PAGINA = 50
+MAX_PAGINA = 500
+
+def parametros_pagina():
+    """
+    (cursor, limite, nombre) de la query string. El cursor es el id de la última
+    evaluación de la página anterior (0 = desde el principio).
+    """
+    try:
+        cursor = max(int(request.args.get("cursor", 0)), 0)
+    except ValueError:
+        cursor = 0
+    try:
+        limite = min(max(int(request.args.get("limite", TAMANO_PAGINA)), 1), MAX_PAGINA)
+    except ValueError:
+        limite = TAMANO_PAGINA
+    return cursor, limite, request.args.get("nombre", "").strip()
+
+def pagina_evaluaciones(cursor, limite, nombre=""):
+    """
+    Una página de pares (id, evaluación) y el cursor de la siguiente (None si es la última).
+    Se pide un elemento de más para saber si hay otra página.
+    """
+    filas = servicio().almacen.pagina_evaluaciones(cursor, limite + 1, nombre or None)
+    siguiente = filas[limite - 1][0] if len(filas) > limite else None
+    return filas[:limite], siguiente
+
+def iterar_evaluaciones(nombre="", bloque=500):
+    """
+    Recorre todas las evaluaciones de a bloques, sin cargar el historial completo.
+    """
+    almacen = servicio().almacen
+    cursor = 0
+    while True:
+        filas = almacen.pagina_evaluaciones(cursor, bloque, nombre or None)
+        yield from filas
+        if len(filas) < bloque:
+            return
+        cursor = filas[-1][0]
+
+# Páginas de resultados renderizadas por app (Servicio.cache_resultados); se descartan
+# todas cuando cambia la versión de los datos
+MAX_PAGINAS_CACHE = 64
+
+def resultados_renderizados(etiqueta, cursor, limite, nombre):
+    """
+    HTML de una página de /resultados_web; solo se vuelve a renderizar cuando
+    cambian los datos.
+    """
+    estado = servicio()
+    cache = estado.cache_resultados
+    clave = (cursor, limite, nombre)
+    with estado.lock_resultados:
+        if cache["version"] == etiqueta and clave in cache["paginas"]:
+            return cache["paginas"][clave]
+    filas, siguiente = pagina_evaluaciones(cursor, limite, nombre)
+    cuerpo = render_template(
+        estado.plantilla_resultados, filas=filas, siguiente=siguiente, cursor=cursor, limite=limite, nombre=nombre
+    ).encode("utf-8")
+    with estado.lock_resultados:
+        if cache["version"] != etiqueta:
+            cache["version"] = etiqueta
+            cache["paginas"] = {}
+        if len(cache["paginas"]) < MAX_PAGINAS_CACHE:
+            cache["paginas"][clave] = cuerpo
+    return cuerpo
+
+# -----------------------
+# Plantillas (se compilan una sola vez por app, en Servicio)
+# -----------------------
+FORMULARIO_HTML = """
+<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <title>Formulario Evaluación</title>
+    <style>
+        body { font-family: Arial; margin: 40px; background: #f4f4f4; }
+        form { background: white; padding: 20px; max-width: 400px; margin: auto; border-radius: 10px; box-shadow: 0 0 10px #aaa; }
+        label { display: block; margin-top: 10px; }
+        input[type=text], input[type=number] { width: 100%; padding: 8px; margin-top: 5px; }
+        button { margin-top: 15px; padding: 10px; width: 100%; background: #4CAF50; color: white; border: none; border-radius: 5px; }
+        p { text-align: center; color: green; }
+    </style>
+</head>
+<body>
+    <form method="POST">
+        <h2>Formulario de Evaluación</h2>
+        <label>Nombre del paciente:</label>
+        <input type="text" name="nombre" required>
+
+        <label>Coordinación (0-10):</label>
+        <input type="number" name="coordinacion" min="0" max="10" required>
+
+        <label>Equilibrio (0-10):</label>
+        <input type="number" name="equilibrio" min="0" max="10" required>
+
+        <label>Atención (0-10):</label>
+        <input type="number" name="atencion" min="0" max="10" required>
+
+        <button type="submit">Guardar Evaluación</button>
+        {% if mensaje %}
+        <p>{{ mensaje|safe }}</p>
+        {% endif %}
+    </form>
+</body>
+</html>
+"""
+
+RESULTADOS_HTML = """
+<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <title>Resultados Evaluaciones</title>
+    <style>
+        table { border-collapse: collapse; width: 70%; margin: 20px auto; }
+        th, td { border: 1px solid #333; padding: 8px; text-align: center; }
+        th { background-color: #f2f2f2; }
+        h2 { text-align: center; }
+        form, .paginas { text-align: center; margin: 10px; }
+        .paginas a { margin: 0 10px; }
+    </style>
+</head>
+<body>
+    <h2>Resultados de Evaluaciones Psicomotrices</h2>
+    <form method="GET">
+        <input type="text" name="nombre" value="{{ nombre }}" placeholder="Filtrar por paciente">
+        <input type="hidden" name="limite" value="{{ limite }}">
+        <button type="submit">Buscar</button>
+    </form>
+    <table>
+        <tr>
+            <th>#</th>
+            <th>Paciente</th>
+            <th>Coordinación</th>
+            <th>Equilibrio</th>
+            <th>Atención</th>
+        </tr>
+        {% for id, eval in filas %}
+        <tr>
+            <td>{{ id }}</td>
+            <td>{{ eval.get('nombre', 'Sin nombre') }}</td>
+            <td>{{ eval.get('puntajes', {}).get('coordinacion', 0) }}</td>
+            <td>{{ eval.get('puntajes', {}).get('equilibrio', 0) }}</td>
+            <td>{{ eval.get('puntajes', {}).get('atencion', 0) }}</td>
+        </tr>
+        {% endfor %}
+    </table>
+    <div class="paginas">
+        {% if cursor %}<a href="?limite={{ limite }}&nombre={{ nombre|urlencode }}">« Primera página</a>{% endif %}
+        {% if siguiente %}<a href="?cursor={{ siguiente }}&limite={{ limite }}&nombre={{ nombre|urlencode }}">Siguiente »</a>{% endif %}
+    </div>
+    <p style="text-align:center;"><a href="/">← Volver al formulario</a></p>
+</body>
+</html>
+"""
 
 # -----------------------
 # Formulario web
 # -----------------------
-@app.route('/', methods=['GET', 'POST'])
+@bp.route('/', methods=['GET', 'POST'])
 def formulario():
-    global evaluaciones
     mensaje = ""
     if request.method == 'POST':
         nombre = request.form.get("nombre", "").strip()
@@ -43,125 +347,212 @@ def formulario():
             atencion = 0
 
         if nombre:
-            evaluaciones.append({
-                "nombre": nombre,
-                "puntajes": {
-                    "coordinacion": coordinacion,
-                    "equilibrio": equilibrio,
-                    "atencion": atencion
-                }
-            })
-            # Guardar en JSON
-            with open(DB_PATH, "w", encoding="utf-8") as f:
-                json.dump(evaluaciones, f, ensure_ascii=False, indent=4)
-            mensaje = "✅ Guardado correctamente. <a href='/resultados_web'>Ver resultados</a>"
+            try:
+                guardar_evaluacion({
+                    "nombre": nombre,
+                    "puntajes": {
+                        "coordinacion": coordinacion,
+                        "equilibrio": equilibrio,
+                        "atencion": atencion
+                    }
+                })
+                mensaje = "✅ Guardado correctamente. <a href='/resultados_web'>Ver resultados</a>"
+            except Exception:
+                mensaje = "⚠️ No se pudo guardar la evaluación, intente nuevamente"
         else:
             mensaje = "⚠️ Debes ingresar un nombre"
 
-    html = """
-    <!DOCTYPE html>
-    <html lang="es">
-    <head>
-        <meta charset="UTF-8">
-        <title>Formulario Evaluación</title>
-        <style>
-            body { font-family: Arial; margin: 40px; background: #f4f4f4; }
-            form { background: white; padding: 20px; max-width: 400px; margin: auto; border-radius: 10px; box-shadow: 0 0 10px #aaa; }
-            label { display: block; margin-top: 10px; }
-            input[type=text], input[type=number] { width: 100%; padding: 8px; margin-top: 5px; }
-            button { margin-top: 15px; padding: 10px; width: 100%; background: #4CAF50; color: white; border: none; border-radius: 5px; }
-            p { text-align: center; color: green; }
-        </style>
-    </head>
-    <body>
-        <form method="POST">
-            <h2>Formulario de Evaluación</h2>
-            <label>Nombre del paciente:</label>
-            <input type="text" name="nombre" required>
-            
-            <label>Coordinación (0-10):</label>
-            <input type="number" name="coordinacion" min="0" max="10" required>
-            
-            <label>Equilibrio (0-10):</label>
-            <input type="number" name="equilibrio" min="0" max="10" required>
-            
-            <label>Atención (0-10):</label>
-            <input type="number" name="atencion" min="0" max="10" required>
-            
-            <button type="submit">Guardar Evaluación</button>
-            {% if mensaje %}
-            <p>{{ mensaje|safe }}</p>
-            {% endif %}
-        </form>
-    </body>
-    </html>
-    """
-    return render_template_string(html, mensaje=mensaje)
+    return render_template(servicio().plantilla_formulario, mensaje=mensaje)
 
 # -----------------------
 # Página de resultados
 # -----------------------
-@app.route('/resultados_web', methods=['GET'])
+@bp.route('/resultados_web', methods=['GET'])
 def resultados_web():
-    html = """
-    <!DOCTYPE html>
-    <html lang="es">
-    <head>
-        <meta charset="UTF-8">
-        <title>Resultados Evaluaciones</title>
-        <style>
-            table { border-collapse: collapse; width: 70%; margin: 20px auto; }
-            th, td { border: 1px solid #333; padding: 8px; text-align: center; }
-            th { background-color: #f2f2f2; }
-            h2 { text-align: center; }
-        </style>
-    </head>
-    <body>
-        <h2>Resultados de Evaluaciones Psicomotrices</h2>
-        <table>
-            <tr>
-                <th>#</th>
-                <th>Paciente</th>
-                <th>Coordinación</th>
-                <th>Equilibrio</th>
-                <th>Atención</th>
-            </tr>
-            {% for eval in evaluaciones %}
-            <tr>
-                <td>{{ loop.index }}</td>
-                <td>{{ eval.get('nombre', 'Sin nombre') }}</td>
-                <td>{{ eval.get('puntajes', {}).get('coordinacion', 0) }}</td>
-                <td>{{ eval.get('puntajes', {}).get('equilibrio', 0) }}</td>
-                <td>{{ eval.get('puntajes', {}).get('atencion', 0) }}</td>
-            </tr>
-            {% endfor %}
-        </table>
-        <p style="text-align:center;"><a href="/">← Volver al formulario</a></p>
-    </body>
-    </html>
-    """
-    return render_template_string(html, evaluaciones=evaluaciones)
+    cursor, limite, nombre = parametros_pagina()
+    etiqueta, modificado = servicio().almacen.version()
+    etag = f"resultados-{etiqueta}"
+    # El navegador ya tiene esta versión: 304 sin leer ni renderizar nada
+    if etag in request.if_none_match:
+        respuesta = Response(status=304)
+    else:
+        respuesta = Response(resultados_renderizados(etiqueta, cursor, limite, nombre), mimetype="text/html")
+    respuesta.set_etag(etag)
+    if modificado:
+        respuesta.last_modified = modificado
+    # Siempre revalidar: la página cambia con cada evaluación nueva
+    respuesta.cache_control.no_cache = True
+    return respuesta.make_conditional(request)
+
+# -----------------------
+# API de consulta
+# -----------------------
+@bp.route('/api/evaluaciones', methods=['GET'])
+def api_evaluaciones():
+    """
+    Una página de evaluaciones: ?cursor=<id>&limite=<n>&nombre=<texto>.
+    """
+    cursor, limite, nombre = parametros_pagina()
+    filas, siguiente = pagina_evaluaciones(cursor, limite, nombre)
+    return jsonify({
+        "evaluaciones": [{**evaluacion, "id": id_} for id_, evaluacion in filas],
+        "siguiente": siguiente
+    })
+
+@bp.route('/api/evaluaciones/exportar', methods=['GET'])
+def api_exportar_evaluaciones():
+    """
+    Exportación completa en NDJSON (una evaluación por línea), generada de a bloques.
+    """
+    nombre = request.args.get("nombre", "").strip()
+
+    def generar():
+        for id_, evaluacion in iterar_evaluaciones(nombre):
+            yield json.dumps({**evaluacion, "id": id_}, ensure_ascii=False) + "\n"
+
+    return Response(
+        stream_with_context(generar()),
+        mimetype="application/x-ndjson",
+        headers={"Content-Disposition": "attachment; filename=evaluaciones.ndjson"}
+    )
 
 # -----------------------
 # Endpoint para app Kivy
 # -----------------------
-@app.route('/api/guardar_datos', methods=['POST'])
-def api_guardar_datos():
-    global evaluaciones
-    data = request.get_json()
+def preparar_evaluacion(data):
+    """
+    Valida una evaluación recibida por la API y completa los puntajes faltantes con 0.
+    Devuelve (evaluación, None) o (None, mensaje de error).
+    """
+    if not isinstance(data, dict):
+        return None, "Formato inválido"
     nombre = data.get("nombre")
     puntajes = data.get("puntajes", {})
     if not nombre:
-        return jsonify({"error":"Falta nombre"}), 400
+        return None, "Falta nombre"
+    if not isinstance(puntajes, dict):
+        return None, "Puntajes inválidos"
     for key in ["coordinacion","equilibrio","atencion"]:
         puntajes.setdefault(key,0)
-    evaluaciones.append({"nombre":nombre,"puntajes":puntajes})
-    with open(DB_PATH,"w",encoding="utf-8") as f:
-        json.dump(evaluaciones,f,ensure_ascii=False,indent=4)
+    return {"nombre":nombre,"puntajes":puntajes}, None
+
+@bp.route('/api/guardar_datos', methods=['POST'])
+def api_guardar_datos():
+    evaluacion, error = preparar_evaluacion(request.get_json())
+    if error:
+        return jsonify({"error":error}), 400
+    try:
+        guardar_evaluacion(evaluacion)
+    except ColaLlena:
+        return jsonify({"error":"Servidor ocupado, reintente"}), 503
+    except TimeoutError:
+        return jsonify({"error":"La escritura no se confirmó a tiempo; no se guardó, reintente"}), 504
+    except Exception as e:
+        return jsonify({"error":f"No se pudo guardar: {e}"}), 500
     return jsonify({"message":"Guardado correctamente"}), 200
 
 # -----------------------
-# Ejecutar servidor
+# Carga masiva (sincronización de fin de día)
+# -----------------------
+MAX_LOTE = int(os.environ.get("MAX_LOTE", "10000"))
+TIPOS_NDJSON = ("application/x-ndjson", "application/jsonl", "application/x-jsonlines")
+
+def leer_items_lote():
+    """
+    Items del cuerpo: un array JSON, o NDJSON (una evaluación por línea) leído
+    línea por línea desde el stream. Las líneas que no son JSON quedan como error.
+    Devuelve None si el cuerpo no es un array ni NDJSON.
+    """
+    if request.mimetype in TIPOS_NDJSON:
+        items = []
+        for linea in request.stream:
+            linea = linea.strip()
+            if not linea:
+                continue
+            try:
+                items.append(json.loads(linea))
+            except ValueError:
+                items.append(ValueError("JSON inválido"))
+        return items
+    data = request.get_json(silent=True)
+    return data if isinstance(data, list) else None
+
+@bp.route('/api/guardar_lote', methods=['POST'])
+def api_guardar_lote():
+    """
+    Guarda muchas evaluaciones con una sola escritura. Responde el resultado de cada
+    item en el mismo orden; los items inválidos no impiden guardar los demás.
+    """
+    items = leer_items_lote()
+    if items is None:
+        return jsonify({"error":"Se espera un array JSON o NDJSON"}), 400
+    if len(items) > MAX_LOTE:
+        return jsonify({"error":f"Máximo {MAX_LOTE} evaluaciones por lote"}), 413
+
+    resultados = []
+    validas = []
+    for indice, item in enumerate(items):
+        if isinstance(item, ValueError):
+            evaluacion, error = None, str(item)
+        else:
+            evaluacion, error = preparar_evaluacion(item)
+        if error:
+            resultados.append({"indice": indice, "ok": False, "error": error})
+        else:
+            resultados.append({"indice": indice, "ok": True})
+            validas.append(evaluacion)
+
+    if validas:
+        try:
+            servicio().escritor.agregar_evaluaciones(validas)
+        except ColaLlena:
+            return jsonify({"error":"Servidor ocupado, reintente"}), 503
+        except TimeoutError:
+            return jsonify({"error":"La escritura no se confirmó a tiempo; no se guardó, reintente"}), 504
+        except Exception as e:
+            return jsonify({"error":f"No se pudo guardar: {e}"}), 500
+    return jsonify({
+        "guardadas": len(validas),
+        "rechazadas": len(items) - len(validas),
+        "resultados": resultados
+    }), 200
+
+# -----------------------
+# Fábrica de la app
+# -----------------------
+def crear_app(almacenamiento=None):
+    """
+    Crea la app con su propio almacén (ALMACENAMIENTO si no se indica otro).
+    Producción: gunicorn -w 4 "server:crear_app()" (una app por worker).
+    """
+    app = Flask(__name__)
+    app.extensions["evaluaciones"] = Servicio(crear_almacen(almacenamiento or ALMACENAMIENTO), app.jinja_env)
+    app.register_blueprint(bp)
+    return app
+
+_app = None
+_lock_app = threading.Lock()
+
+def __getattr__(nombre):
+    """
+    `server.app` (flask --app server, scripts y benchmarks) se crea recién la primera vez que
+    se usa: importar el módulo para llamar a crear_app() no abre también el almacén por defecto.
+    """
+    global _app
+    if nombre != "app":
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    with _lock_app:
+        if _app is None:
+            _app = crear_app()
+        return _app
+
+# -----------------------
+# Ejecutar servidor (desarrollo)
 # -----------------------
 if __name__ == '__main__':
-    app.run(debug=True)
+    parser = argparse.ArgumentParser(description="Servidor de desarrollo de Flask (un proceso).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=5000)
+    parser.add_argument("--debug", action="store_true", help="Recarga automática y depurador (nunca en producción)")
+    args = parser.parse_args()
+    crear_app().run(host=args.host, port=args.puerto, debug=args.debug)